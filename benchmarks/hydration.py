@@ -0,0 +1,138 @@
+"""
+Measure the per-row cost of building a list page from ORM objects versus plain rows.
+
+Seeds incidents inside a transaction that is rolled back at the end, then times
+each variant end to end (query, row handling, JSON encoding) and records the peak
+memory allocated per row with ``tracemalloc``.
+
+Variants:
+    orm_model_validate     select(Incident) + IncidentData.model_validate(obj)
+    rows_model_validate    select(columns)  + IncidentData.model_validate(row)
+    rows_model_construct   select(columns)  + IncidentData.model_construct(**row)
+    rows_fast_json         select(columns)  + rows encoded without DTOs
+
+Usage:
+    python -m benchmarks.hydration --rows 5000 --repeat 10
+"""
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, Dict
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.api.v1.incidents.scheams import IncidentData, ListIncidentsResponse
+from src.api.v1.incidents.serialization import dump_incident_page
+from src.core.config.settings import settings
+from src.database.models import Incident
+from src.database.models.enums import IncidentSource, IncidentStatus
+from src.database.repositories.incident_repo import INCIDENT_COLUMNS
+
+
+Variant = Callable[[AsyncSession, int], Awaitable[bytes]]
+
+
+def _page_stmt(columns: Any, limit: int) -> Any:
+    return (
+        select(*columns)
+        .order_by(Incident.created_at.desc(), Incident.id.desc())
+        .limit(limit)
+    )
+
+
+async def orm_model_validate(session: AsyncSession, limit: int) -> bytes:
+    incidents = (await session.scalars(_page_stmt([Incident], limit))).all()
+    page = ListIncidentsResponse(
+        incidents=[IncidentData.model_validate(incident) for incident in incidents]
+    )
+    session.expunge_all()
+    return page.model_dump_json().encode()
+
+
+async def rows_model_validate(session: AsyncSession, limit: int) -> bytes:
+    rows = (await session.execute(_page_stmt(INCIDENT_COLUMNS, limit))).all()
+    page = ListIncidentsResponse(
+        incidents=[IncidentData.model_validate(row) for row in rows]
+    )
+    return page.model_dump_json().encode()
+
+
+async def rows_model_construct(session: AsyncSession, limit: int) -> bytes:
+    rows = (await session.execute(_page_stmt(INCIDENT_COLUMNS, limit))).all()
+    page = ListIncidentsResponse.model_construct(
+        incidents=[IncidentData.model_construct(**row._mapping) for row in rows],
+        next_cursor=None,
+    )
+    return page.model_dump_json().encode()
+
+
+async def rows_fast_json(session: AsyncSession, limit: int) -> bytes:
+    rows = (await session.execute(_page_stmt(INCIDENT_COLUMNS, limit))).all()
+    return dump_incident_page(rows, None)
+
+
+VARIANTS: Dict[str, Variant] = {
+    "orm_model_validate": orm_model_validate,
+    "rows_model_validate": rows_model_validate,
+    "rows_model_construct": rows_model_construct,
+    "rows_fast_json": rows_fast_json,
+}
+
+
+async def _measure(session: AsyncSession, variant: Variant, rows: int, repeat: int) -> Dict[str, float]:
+    await variant(session, rows)
+
+    best = float("inf")
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        await variant(session, rows)
+        best = min(best, time.perf_counter() - started_at)
+
+    tracemalloc.start()
+    await variant(session, rows)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "page_ms": round(best * 1000, 3),
+        "us_per_row": round(best / rows * 1_000_000, 3),
+        "peak_bytes_per_row": round(peak / rows),
+    }
+
+
+async def main(rows: int, repeat: int) -> Dict[str, Any]:
+    engine = create_async_engine(settings.db.connection_url())
+    report: Dict[str, Any] = {"rows": rows, "variants": {}}
+
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        session = AsyncSession(bind=connection)
+        await session.execute(insert(Incident), [
+            {
+                "description": f"Incident {index}: connection to upstream timed out",
+                "status": list(IncidentStatus)[index % len(IncidentStatus)],
+                "source": list(IncidentSource)[index % len(IncidentSource)],
+            }
+            for index in range(rows)
+        ])
+
+        for name, variant in VARIANTS.items():
+            report["variants"][name] = await _measure(session, variant, rows, repeat)
+
+        await session.close()
+        await transaction.rollback()
+
+    await engine.dispose()
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(main(args.rows, args.repeat)), indent=2))
@@ -0,0 +1,141 @@
+"""
+Compare list query plans and latency with and without the incidents filter indexes.
+
+Seeds two temporary copies of the ``incidents`` table with the same data, one with
+only the primary key and one with the indexes from migration ``9b7f3c2d1e04``,
+and runs the list queries against both.
+
+Usage:
+    python -m benchmarks.index_plans --rows 1000000 --repeat 20
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Any, Dict, List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from src.core.config.settings import settings
+
+
+INDEXES = (
+    "CREATE INDEX ON {table} (created_at, id)",
+    "CREATE INDEX ON {table} (status, created_at DESC, id DESC)",
+    "CREATE INDEX ON {table} (source, created_at DESC)",
+    "CREATE INDEX ON {table} (created_at DESC, id DESC) WHERE status = 'NEW'",
+    "CREATE INDEX ON {table} (created_at DESC, id DESC) WHERE status = 'IN_PROGRESS'",
+)
+
+QUERIES = {
+    "status=new page": (
+        "SELECT * FROM {table} WHERE status = 'NEW' "
+        "ORDER BY created_at DESC, id DESC LIMIT 50"
+    ),
+    "status=resolved page": (
+        "SELECT * FROM {table} WHERE status = 'RESOLVED' "
+        "ORDER BY created_at DESC, id DESC LIMIT 50"
+    ),
+    "status=resolved deep page": (
+        "SELECT * FROM {table} WHERE status = 'RESOLVED' "
+        "AND (created_at, id) < ((SELECT created_at FROM {table} WHERE id = {middle}), {middle}) "
+        "ORDER BY created_at DESC, id DESC LIMIT 50"
+    ),
+    "source=partner page": (
+        "SELECT * FROM {table} WHERE source = 'PARTNER' "
+        "ORDER BY created_at DESC LIMIT 50"
+    ),
+}
+
+SEED = """
+INSERT INTO {table} (id, description, status, source, created_at)
+SELECT
+    g,
+    'incident ' || g,
+    (CASE
+        WHEN g % 50 = 0 THEN 'NEW'
+        WHEN g % 50 = 1 THEN 'IN_PROGRESS'
+        WHEN g % 2 = 0 THEN 'RESOLVED'
+        ELSE 'CLOSED'
+    END)::incidentstatus,
+    (ARRAY['OPERATOR', 'MONITORING', 'PARTNER'])[1 + g % 3]::incidentsource,
+    now() - ({rows} - g) * interval '1 second'
+FROM generate_series(1, {rows}) AS g
+"""
+
+
+async def _prepare(connection: AsyncConnection, table: str, rows: int, indexed: bool) -> None:
+    """Create and seed a temporary copy of the incidents table."""
+    await connection.execute(text(
+        f"CREATE TEMP TABLE {table} (LIKE incidents INCLUDING DEFAULTS, PRIMARY KEY (id))"
+    ))
+    await connection.execute(text(SEED.format(table=table, rows=rows)))
+    if indexed:
+        for index in INDEXES:
+            await connection.execute(text(index.format(table=table)))
+    await connection.execute(text(f"ANALYZE {table}"))
+
+
+async def _measure(
+    connection: AsyncConnection, query: str, repeat: int
+) -> Dict[str, Any]:
+    """Capture the plan of a query and its median latency."""
+    explain = await connection.execute(
+        text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {query}")
+    )
+    plan = explain.scalar_one()[0]
+
+    timings: List[float] = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        await connection.execute(text(query))
+        timings.append((time.perf_counter() - started_at) * 1000)
+
+    root = plan["Plan"]
+    return {
+        "plan": root["Node Type"],
+        "scan": _leaf_scan(root),
+        "buffers": sum(root.get(f"{kind} {op} Blocks", 0) for kind in ("Shared", "Local") for op in ("Hit", "Read")),
+        "median_ms": round(statistics.median(timings), 3),
+    }
+
+
+def _leaf_scan(node: Dict[str, Any]) -> str:
+    """Describe the first scan node found in a plan tree."""
+    if "Scan" in node["Node Type"]:
+        return f"{node['Node Type']} on {node.get('Index Name', node.get('Relation Name'))}"
+    for child in node.get("Plans", []):
+        return _leaf_scan(child)
+    return node["Node Type"]
+
+
+async def main(rows: int, repeat: int) -> Dict[str, Any]:
+    engine = create_async_engine(settings.db.connection_url())
+    report: Dict[str, Any] = {"rows": rows, "queries": {}}
+
+    async with engine.connect() as connection:
+        for table, indexed in (("bench_plain", False), ("bench_indexed", True)):
+            await _prepare(connection, table, rows, indexed)
+
+        for name, query in QUERIES.items():
+            report["queries"][name] = {
+                table: await _measure(
+                    connection, query.format(table=table, middle=rows // 2), repeat
+                )
+                for table in ("bench_plain", "bench_indexed")
+            }
+        await connection.rollback()
+
+    await engine.dispose()
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(main(args.rows, args.repeat)), indent=2))
@@ -0,0 +1,420 @@
+"""
+Load-test the incidents API and compare the results with a baseline.
+
+Commands:
+    run      Seed ``--rows`` incidents spread over ``--days`` (skipped with
+             ``--no-seed`` to use the incidents already there), then send
+             ``--requests`` requests per scenario from ``--concurrency``
+             concurrent clients to every target. Prints throughput, errors and
+             p50/p95/p99 latency per target and scenario as JSON, and writes
+             it to ``--output`` when given. Seeded and created incidents are
+             deleted at the end unless ``--keep`` is given.
+    compare  Compare a report with a baseline report and exit with status 1
+             when a percentile of a scenario is more than ``--threshold``
+             percent and ``--min-delta-ms`` slower than in the baseline.
+
+Targets:
+    asgi     The application in process, through httpx's ASGI transport, with
+             its lifespan. Client and application share the event loop.
+    uvicorn  A uvicorn server with ``--workers`` workers started on ``--port``
+             in a subprocess, through keep-alive HTTP connections.
+
+Scenarios:
+    create              POST /api/incidents.
+    bulk                POST /api/incidents/bulk with ``--bulk-size`` incidents.
+    list                GET /api/incidents from a random cursor.
+    list_filtered       GET /api/incidents by a random status from a random cursor.
+    get                 GET /api/incidents/{incident_id} of a random incident.
+    status_update       PATCH /api/incidents/status of a random incident.
+    bulk_status_update  PATCH /api/incidents/status/bulk of ``--bulk-size`` random incidents.
+
+Random cursors and incidents keep the read-through cache mostly cold;
+``--cache none`` disables it. The status scenarios modify the incidents they
+pick, including existing ones with ``--no-seed``. The database is the one of
+the settings, e.g. the ``db`` service of docker-compose.yaml.
+
+Requires the ``bench`` dependency group: ``poetry install --with bench``.
+
+Usage:
+    docker compose up -d db && alembic upgrade head
+    python -m benchmarks.load run --rows 100000 --requests 2000 --concurrency 16 --output baseline.json
+    python -m benchmarks.load run --rows 100000 --requests 2000 --concurrency 16 --output current.json
+    python -m benchmarks.load compare baseline.json current.json --threshold 10
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+import httpx
+from sqlalchemy import text
+
+from src.api.v1.incidents.pagination import encode_cursor
+from src.core.config.settings import settings
+from src.database.helper import db_helper
+from src.database.models.enums import IncidentSource, IncidentStatus
+
+
+PERCENTILES = ("p50_ms", "p95_ms", "p99_ms")
+SAMPLED_INCIDENTS = 10_000
+"""Incidents picked at random by the scenarios are drawn from a sample of this size."""
+
+STATUSES = [status.value for status in IncidentStatus]
+SOURCES = [source.value for source in IncidentSource]
+
+
+@dataclass
+class Dataset:
+    """
+    Incidents the scenarios pick from.
+
+    Attributes:
+        incident_ids (List[int]): Sample of existing incident IDs.
+        max_id (int): Highest incident ID.
+        oldest (datetime): Creation time of the oldest incident.
+        newest (datetime): Creation time of the newest incident.
+        bulk_size (int): Items per bulk request.
+    """
+    incident_ids: List[int]
+    max_id: int
+    oldest: datetime
+    newest: datetime
+    bulk_size: int
+
+    def incident_id(self, rng: random.Random) -> int:
+        return rng.choice(self.incident_ids)
+
+    def cursor(self, rng: random.Random) -> str:
+        span = (self.newest - self.oldest).total_seconds()
+        created_at = self.oldest + timedelta(seconds=rng.uniform(0, span))
+        return encode_cursor(created_at, self.max_id + 1)
+
+
+Request = Tuple[str, str, Optional[Any]]
+"""Method, URL and JSON body of a request."""
+
+
+def _incident(rng: random.Random) -> Dict[str, str]:
+    return {
+        "description": f"Load test incident {rng.randrange(1_000_000)}",
+        "status": "new",
+        "source": rng.choice(SOURCES),
+    }
+
+
+SCENARIOS: Dict[str, Callable[[random.Random, Dataset], Request]] = {
+    "create": lambda rng, data: ("POST", "/api/incidents", _incident(rng)),
+    "bulk": lambda rng, data: (
+        "POST", "/api/incidents/bulk", [_incident(rng) for _ in range(data.bulk_size)],
+    ),
+    "list": lambda rng, data: ("GET", f"/api/incidents?cursor={data.cursor(rng)}", None),
+    "list_filtered": lambda rng, data: (
+        "GET", f"/api/incidents?status={rng.choice(STATUSES)}&cursor={data.cursor(rng)}", None,
+    ),
+    "get": lambda rng, data: ("GET", f"/api/incidents/{data.incident_id(rng)}", None),
+    "status_update": lambda rng, data: (
+        "PATCH", "/api/incidents/status",
+        {"incident_id": data.incident_id(rng), "status": rng.choice(STATUSES)},
+    ),
+    "bulk_status_update": lambda rng, data: (
+        "PATCH", "/api/incidents/status/bulk",
+        {
+            "incident_ids": rng.sample(data.incident_ids, min(data.bulk_size, len(data.incident_ids))),
+            "status": rng.choice(STATUSES),
+        },
+    ),
+}
+
+
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "p50_ms": round(cuts[49] * 1000, 3),
+        "p95_ms": round(cuts[94] * 1000, 3),
+        "p99_ms": round(cuts[98] * 1000, 3),
+    }
+
+
+async def _seed(rows: int, days: float) -> Tuple[int, int]:
+    """Insert ``rows`` incidents server-side, spread over ``days``, and return their ID range."""
+    stmt = text("""
+        WITH inserted AS (
+            INSERT INTO incidents (description, status, source, created_at)
+            SELECT
+                'Load test incident ' || i,
+                (ARRAY['NEW', 'IN_PROGRESS', 'RESOLVED', 'CLOSED'])[1 + i % 4]::incidentstatus,
+                (ARRAY['OPERATOR', 'MONITORING', 'PARTNER'])[1 + (i / 4) % 3]::incidentsource,
+                now() - make_interval(secs => i * CAST(:spacing AS float8))
+            FROM generate_series(1, :rows) AS i
+            RETURNING id
+        )
+        SELECT min(id), max(id) FROM inserted
+    """)
+    async with db_helper.session_factory() as session:
+        result = await session.execute(stmt, {"rows": rows, "spacing": days * 86400 / rows})
+        first_id, last_id = result.one()
+        await session.commit()
+
+    async with db_helper.async_engine.connect() as connection:
+        await connection.execute(text("ANALYZE incidents"))
+    return first_id, last_id
+
+
+async def _dataset(bulk_size: int) -> Dataset:
+    async with db_helper.session_factory() as session:
+        oldest, newest, max_id = (await session.execute(
+            text("SELECT min(created_at), max(created_at), max(id) FROM incidents")
+        )).one()
+        incident_ids = (await session.execute(
+            text("SELECT id FROM incidents ORDER BY random() LIMIT :limit"),
+            {"limit": SAMPLED_INCIDENTS},
+        )).scalars().all()
+    if not incident_ids:
+        raise SystemExit("There are no incidents to run the scenarios on, seed some first")
+    return Dataset(
+        incident_ids=list(incident_ids), max_id=max_id, oldest=oldest, newest=newest, bulk_size=bulk_size
+    )
+
+
+async def _drive(
+    client: httpx.AsyncClient,
+    scenario: str,
+    dataset: Dataset,
+    requests: int,
+    concurrency: int,
+    warmup: int,
+    rng: random.Random,
+    created: List[int],
+) -> Dict[str, Any]:
+    build = SCENARIOS[scenario]
+    latencies: List[float] = []
+    errors = 0
+
+    async def send(record: bool) -> None:
+        nonlocal errors
+        method, url, body = build(rng, dataset)
+        started_at = time.perf_counter()
+        response = await client.request(method, url, json=body)
+        elapsed = time.perf_counter() - started_at
+        if response.status_code >= 400:
+            errors += 1
+            return
+        if record:
+            latencies.append(elapsed)
+        if scenario == "create":
+            created.append(response.json()["incident"]["id"])
+        elif scenario == "bulk":
+            created.extend(response.json()["created_ids"])
+
+    async def worker(count: int) -> None:
+        for _ in range(count):
+            await send(record=True)
+
+    for _ in range(warmup):
+        await send(record=False)
+    errors = 0
+
+    counts = [requests // concurrency + (index < requests % concurrency) for index in range(concurrency)]
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker(count) for count in counts))
+    elapsed = time.perf_counter() - started_at
+
+    result: Dict[str, Any] = {
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "errors": errors,
+    }
+    if len(latencies) > 1:
+        result["latency"] = _percentiles(latencies)
+    return result
+
+
+@asynccontextmanager
+async def asgi_client(headers: Dict[str, str]) -> AsyncIterator[httpx.AsyncClient]:
+    """Run the application in process and yield a client sending requests to it."""
+    from src.main import app
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", headers=headers) as client:
+            yield client
+
+
+@asynccontextmanager
+async def uvicorn_client(
+    headers: Dict[str, str], port: int, workers: int, concurrency: int, env: Dict[str, str]
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Start a uvicorn server in a subprocess and yield a client sending requests to it."""
+    command = [
+        sys.executable, "-m", "uvicorn", "src.main:app",
+        "--host", "127.0.0.1", "--port", str(port), "--workers", str(workers), "--log-level", "warning",
+    ]
+    with tempfile.NamedTemporaryFile("w+", prefix="uvicorn-", suffix=".log", delete=False) as log:
+        process = subprocess.Popen(command, env={**os.environ, **env}, stdout=log, stderr=subprocess.STDOUT)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    succeeded = False
+    try:
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}", headers=headers, limits=limits, timeout=60
+        ) as client:
+            deadline = time.monotonic() + 60
+            while True:
+                if process.poll() is not None:
+                    raise SystemExit(f"uvicorn exited with status {process.returncode}, see {log.name}")
+                try:
+                    await client.get(settings.metrics.path if settings.metrics.enabled else "/docs")
+                    break
+                except httpx.TransportError:
+                    if time.monotonic() > deadline:
+                        raise SystemExit(f"uvicorn did not start within 60 seconds, see {log.name}")
+                    await asyncio.sleep(0.2)
+            yield client
+        succeeded = True
+    finally:
+        process.send_signal(signal.SIGINT)
+        try:
+            process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        # The server output is kept for troubleshooting failed runs only.
+        if succeeded:
+            os.unlink(log.name)
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    headers = {"x-api-key": args.api_key}
+    env: Dict[str, str] = {}
+    if args.cache:
+        settings.cache.backend = args.cache
+        env["CACHE_BACKEND"] = args.cache
+
+    report: Dict[str, Any] = {
+        "rows": args.rows if args.seed else None,
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "bulk_size": args.bulk_size,
+        "targets": {},
+    }
+
+    id_range = None
+    if args.seed:
+        started_at = time.perf_counter()
+        id_range = await _seed(args.rows, args.days)
+        report["seed_seconds"] = round(time.perf_counter() - started_at, 1)
+    dataset = await _dataset(args.bulk_size)
+
+    created: List[int] = []
+    scenarios = args.scenario or list(SCENARIOS)
+    try:
+        for target in args.target or ("asgi", "uvicorn"):
+            if target == "asgi":
+                client_context = asgi_client(headers)
+            else:
+                client_context = uvicorn_client(headers, args.port, args.workers, args.concurrency, env)
+            results = report["targets"][target] = {}
+            async with client_context as client:
+                for scenario in scenarios:
+                    results[scenario] = await _drive(
+                        client, scenario, dataset, args.requests, args.concurrency, args.warmup,
+                        random.Random(args.random_seed), created,
+                    )
+    finally:
+        if not args.keep:
+            async with db_helper.session_factory() as session:
+                if id_range:
+                    await session.execute(
+                        text("DELETE FROM incidents WHERE id BETWEEN :first_id AND :last_id"),
+                        {"first_id": id_range[0], "last_id": id_range[1]},
+                    )
+                await session.execute(text("DELETE FROM incidents WHERE id = ANY(:ids)"), {"ids": created})
+                await session.commit()
+        await db_helper.dispose()
+    return report
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float, min_delta_ms: float) -> Dict[str, Any]:
+    """
+    Compare the latency percentiles of two reports.
+
+    Args:
+        baseline (Dict[str, Any]): Report of the reference run.
+        current (Dict[str, Any]): Report of the run to check.
+        threshold (float): Slowdown in percent above which a percentile regressed.
+        min_delta_ms (float): Slowdown in milliseconds below which a percentile
+            never regressed, so that noise on sub-millisecond latencies is ignored.
+
+    Returns:
+        Dict[str, Any]: The changes per target, scenario and percentile, and the regressions.
+    """
+    changes: Dict[str, Any] = {}
+    regressions: List[str] = []
+    for target, scenarios in current.get("targets", {}).items():
+        for scenario, result in scenarios.items():
+            reference = baseline.get("targets", {}).get(target, {}).get(scenario)
+            if not reference or "latency" not in reference or "latency" not in result:
+                continue
+            scenario_changes = changes.setdefault(target, {})[scenario] = {}
+            for percentile in PERCENTILES:
+                before = reference["latency"][percentile]
+                after = result["latency"][percentile]
+                change = (after - before) / before * 100 if before else 0.0
+                scenario_changes[percentile] = {
+                    "baseline": before,
+                    "current": after,
+                    "change_percent": round(change, 1),
+                }
+                if change > threshold and after - before > min_delta_ms:
+                    regressions.append(f"{target} {scenario} {percentile}: {before} -> {after} ms ({change:+.1f}%)")
+    return {"threshold_percent": threshold, "min_delta_ms": min_delta_ms, "changes": changes, "regressions": regressions}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run")
+    run_parser.add_argument("--rows", type=int, default=100_000)
+    run_parser.add_argument("--days", type=float, default=30.0)
+    run_parser.add_argument("--no-seed", dest="seed", action="store_false")
+    run_parser.add_argument("--keep", action="store_true")
+    run_parser.add_argument("--requests", type=int, default=1000)
+    run_parser.add_argument("--concurrency", type=int, default=16)
+    run_parser.add_argument("--warmup", type=int, default=20)
+    run_parser.add_argument("--bulk-size", type=int, default=100)
+    run_parser.add_argument("--scenario", choices=list(SCENARIOS), action="append")
+    run_parser.add_argument("--target", choices=("asgi", "uvicorn"), action="append")
+    run_parser.add_argument("--port", type=int, default=8765)
+    run_parser.add_argument("--workers", type=int, default=1)
+    run_parser.add_argument("--cache", choices=("none", "memory", "redis"))
+    run_parser.add_argument("--api-key", default=settings.app.api_key or "")
+    run_parser.add_argument("--random-seed", type=int, default=42)
+    run_parser.add_argument("--output")
+
+    compare_parser = commands.add_parser("compare")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=10.0)
+    compare_parser.add_argument("--min-delta-ms", type=float, default=0.5)
+    args = parser.parse_args()
+
+    if args.command == "run":
+        report = asyncio.run(run(args))
+        if args.output:
+            with open(args.output, "w") as output:
+                json.dump(report, output, indent=2)
+        print(json.dumps(report, indent=2))
+    else:
+        with open(args.baseline) as baseline_file, open(args.current) as current_file:
+            result = compare(json.load(baseline_file), json.load(current_file), args.threshold, args.min_delta_ms)
+        print(json.dumps(result, indent=2))
+        sys.exit(1 if result["regressions"] else 0)
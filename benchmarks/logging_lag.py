@@ -0,0 +1,130 @@
+"""
+Measure the event loop lag caused by logging under load, with direct and queued writes.
+
+A probe task sleeps ``--probe-ms`` in a loop and records how late it wakes
+up, while simulated requests log ``--lines`` JSON records each at ``--rps``
+requests per second for ``--seconds``. Records go to a temporary file; with
+``--write-delay-us`` every flush also blocks that long, like a stdout pipe
+drained slowly by a log collector.
+
+Modes:
+    sync    StreamHandler writing from the event loop, the former setup.
+    queued  LogQueueHandler handing records to a QueueListener thread.
+
+Usage:
+    python -m benchmarks.logging_lag --rps 5000 --lines 3 --seconds 5 --write-delay-us 20
+"""
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+from src.core.config.log_setup import JsonFormatter, RequestIdFilter, build_handlers
+from src.core.infra.request_id import current_request_id
+
+
+class SlowFile:
+    """File whose flushes block for a fixed time, counting the records written."""
+
+    def __init__(self, file: Any, delay_seconds: float) -> None:
+        self.file = file
+        self.delay_seconds = delay_seconds
+        self.writes = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        return self.file.write(text)
+
+    def flush(self) -> None:
+        self.file.flush()
+        if self.delay_seconds:
+            time.sleep(self.delay_seconds)
+
+
+async def _load(logger: logging.Logger, rps: int, lines: int, seconds: float, probe_ms: float) -> Dict[str, Any]:
+    lags: List[float] = []
+    running = True
+
+    async def probe() -> None:
+        interval = probe_ms / 1000
+        while running:
+            started_at = time.perf_counter()
+            await asyncio.sleep(interval)
+            lags.append(time.perf_counter() - started_at - interval)
+
+    probe_task = asyncio.create_task(probe())
+    requests = 0
+    started_at = time.perf_counter()
+    while (elapsed := time.perf_counter() - started_at) < seconds:
+        # Requests that fell behind while the loop was blocked arrive in a burst, as they would.
+        while requests < int(elapsed * rps):
+            token = current_request_id.set(f"bench-{requests}")
+            for line in range(lines):
+                logger.info("Handled step %d of request %d", line, requests, extra={"route": "/api/incidents"})
+            current_request_id.reset(token)
+            requests += 1
+        await asyncio.sleep(0.001)
+    elapsed = time.perf_counter() - started_at
+    running = False
+    await probe_task
+
+    lags.sort()
+    return {
+        "requests_per_second": round(requests / elapsed),
+        "records": requests * lines,
+        "lag_p50_ms": round(statistics.median(lags) * 1000, 3),
+        "lag_p99_ms": round(lags[int(len(lags) * 0.99)] * 1000, 3),
+        "lag_max_ms": round(lags[-1] * 1000, 3),
+    }
+
+
+def run(mode: str, rps: int, lines: int, seconds: float, probe_ms: float, write_delay_us: float, queue_size: int) -> Dict[str, Any]:
+    with tempfile.TemporaryFile("w") as file:
+        sink = SlowFile(file, write_delay_us / 1e6)
+        handler, listener = build_handlers(
+            JsonFormatter(),
+            stream=sink,
+            queue_size=queue_size if mode == "queued" else None,
+            filters=[RequestIdFilter()],
+        )
+        logger = logging.getLogger(f"benchmarks.logging_lag.{mode}")
+        logger.handlers = [handler]
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+
+        if listener is not None:
+            listener.start()
+        result = asyncio.run(_load(logger, rps, lines, seconds, probe_ms))
+        drained_at: Optional[float] = None
+        if listener is not None:
+            started_at = time.perf_counter()
+            listener.stop()
+            drained_at = time.perf_counter() - started_at
+
+    result["written"] = sink.writes
+    if mode == "queued":
+        result["dropped"] = handler.dropped
+        result["drain_ms"] = round(drained_at * 1000, 1)
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--rps", type=int, default=5000)
+    parser.add_argument("--lines", type=int, default=3)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--probe-ms", type=float, default=1.0)
+    parser.add_argument("--write-delay-us", type=float, default=0.0)
+    parser.add_argument("--queue-size", type=int, default=10000)
+    parser.add_argument("--mode", choices=("sync", "queued"), action="append")
+    args = parser.parse_args()
+
+    report = {
+        mode: run(mode, args.rps, args.lines, args.seconds, args.probe_ms, args.write_delay_us, args.queue_size)
+        for mode in args.mode or ("sync", "queued")
+    }
+    print(json.dumps(report, indent=2))
@@ -0,0 +1,195 @@
+"""
+Measure the overhead of the Prometheus metrics.
+
+Parts:
+    primitives  Cost of one ``Counter.inc`` and one ``Histogram.observe``.
+    request     Cost of a request through a bare route with and without
+                MetricsMiddleware, calling the ASGI application directly.
+    query       Cost of ``SELECT 1`` on the configured database with and
+                without the cursor execution events (skipped with ``--no-db``).
+    render      Time to render the registry with ``--routes`` routes of data.
+
+Usage:
+    python -m benchmarks.metrics --requests 20000 --queries 5000
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Any, Callable, Dict, List
+
+from fastapi import FastAPI
+from sqlalchemy import NullPool, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from starlette.responses import Response
+
+from src.core.config.settings import settings
+from src.metrics import MetricsMiddleware, MetricsRegistry, instrument_engine
+
+
+ROUNDS = 10
+"""Both sides of a comparison are timed in alternating rounds."""
+
+
+def _per_call_ns(fn: Callable[[], Any], calls: int) -> float:
+    started_at = time.perf_counter_ns()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter_ns() - started_at) / calls
+
+
+def primitives(calls: int) -> Dict[str, float]:
+    registry = MetricsRegistry()
+    counter = registry.counter("requests_total", "Requests.", ["method", "route", "status"])
+    histogram = registry.histogram("duration_seconds", "Durations.", ["method", "route"])
+    labels = ("GET", "/api/incidents", "200")
+    return {
+        "counter_inc_ns": round(_per_call_ns(lambda: counter.inc(labels), calls), 1),
+        "histogram_observe_ns": round(
+            _per_call_ns(lambda: histogram.observe(0.0123, labels[:2]), calls), 1
+        ),
+    }
+
+
+def _build_app(instrumented: bool) -> Any:
+    app = FastAPI()
+
+    @app.get("/api/incidents/{incident_id}")
+    async def get_incident(incident_id: int) -> Response:
+        return Response(b"{}", media_type="application/json")
+
+    if not instrumented:
+        return app
+
+    registry = MetricsRegistry()
+    return MetricsMiddleware(
+        app,
+        routes=app.router.routes,
+        requests=registry.counter("http_requests_total", "", ["method", "route", "status"]),
+        durations=registry.histogram("http_request_duration_seconds", "", ["method", "route"]),
+        in_flight=registry.gauge("http_requests_in_flight", ""),
+        request_queries_count=registry.histogram("http_request_db_queries", "", ["route"]),
+        request_queries_seconds=registry.histogram("http_request_db_seconds", "", ["route"]),
+    )
+
+
+async def _time_requests(app: Any, requests: int) -> List[float]:
+    async def receive() -> Dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Dict[str, Any]) -> None:
+        pass
+
+    samples = []
+    for index in range(requests):
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": f"/api/incidents/{index}",
+            "raw_path": f"/api/incidents/{index}".encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": [],
+            "server": ("testserver", 80),
+        }
+        started_at = time.perf_counter()
+        await app(scope, receive, send)
+        samples.append(time.perf_counter() - started_at)
+    return samples
+
+
+def _compare(samples: Dict[str, List[float]]) -> Dict[str, float]:
+    result = {}
+    for name, values in samples.items():
+        result[f"{name}_p50_us"] = round(statistics.median(values) * 1e6, 2)
+        result[f"{name}_mean_us"] = round(statistics.fmean(values) * 1e6, 2)
+    result["overhead_p50_us"] = round(result["instrumented_p50_us"] - result["bare_p50_us"], 2)
+    result["overhead_mean_us"] = round(result["instrumented_mean_us"] - result["bare_mean_us"], 2)
+    return result
+
+
+async def request_overhead(requests: int) -> Dict[str, float]:
+    apps = {"bare": _build_app(False), "instrumented": _build_app(True)}
+    samples: Dict[str, List[float]] = {name: [] for name in apps}
+    for app in apps.values():
+        await _time_requests(app, min(requests, 1000))
+    # Alternate rounds so that both sides see the same machine noise.
+    for _ in range(ROUNDS):
+        for name, app in apps.items():
+            samples[name].extend(await _time_requests(app, requests // ROUNDS))
+    return _compare(samples)
+
+
+async def query_overhead(queries: int) -> Dict[str, float]:
+    engines = {
+        "bare": create_async_engine(settings.db.connection_url(), poolclass=NullPool),
+        "instrumented": create_async_engine(settings.db.connection_url(), poolclass=NullPool),
+    }
+    registry = MetricsRegistry()
+    instrument_engine(
+        engines["instrumented"],
+        "primary",
+        registry.counter("db_queries_total", "", ["engine"]),
+        registry.histogram("db_query_duration_seconds", "", ["engine"]),
+        registry.counter("db_query_errors_total", "", ["engine"]),
+    )
+
+    statement = text("SELECT 1")
+    samples: Dict[str, List[float]] = {name: [] for name in engines}
+    connections = {name: await engine.connect() for name, engine in engines.items()}
+    try:
+        for connection in connections.values():
+            for _ in range(min(queries, 500)):
+                await connection.execute(statement)
+        for _ in range(ROUNDS):
+            for name, connection in connections.items():
+                for _ in range(queries // ROUNDS):
+                    started_at = time.perf_counter()
+                    await connection.execute(statement)
+                    samples[name].append(time.perf_counter() - started_at)
+    finally:
+        for connection in connections.values():
+            await connection.close()
+        for engine in engines.values():
+            await engine.dispose()
+    return _compare(samples)
+
+
+def render(routes: int) -> Dict[str, float]:
+    registry = MetricsRegistry()
+    requests = registry.counter("http_requests_total", "", ["method", "route", "status"])
+    durations = registry.histogram("http_request_duration_seconds", "", ["method", "route"])
+    for index in range(routes):
+        for status in ("200", "400", "404"):
+            requests.inc(("GET", f"/api/route{index}", status))
+        durations.observe(0.01, ("GET", f"/api/route{index}"))
+
+    started_at = time.perf_counter()
+    body = registry.render()
+    return {"render_ms": round((time.perf_counter() - started_at) * 1000, 3), "bytes": len(body)}
+
+
+async def main(requests: int, queries: int, routes: int, db: bool) -> Dict[str, Any]:
+    report: Dict[str, Any] = {
+        "primitives": primitives(200_000),
+        "request": await request_overhead(requests),
+        "render": render(routes),
+    }
+    if db:
+        report["query"] = await query_overhead(queries)
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--queries", type=int, default=5_000)
+    parser.add_argument("--routes", type=int, default=30)
+    parser.add_argument("--no-db", dest="db", action="store_false")
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(main(args.requests, args.queries, args.routes, args.db)), indent=2))
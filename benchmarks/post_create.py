@@ -0,0 +1,120 @@
+"""
+Measure POST /api/incidents latency with post-create processing inline and offloaded.
+
+Drives the application in process through an ASGI client with the in-memory task
+broker, once with ``TASKS_OFFLOAD_POST_CREATE`` disabled (processing runs inside
+the request) and once enabled (processing is queued as a background task).
+``--sink-latency-ms`` adds a simulated slow downstream call (e.g. a notification
+webhook) to the processing. Created incidents are deleted at the end.
+
+Requires the ``bench`` dependency group: ``poetry install --with bench``.
+
+Usage:
+    python -m benchmarks.post_create --requests 200 --concurrency 4 --sink-latency-ms 20
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Any, Dict, List
+
+import httpx
+from sqlalchemy import delete
+
+from src.core.config.settings import settings
+from src.database.helper import db_helper
+from src.database.models import Incident
+
+
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "p50_ms": round(cuts[49] * 1000, 3),
+        "p95_ms": round(cuts[94] * 1000, 3),
+        "p99_ms": round(cuts[98] * 1000, 3),
+    }
+
+
+def _add_sink_latency(latency: float) -> None:
+    """Make post-create processing also wait for a simulated downstream call."""
+    from src.api.v1.incidents import services
+    from src.tasks import incidents
+
+    process = incidents.process_created_incidents
+
+    async def process_with_sink(*args: Any, **kwargs: Any) -> None:
+        await process(*args, **kwargs)
+        await asyncio.sleep(latency)
+
+    services.process_created_incidents = process_with_sink
+    incidents.process_created_incidents = process_with_sink
+
+
+async def _run(client: httpx.AsyncClient, requests: int, concurrency: int, created: List[int]) -> Dict[str, Any]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    headers = {"x-api-key": settings.app.api_key or ""}
+
+    async def create(index: int) -> None:
+        body = {
+            "description": f"Benchmark incident {index % 20}",
+            "status": "new",
+            "source": "monitoring",
+        }
+        async with semaphore:
+            started_at = time.perf_counter()
+            response = await client.post("/api/incidents", json=body, headers=headers)
+            latencies.append(time.perf_counter() - started_at)
+        response.raise_for_status()
+        created.append(response.json()["incident"]["id"])
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(create(index) for index in range(requests)))
+    elapsed = time.perf_counter() - started_at
+
+    return {
+        "requests_per_second": round(requests / elapsed, 1),
+        "latency": _percentiles(latencies),
+    }
+
+
+async def main(requests: int, concurrency: int, sink_latency_ms: float) -> Dict[str, Any]:
+    from src.main import app
+    from src.tasks import broker
+
+    if sink_latency_ms:
+        _add_sink_latency(sink_latency_ms / 1000)
+
+    report: Dict[str, Any] = {
+        "requests": requests,
+        "concurrency": concurrency,
+        "sink_latency_ms": sink_latency_ms,
+        "modes": {},
+    }
+    created: List[int] = []
+
+    await broker.startup()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for mode, offload in (("inline", False), ("offloaded", True)):
+            settings.tasks.offload_post_create = offload
+            report["modes"][mode] = await _run(client, requests, concurrency, created)
+            await broker.wait_all()
+    await broker.shutdown()
+
+    async with db_helper.session_factory() as session:
+        await session.execute(delete(Incident).where(Incident.id.in_(created)))
+        await session.commit()
+    await db_helper.dispose()
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--sink-latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(main(args.requests, args.concurrency, args.sink_latency_ms)), indent=2))
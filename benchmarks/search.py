@@ -0,0 +1,195 @@
+"""
+Measure GET /api/incidents/search queries against a large seeded table.
+
+Seeds ``--rows`` incidents with generated descriptions in one INSERT ... SELECT
+(skipped with ``--no-seed`` to reuse rows kept by an earlier run), then runs
+every query ``--repeat`` times through ``IncidentRepo.search_incidents`` with
+the API page size and reports latency percentiles per query, the first page
+and the page after it. Every generated word occurs in 1-10% of the rows, so
+single-word queries are a worst case for finding matches; ranking is bounded
+by ``--candidates`` (``INCIDENTS_SEARCH_CANDIDATES`` by default). Substring
+and fuzzy queries are skipped when the pg_trgm extension is not installed.
+Seeded rows bypass the outbox and are deleted at the end unless ``--keep``
+is given.
+
+Usage:
+    python -m benchmarks.search --rows 1000000 --repeat 20
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+
+from src.core.config.settings import settings
+from src.database.helper import db_helper
+from src.database.models.enums import IncidentSource, IncidentStatus
+from src.database.repositories.incident_repo import IncidentRepo, SearchMode
+
+
+COMPONENTS = [
+    "api-gateway", "auth-service", "billing", "checkout", "postgres", "redis", "kafka",
+    "rabbitmq", "nginx", "dns", "cdn", "search", "scheduler", "payments", "notifications",
+    "inventory", "reporting", "storage", "vpn", "ldap",
+]
+SYMPTOMS = [
+    "timeout", "latency spike", "disk full", "out of memory", "connection refused",
+    "certificate expired", "high cpu", "packet loss", "replication lag", "crash loop",
+    "5xx errors", "queue backlog", "deadlock detected", "slow queries", "node unreachable",
+]
+DETAILS = [
+    "after deploy", "during backup", "in eu-west-1", "in us-east-1", "on node {n}",
+    "since {n} minutes", "for tenant {n}", "reported by customer", "detected by probe",
+    "after config change",
+]
+
+QUERIES: List[Tuple[str, SearchMode, Dict[str, Any]]] = [
+    ("timeout", "fulltext", {}),
+    ("kafka timeout 42", "fulltext", {}),
+    ("kafka replication lag", "fulltext", {}),
+    ('"disk full"', "fulltext", {}),
+    ("postgres -deadlock", "fulltext", {}),
+    ("certificate expired", "fulltext", {"status": IncidentStatus.NEW}),
+    ("crash loop", "fulltext", {"source": IncidentSource.MONITORING}),
+    ("queue backl", "substring", {}),
+    ("node 42", "substring", {}),
+    ("replicaton lagg", "fuzzy", {}),
+]
+
+
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "p50_ms": round(cuts[49] * 1000, 3),
+        "p95_ms": round(cuts[94] * 1000, 3),
+        "p99_ms": round(cuts[98] * 1000, 3),
+    }
+
+
+async def _seed(rows: int) -> Tuple[int, int]:
+    """Insert ``rows`` incidents server-side and return their ID range."""
+    stmt = text("""
+        WITH parts AS (
+            SELECT
+                CAST(:components AS text[]) AS components,
+                CAST(:symptoms AS text[]) AS symptoms,
+                CAST(:details AS text[]) AS details
+        ),
+        inserted AS (
+            INSERT INTO incidents (description, status, source, created_at)
+            SELECT
+                initcap(components[1 + i % cardinality(components)]) || ': '
+                    || symptoms[1 + (i / 7) % cardinality(symptoms)] || ' '
+                    || replace(details[1 + (i / 13) % cardinality(details)], '{n}', (i % 97)::text),
+                (ARRAY['NEW', 'IN_PROGRESS', 'RESOLVED', 'CLOSED'])[1 + (i / 3) % 4]::incidentstatus,
+                (ARRAY['OPERATOR', 'MONITORING', 'PARTNER'])[1 + (i / 5) % 3]::incidentsource,
+                now() - make_interval(secs => i)
+            FROM parts, generate_series(1, :rows) AS i
+            RETURNING id
+        )
+        SELECT min(id), max(id) FROM inserted
+    """)
+    async with db_helper.session_factory() as session:
+        result = await session.execute(stmt, {
+            "components": COMPONENTS,
+            "symptoms": SYMPTOMS,
+            "details": DETAILS,
+            "rows": rows,
+        })
+        first_id, last_id = result.one()
+        await session.commit()
+
+    async with db_helper.async_engine.connect() as connection:
+        await connection.execute(text("ANALYZE incidents"))
+    return first_id, last_id
+
+
+async def _has_trigram() -> bool:
+    async with db_helper.session_factory() as session:
+        result = await session.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'"))
+        return result.scalar() is not None
+
+
+async def _measure(
+    query: str, mode: SearchMode, filters: Dict[str, Any], repeat: int, limit: int, candidates: int
+) -> Dict[str, Any]:
+    first_page: List[float] = []
+    next_page: List[float] = []
+    hits = 0
+
+    for _ in range(repeat):
+        async with db_helper.session_factory() as session:
+            repo = IncidentRepo(session)
+
+            started_at = time.perf_counter()
+            rows = await repo.search_incidents(
+                query=query, mode=mode, limit=limit, candidates=candidates, **filters
+            )
+            first_page.append(time.perf_counter() - started_at)
+            hits = len(rows)
+
+            after: Optional[Tuple[float, int]] = (rows[-1].rank, rows[-1].id) if rows else None
+            started_at = time.perf_counter()
+            await repo.search_incidents(
+                query=query, mode=mode, limit=limit, candidates=candidates, after=after, **filters
+            )
+            next_page.append(time.perf_counter() - started_at)
+
+    return {
+        "query": query,
+        "mode": mode,
+        "filters": {name: value.value for name, value in filters.items()},
+        "page_hits": hits,
+        "first_page": _percentiles(first_page),
+        "next_page": _percentiles(next_page),
+    }
+
+
+async def main(rows: int, repeat: int, candidates: int, seed: bool, keep: bool) -> Dict[str, Any]:
+    report: Dict[str, Any] = {
+        "rows": rows if seed else None,
+        "repeat": repeat,
+        "candidates": candidates,
+        "queries": [],
+    }
+
+    id_range = None
+    if seed:
+        started_at = time.perf_counter()
+        id_range = await _seed(rows)
+        report["seed_seconds"] = round(time.perf_counter() - started_at, 1)
+
+    trigram = await _has_trigram()
+    report["pg_trgm"] = trigram
+    for query, mode, filters in QUERIES:
+        if mode != "fulltext" and not trigram:
+            report["queries"].append({"query": query, "mode": mode, "skipped": "pg_trgm is not installed"})
+            continue
+        report["queries"].append(
+            await _measure(query, mode, filters, repeat, settings.incidents.page_size, candidates)
+        )
+
+    if id_range and not keep:
+        async with db_helper.session_factory() as session:
+            await session.execute(
+                text("DELETE FROM incidents WHERE id BETWEEN :first_id AND :last_id"),
+                {"first_id": id_range[0], "last_id": id_range[1]},
+            )
+            await session.commit()
+    await db_helper.dispose()
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--candidates", type=int, default=settings.incidents.search_candidates)
+    parser.add_argument("--no-seed", dest="seed", action="store_false")
+    parser.add_argument("--keep", action="store_true")
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(main(args.rows, args.repeat, args.candidates, args.seed, args.keep)), indent=2))
@@ -0,0 +1,105 @@
+"""
+Compare the incident list serialization paths at several page sizes.
+
+Paths:
+    fastapi_response_model  IncidentData per row, then FastAPI's response_model
+                            re-validation, JSON-mode dump and stdlib ``json`` render.
+    pydantic_json           IncidentData per row and a single ``model_dump_json``
+                            (the default path of the list endpoint).
+    fast_json               Rows mapped straight to dicts and encoded by ``dumps``
+                            (the ``FAST_JSON=True`` path, orjson).
+
+Usage:
+    python -m benchmarks.serialization --sizes 10 1000 10000
+"""
+import argparse
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Callable, Dict, List
+
+from pydantic import TypeAdapter
+
+from src.api.v1.incidents.scheams import IncidentData, ListIncidentsResponse
+from src.api.v1.incidents.serialization import dump_incident_page
+from src.database.models.enums import IncidentSource, IncidentStatus
+
+
+def make_rows(count: int) -> List[SimpleNamespace]:
+    """Build attribute-access rows shaped like incident query results."""
+    now = datetime.now(timezone.utc)
+    statuses = list(IncidentStatus)
+    sources = list(IncidentSource)
+    return [
+        SimpleNamespace(
+            id=index,
+            description=f"Incident {index}: connection to upstream timed out",
+            status=statuses[index % len(statuses)],
+            source=sources[index % len(sources)],
+            created_at=now - timedelta(seconds=index),
+        )
+        for index in range(count)
+    ]
+
+
+_response_adapter = TypeAdapter(ListIncidentsResponse)
+
+
+def fastapi_response_model(rows: List[SimpleNamespace]) -> bytes:
+    page = ListIncidentsResponse(
+        incidents=[IncidentData.model_validate(row) for row in rows]
+    )
+    validated = _response_adapter.validate_python(page)
+    content = _response_adapter.dump_python(validated, mode="json")
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode()
+
+
+def pydantic_json(rows: List[SimpleNamespace]) -> bytes:
+    page = ListIncidentsResponse(
+        incidents=[IncidentData.model_validate(row) for row in rows]
+    )
+    return page.model_dump_json().encode()
+
+
+def fast_json(rows: List[SimpleNamespace]) -> bytes:
+    return dump_incident_page(rows, None)
+
+
+PATHS: Dict[str, Callable[[List[SimpleNamespace]], bytes]] = {
+    "fastapi_response_model": fastapi_response_model,
+    "pydantic_json": pydantic_json,
+    "fast_json": fast_json,
+}
+
+
+def measure(func: Callable[[List[SimpleNamespace]], bytes], rows: List[SimpleNamespace]) -> float:
+    """Return the best per-call time in milliseconds over a time-boxed run."""
+    func(rows)
+    best = float("inf")
+    deadline = time.perf_counter() + 1.0
+    while time.perf_counter() < deadline:
+        started_at = time.perf_counter()
+        func(rows)
+        best = min(best, time.perf_counter() - started_at)
+    return best * 1000
+
+
+def main(sizes: List[int]) -> Dict[str, Dict[str, float]]:
+    report: Dict[str, Dict[str, float]] = {}
+    for size in sizes:
+        rows = make_rows(size)
+        report[str(size)] = {
+            name: round(measure(func, rows), 4) for name, func in PATHS.items()
+        }
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 10000])
+    args = parser.parse_args()
+
+    print(json.dumps({"ms_per_page": main(args.sizes)}, indent=2))
@@ -0,0 +1,146 @@
+"""
+Compare pool wait times of request-scoped sessions and per-unit-of-work sessions.
+
+Runs simulated list requests concurrently against a deliberately small pool.
+Each request reads one page, then spends ``--work-ms`` encoding and sending the
+response (simulated with a sleep); a share of the requests is served from the
+cache and never queries the database.
+
+Modes:
+    request_scoped   the session stays open until the request ends, so the
+                     connection is held while the response is produced
+    unit_of_work     RequestSessions.read(): the connection is returned as soon
+                     as the page has been read
+
+Usage:
+    python -m benchmarks.session_scope --requests 2000 --concurrency 50 --pool-size 10 --work-ms 20
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.core.config.settings import settings
+from src.database.models import Incident
+from src.database.pool import InstrumentedAsyncQueuePool
+from src.database.replicas import ReplicaSet
+from src.database.repositories.incident_repo import INCIDENT_COLUMNS
+from src.database.sessions import RequestSessions
+
+
+PAGE = select(*INCIDENT_COLUMNS).order_by(Incident.created_at.desc(), Incident.id.desc()).limit(50)
+
+
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    if len(samples) < 2:
+        samples = samples * 2 or [0.0, 0.0]
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "p50_ms": round(cuts[49] * 1000, 3),
+        "p95_ms": round(cuts[94] * 1000, 3),
+        "p99_ms": round(cuts[98] * 1000, 3),
+    }
+
+
+async def _run(
+    mode: str,
+    session_factory: async_sessionmaker[AsyncSession],
+    requests: int,
+    concurrency: int,
+    work: float,
+    cache_hit_ratio: float,
+) -> Dict[str, Any]:
+    sessions = RequestSessions(session_factory, ReplicaSet([], read_your_writes_seconds=0))
+    waits: List[float] = []
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+    rng = random.Random(42)
+
+    async def read_page(session: AsyncSession) -> None:
+        started_at = time.perf_counter()
+        await session.connection()
+        waits.append(time.perf_counter() - started_at)
+        (await session.execute(PAGE)).all()
+
+    @asynccontextmanager
+    async def request_scoped() -> AsyncIterator[Callable[[], Any]]:
+        async with session_factory() as session:
+            yield lambda: read_page(session)
+
+    async def handle(cache_hit: bool) -> None:
+        async with semaphore:
+            started_at = time.perf_counter()
+            if mode == "request_scoped":
+                async with request_scoped() as read:
+                    if not cache_hit:
+                        await read()
+                    await asyncio.sleep(work)
+            else:
+                if not cache_hit:
+                    async with sessions.read() as session:
+                        await read_page(session)
+                await asyncio.sleep(work)
+            latencies.append(time.perf_counter() - started_at)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(handle(rng.random() < cache_hit_ratio) for _ in range(requests)))
+    elapsed = time.perf_counter() - started_at
+
+    return {
+        "requests_per_second": round(requests / elapsed, 1),
+        "pool_wait": _percentiles(waits),
+        "latency": _percentiles(latencies),
+    }
+
+
+async def main(
+    requests: int,
+    concurrency: int,
+    pool_size: int,
+    work_ms: float,
+    cache_hit_ratio: float,
+) -> Dict[str, Any]:
+    engine = create_async_engine(
+        settings.db.connection_url(),
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=pool_size,
+        max_overflow=0,
+    )
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False, autoflush=False)
+
+    report: Dict[str, Any] = {
+        "requests": requests,
+        "concurrency": concurrency,
+        "pool_size": pool_size,
+        "work_ms": work_ms,
+        "cache_hit_ratio": cache_hit_ratio,
+        "modes": {},
+    }
+    for mode in ("request_scoped", "unit_of_work"):
+        report["modes"][mode] = await _run(
+            mode, session_factory, requests, concurrency, work_ms / 1000, cache_hit_ratio
+        )
+
+    await engine.dispose()
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--pool-size", type=int, default=10)
+    parser.add_argument("--work-ms", type=float, default=20.0)
+    parser.add_argument("--cache-hit-ratio", type=float, default=0.5)
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(main(
+        args.requests, args.concurrency, args.pool_size, args.work_ms, args.cache_hit_ratio
+    )), indent=2))
@@ -4,5 +4,8 @@ set -e
 echo "Running Alembic migrations..."
 alembic upgrade head
 
+echo "Creating upcoming incidents partitions..."
+python -m src.database.partitions ensure
+
 echo "Starting Uvicorn..."
 exec uvicorn src.main:app --host=0.0.0.0 --port=8000
@@ -1,29 +1,35 @@
 from dishka import make_async_container
-from dishka.integrations.fastapi import DishkaRoute, FastapiProvider, setup_dishka
-from fastapi import APIRouter, Depends, FastAPI
+from dishka.integrations.fastapi import FastapiProvider, setup_dishka
+from dishka.integrations.taskiq import TaskiqProvider, setup_dishka as setup_taskiq_dishka
+from fastapi import APIRouter, FastAPI
 
 from .v1.incidents import IncidentsProvider, incidents_router
-from ..guards import auth_guard
+from .v1.system import system_router
 
+from ..profiling import ProfiledDishkaRoute
+from ..providers.cache_provider import CacheProvider
 from ..providers.db_provider import DatabaseProvider
+from ..providers.live_provider import LiveProvider
+from ..providers.outbox_provider import OutboxProvider
+from ..tasks import broker
 
 api_router = APIRouter(
     prefix="/api",
-    route_class=DishkaRoute,
-    dependencies=[Depends(auth_guard)]
+    route_class=ProfiledDishkaRoute,
 )
 
 api_router.include_router(incidents_router)
+api_router.include_router(system_router)
 
 def setup_container(app: FastAPI) -> None:
     """
     Initializes and configures the Dishka dependency container for the FastAPI application.
 
     Creates an asynchronous container with FastapiProvider,
-    DatabaseProvider providers, and so on.
-    After that, it integrates it with the transferred FastAPI application.
-    This container is used to inject dependencies into all endpoints
-    registered via DishkaRoute.
+    DatabaseProvider, CacheProvider, OutboxProvider, LiveProvider providers, and so on.
+    After that, it integrates it with the transferred FastAPI application
+    and with the task broker. This container is used to inject dependencies
+    into all endpoints registered via ProfiledDishkaRoute and into all tasks.
 
      Args:
         app (FastAPI): The FastAPI instance that the container is configured for.
@@ -33,11 +39,16 @@ def setup_container(app: FastAPI) -> None:
      """
     container = make_async_container(
         FastapiProvider(),
+        TaskiqProvider(),
         DatabaseProvider(),
+        CacheProvider(),
+        OutboxProvider(),
+        LiveProvider(),
         IncidentsProvider(),
     )
 
     setup_dishka(container, app)
+    setup_taskiq_dishka(container, broker)
 
 
 __all__ = ["api_router", "setup_container"]
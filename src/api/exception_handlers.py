@@ -7,27 +7,29 @@ from src.core.infra import ErrorJsonResponse, ErrorStatus
 logger = logging.getLogger(__name__)
 
 
-async def not_api_key_exception_handler(_request: Request, _exc: Exception) -> Response:
+async def bad_request_exception_handler(
+    _request: Request, exc: Exception
+) -> Response:
     """
-    Handle the case when an API key is missing from the request.
+    Handle the case when the request contains malformed data.
 
-    Returns a 401 Unauthorized JSON response with a descriptive error message.
+    Returns a 400 Bad Request JSON response with the exception detail as the message.
 
     Args:
         _request (Request): The incoming FastAPI request (unused).
-        _exc (Exception): The raised exception instance (unused).
+        exc (Exception): The raised BadRequest exception instance.
 
     Returns:
-        Response: A JSON-formatted error response indicating the missing API key.
+        Response: A JSON-formatted error response describing the invalid argument.
     """
     return ErrorJsonResponse(
-        code=status.HTTP_401_UNAUTHORIZED,
-        message="API key not found",
-        status=ErrorStatus.UNAUTHENTICATED,
+        code=status.HTTP_400_BAD_REQUEST,
+        message=getattr(exc, "detail", None) or "Bad request",
+        status=ErrorStatus.INVALID_ARGUMENT,
     )
 
 
-async def invalid_api_key_exception_handler(
+async def not_found_exception_handler(
     _request: Request, _exc: Exception
 ) -> Response:
     """
@@ -43,31 +45,31 @@ async def invalid_api_key_exception_handler(
         Response: A JSON-formatted error response indicating an invalid API key.
     """
     return ErrorJsonResponse(
-        code=status.HTTP_403_FORBIDDEN,
-        message="Invalid API key",
-        status=ErrorStatus.PERMISSION_DENIED,
+        code=status.HTTP_404_NOT_FOUND,
+        message="Not found",
+        status=ErrorStatus.NOT_FOUND,
     )
 
 
-async def not_found_exception_handler(
-    _request: Request, _exc: Exception
+async def service_unavailable_exception_handler(
+    _request: Request, exc: Exception
 ) -> Response:
     """
-    Handle the case when an invalid API key is provided.
+    Handle the case when the requested resource is not ready yet.
 
-    Returns a 403 Forbidden JSON response with an appropriate error message.
+    Returns a 503 Service Unavailable JSON response with the exception detail as the message.
 
     Args:
         _request (Request): The incoming FastAPI request (unused).
-        _exc (Exception): The raised exception instance (unused).
+        exc (Exception): The raised ServiceUnavailable exception instance.
 
     Returns:
-        Response: A JSON-formatted error response indicating an invalid API key.
+        Response: A JSON-formatted error response telling the client to retry later.
     """
     return ErrorJsonResponse(
-        code=status.HTTP_404_NOT_FOUND,
-        message="Not found",
-        status=ErrorStatus.NOT_FOUND,
+        code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        message=getattr(exc, "detail", None) or "Service unavailable",
+        status=ErrorStatus.UNAVAILABLE,
     )
 
 
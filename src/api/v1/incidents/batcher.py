@@ -0,0 +1,181 @@
+import asyncio
+import logging
+import time
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.database.models.enums import IncidentSource, IncidentStatus
+from src.database.repositories.incident_repo import IncidentRepo
+
+
+logger = logging.getLogger(__name__)
+
+FLUSH_SIZE_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+"""Upper bounds of the flush size histogram buckets."""
+
+
+@dataclass
+class _PendingCreate:
+    """A create call waiting for its batch to be flushed."""
+    values: Dict[str, Any]
+    future: asyncio.Future
+    submitted_at: float
+
+
+@dataclass
+class WriteBatcherMetrics:
+    """
+    Counters describing the flushes performed by an IncidentWriteBatcher.
+
+    Attributes:
+        flushes (int): Number of completed flushes.
+        failed_flushes (int): Number of flushes whose transaction failed.
+        items (int): Total number of creates flushed.
+        max_flush_size (int): Largest number of creates flushed at once.
+        flush_size_buckets (List[int]): Flush counts per ``FLUSH_SIZE_BUCKETS`` bucket,
+            the last element counting flushes larger than every bucket.
+        flush_seconds_total (float): Total time spent executing flushes.
+        max_flush_seconds (float): Longest flush duration.
+        wait_seconds_total (float): Total time creates spent between submission and result.
+    """
+    flushes: int = 0
+    failed_flushes: int = 0
+    items: int = 0
+    max_flush_size: int = 0
+    flush_size_buckets: List[int] = field(
+        default_factory=lambda: [0] * (len(FLUSH_SIZE_BUCKETS) + 1)
+    )
+    flush_seconds_total: float = 0.0
+    max_flush_seconds: float = 0.0
+    wait_seconds_total: float = 0.0
+
+    def record(self, size: int, duration: float, waited: float, failed: bool) -> None:
+        """Account for one finished flush."""
+        self.flushes += 1
+        self.failed_flushes += int(failed)
+        self.items += size
+        self.max_flush_size = max(self.max_flush_size, size)
+        self.flush_size_buckets[bisect_left(FLUSH_SIZE_BUCKETS, size)] += 1
+        self.flush_seconds_total += duration
+        self.max_flush_seconds = max(self.max_flush_seconds, duration)
+        self.wait_seconds_total += waited
+
+
+class IncidentWriteBatcher:
+    """
+    Coalesces concurrent incident creates into multi-row inserts.
+
+    Create calls are queued until either ``max_batch_size`` calls are waiting
+    or ``max_delay`` seconds have passed since the first of them, then the whole
+    batch is inserted with one statement in one transaction and each caller
+    receives its own row.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        max_batch_size: int,
+        max_delay: float,
+    ) -> None:
+        """
+        Initialize the batcher.
+
+        Args:
+            session_factory (async_sessionmaker[AsyncSession]): Factory for the
+                sessions used to flush batches.
+            max_batch_size (int): Maximum number of creates flushed at once.
+            max_delay (float): Maximum time in seconds a create waits for its batch.
+        """
+        self.session_factory = session_factory
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.metrics = WriteBatcherMetrics()
+
+        self._pending: List[_PendingCreate] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flushes: Set[asyncio.Task] = set()
+
+    async def create_incident(
+        self,
+        *,
+        description: str,
+        status: IncidentStatus,
+        source: IncidentSource,
+    ) -> Row:
+        """
+        Queue an incident for creation and wait until its batch is committed.
+
+        Args:
+            description (str): Text description of the incident.
+            status (IncidentStatus): Initial status of the incident.
+            source (IncidentSource): Origin of the incident.
+
+        Returns:
+            Row: The created incident row.
+        """
+        loop = asyncio.get_running_loop()
+        pending = _PendingCreate(
+            values={"description": description, "status": status, "source": source},
+            future=loop.create_future(),
+            submitted_at=time.perf_counter(),
+        )
+        self._pending.append(pending)
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush_pending()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._flush_pending)
+
+        return await pending.future
+
+    def _flush_pending(self) -> None:
+        """Hand the queued creates over to a background flush task."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._flush(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: List[_PendingCreate]) -> None:
+        """Insert a batch in one transaction and resolve the waiting callers."""
+        started_at = time.perf_counter()
+        failed = False
+        try:
+            async with self.session_factory() as session:
+                rows = await IncidentRepo(session).insert_incidents(
+                    [pending.values for pending in batch]
+                )
+        except Exception as exc:
+            failed = True
+            logger.error("Failed to flush %d incident creates: %s", len(batch), exc)
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(exc)
+        else:
+            for pending, row in zip(batch, rows):
+                if not pending.future.done():
+                    pending.future.set_result(row)
+
+        finished_at = time.perf_counter()
+        self.metrics.record(
+            size=len(batch),
+            duration=finished_at - started_at,
+            waited=sum(finished_at - pending.submitted_at for pending in batch),
+            failed=failed,
+        )
+
+    async def close(self) -> None:
+        """Flush the queued creates and wait for all in-flight flushes to finish."""
+        self._flush_pending()
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
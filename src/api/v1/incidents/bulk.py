@@ -0,0 +1,82 @@
+import json
+from typing import Any, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from src.core.infra.exceptions import BadRequest
+
+from .scheams import BulkItemError, CreateIncidentRequest
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _load_items(body: bytes, content_type: str) -> List[Tuple[Any, Optional[str]]]:
+    """
+    Split a bulk request body into raw items.
+
+    Returns pairs of the decoded item and a decoding error message; an NDJSON
+    line that is not valid JSON becomes an item error instead of failing the batch.
+    """
+    if content_type.startswith(NDJSON_MEDIA_TYPE):
+        items: List[Tuple[Any, Optional[str]]] = []
+        for line in body.splitlines():
+            if not line.strip():
+                continue
+            try:
+                items.append((json.loads(line), None))
+            except ValueError as exc:
+                items.append((None, f"Invalid JSON: {exc}"))
+        return items
+
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        raise BadRequest(detail="Request body is not valid JSON")
+    if not isinstance(payload, list):
+        raise BadRequest(detail="Request body must be a JSON array")
+    return [(item, None) for item in payload]
+
+
+def parse_bulk_create(
+    body: bytes, content_type: str, max_items: int
+) -> Tuple[List[CreateIncidentRequest], List[BulkItemError]]:
+    """
+    Parse and validate the body of a bulk incident creation request.
+
+    Accepts either a JSON array or an NDJSON stream of ``CreateIncidentRequest``
+    objects. Every item is validated on its own, so invalid items are reported
+    without rejecting the valid ones.
+
+    Args:
+        body (bytes): Raw request body.
+        content_type (str): Value of the request ``Content-Type`` header.
+        max_items (int): Maximum number of items accepted in one request.
+
+    Returns:
+        Tuple[List[CreateIncidentRequest], List[BulkItemError]]: Valid items in
+        request order and errors for the rejected items.
+
+    Raises:
+        BadRequest: If the body is not a JSON array or has too many items.
+    """
+    raw_items = _load_items(body, content_type)
+    if len(raw_items) > max_items:
+        raise BadRequest(detail=f"Bulk request is limited to {max_items} items")
+
+    valid: List[CreateIncidentRequest] = []
+    errors: List[BulkItemError] = []
+    for index, (item, error) in enumerate(raw_items):
+        if error is not None:
+            errors.append(BulkItemError(index=index, message=error))
+            continue
+        try:
+            valid.append(CreateIncidentRequest.model_validate(item))
+        except ValidationError as exc:
+            message = "; ".join(
+                f"{'.'.join(map(str, err['loc'])) or 'item'}: {err['msg']}"
+                for err in exc.errors()
+            )
+            errors.append(BulkItemError(index=index, message=message))
+
+    return valid, errors
@@ -0,0 +1,177 @@
+from dataclasses import dataclass
+from typing import Collection, Iterable, Optional
+
+from src.cache import CacheBackend, NullCache
+from src.core.infra.http_cache import make_etag
+from src.database.models.enums import IncidentStatus
+
+
+_PREFIX = "incidents"
+_ALL = "*"
+
+
+@dataclass(frozen=True)
+class EncodedEntry:
+    """
+    An encoded JSON representation together with its ETag.
+
+    Attributes:
+        etag (Optional[str]): Strong ETag of the representation, or None when
+            caching is disabled and representations are not validated.
+        body (Optional[bytes]): Encoded JSON body, or None when the client
+            already holds the representation identified by ``etag``.
+    """
+    etag: Optional[str]
+    body: Optional[bytes]
+
+    @property
+    def not_modified(self) -> bool:
+        """Whether the client can reuse its cached copy."""
+        return self.body is None
+
+
+class IncidentCache:
+    """
+    Read-through cache of serialized incident list pages and single incidents.
+
+    Cache keys embed version counters instead of being deleted on writes:
+    every list page key carries the version of its status filter and every
+    incident key carries the version of that incident. Writes bump the affected
+    counters before returning, so a reader that starts after a write never builds
+    a key pointing at data cached before it, and stale entries simply expire.
+
+    Every entry is stored as its ETag and body separated by a newline, so that
+    a hit is answered, or found unmodified, without hashing the body again.
+    """
+
+    BULK_INVALIDATION_THRESHOLD = 100
+    """Number of updated incidents above which all incident keys are invalidated at once."""
+
+    def __init__(self, backend: CacheBackend, ttl: float) -> None:
+        """
+        Initialize the incident cache.
+
+        Args:
+            backend (CacheBackend): Backend storing the entries and version counters.
+            ttl (float): Time-to-live of cached entries in seconds.
+        """
+        self.backend = backend
+        self.ttl = ttl
+
+    @property
+    def versioned(self) -> bool:
+        """
+        Whether entries are stored under versioned keys.
+
+        When caching is disabled nothing is stored and the version counters
+        are not kept.
+        """
+        return not isinstance(self.backend, NullCache)
+
+    @staticmethod
+    def etag(body: bytes) -> str:
+        """
+        Build the ETag of an encoded representation.
+
+        The ETag is derived from the body rather than from the versioned key,
+        since version counters can start over (a restarted worker, an evicted
+        counter) and an old key, with its ETag, would then come back for
+        different data.
+
+        Args:
+            body (bytes): Encoded body.
+
+        Returns:
+            str: Strong ETag that changes whenever the representation changes.
+        """
+        return make_etag(body)
+
+    @staticmethod
+    def _list_version_key(status: Optional[IncidentStatus]) -> str:
+        return f"{_PREFIX}:ver:list:{status.value if status else _ALL}"
+
+    @staticmethod
+    def _item_version_key(incident_id: Optional[int]) -> str:
+        return f"{_PREFIX}:ver:item:{_ALL if incident_id is None else incident_id}"
+
+    async def list_page_key(
+        self, status: Optional[IncidentStatus], cursor: Optional[str], limit: int
+    ) -> str:
+        """
+        Build the cache key of a list page from the current version of its filter.
+
+        The key must be built before the page is read from the database,
+        so that a write committed in between invalidates it.
+
+        Args:
+            status (Optional[IncidentStatus]): Status filter of the page.
+            cursor (Optional[str]): Cursor of the page.
+            limit (int): Page size.
+
+        Returns:
+            str: Cache key of the page.
+        """
+        version = await self.backend.get(self._list_version_key(status))
+        status_part = status.value if status else _ALL
+        return (
+            f"{_PREFIX}:list:{status_part}:{int(version or 0)}:{limit}:{cursor or ''}"
+        )
+
+    async def item_key(self, incident_id: int) -> str:
+        """
+        Build the cache key of a single incident from its current version.
+
+        Args:
+            incident_id (int): ID of the incident.
+
+        Returns:
+            str: Cache key of the incident.
+        """
+        epoch, version = await self.backend.get_many(
+            [self._item_version_key(None), self._item_version_key(incident_id)]
+        )
+        return f"{_PREFIX}:item:{incident_id}:{int(epoch or 0)}:{int(version or 0)}"
+
+    async def get(self, key: str) -> Optional[EncodedEntry]:
+        """Get a cached representation together with its stored ETag."""
+        value = await self.backend.get(key)
+        if value is None:
+            return None
+
+        etag, separator, body = value.partition(b"\n")
+        if not separator:
+            # Written without an ETag by an older version; JSON bodies have no raw newlines.
+            return None
+        return EncodedEntry(etag=etag.decode(), body=body)
+
+    async def set(self, key: str, entry: EncodedEntry) -> None:
+        """Store a representation together with its ETag."""
+        await self.backend.set(key, entry.etag.encode() + b"\n" + entry.body, self.ttl)
+
+    async def invalidate(
+        self,
+        *,
+        statuses: Iterable[IncidentStatus] = (),
+        incident_ids: Collection[int] = (),
+    ) -> None:
+        """
+        Invalidate cached entries affected by a write.
+
+        Args:
+            statuses (Iterable[IncidentStatus]): Statuses whose list pages changed;
+                the unfiltered list is always invalidated.
+            incident_ids (Collection[int]): IDs of the incidents that changed.
+        """
+        for status in {None, *statuses}:
+            await self.backend.incr(self._list_version_key(status))
+
+        if len(incident_ids) > self.BULK_INVALIDATION_THRESHOLD:
+            await self.backend.incr(self._item_version_key(None))
+            return
+        for incident_id in incident_ids:
+            await self.backend.incr(self._item_version_key(incident_id))
+
+    async def invalidate_all(self) -> None:
+        """Invalidate every cached list page and incident, e.g. after incidents were removed in bulk."""
+        await self.invalidate(statuses=IncidentStatus)
+        await self.backend.incr(self._item_version_key(None))
@@ -0,0 +1,85 @@
+import asyncio
+from typing import AsyncIterator
+
+from starlette.websockets import WebSocket, WebSocketDisconnect
+
+from src.live import BroadcastHub, Subscription
+
+
+SSE_MEDIA_TYPE = "text/event-stream"
+
+SSE_RETRY_MS = 3000
+"""Reconnection delay suggested to EventSource clients."""
+
+WS_KEEP_ALIVE = '{"event_type": "keep-alive"}'
+
+WS_CLOSE_GOING_AWAY = 1001
+WS_CLOSE_TRY_AGAIN_LATER = 1013
+
+
+async def sse_events(hub: BroadcastHub, subscription: Subscription, heartbeat: float) -> AsyncIterator[str]:
+    """
+    Encode the events of a subscription as a Server-Sent Events stream.
+
+    Comments are sent as keep-alives while no event arrives. An evicted client
+    gets a final ``evicted`` event before the stream ends.
+
+    Args:
+        hub (BroadcastHub): Hub the subscription belongs to.
+        subscription (Subscription): The client subscription.
+        heartbeat (float): Idle seconds between two keep-alives.
+
+    Yields:
+        str: SSE frames.
+    """
+    try:
+        yield f"retry: {SSE_RETRY_MS}\n\n"
+        async for event in subscription.events(timeout=heartbeat):
+            if event is None:
+                yield ": keep-alive\n\n"
+                continue
+            yield f"id: {event.id}\nevent: {event.event_type}\ndata: {event.data}\n\n"
+        if subscription.evicted:
+            yield "event: evicted\ndata: {}\n\n"
+    finally:
+        hub.unsubscribe(subscription)
+
+
+async def websocket_events(
+    websocket: WebSocket, hub: BroadcastHub, subscription: Subscription, heartbeat: float
+) -> None:
+    """
+    Send the events of a subscription over an accepted WebSocket until either side leaves.
+
+    Events are sent as JSON text messages. An evicted client is closed with
+    code 1013 (try again later), clients of a stopping worker with 1001.
+
+    Args:
+        websocket (WebSocket): The accepted WebSocket.
+        hub (BroadcastHub): Hub the subscription belongs to.
+        subscription (Subscription): The client subscription.
+        heartbeat (float): Idle seconds between two keep-alive messages.
+    """
+
+    async def send() -> None:
+        async for event in subscription.events(timeout=heartbeat):
+            await websocket.send_text(WS_KEEP_ALIVE if event is None else event.data)
+        await websocket.close(WS_CLOSE_TRY_AGAIN_LATER if subscription.evicted else WS_CLOSE_GOING_AWAY)
+
+    async def receive() -> None:
+        # Clients do not send anything; reading only detects disconnects.
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+
+    tasks = [asyncio.create_task(send()), asyncio.create_task(receive())]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        hub.unsubscribe(subscription)
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except (asyncio.CancelledError, WebSocketDisconnect, RuntimeError):
+                pass
@@ -0,0 +1,104 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import Tuple
+
+from src.core.infra.exceptions import BadRequest
+
+
+_SEPARATOR = "|"
+
+
+def _decode(cursor: str) -> Tuple[str, str]:
+    """
+    Split a cursor into its encoded position and incident ID parts.
+
+    Args:
+        cursor (str): Opaque cursor received from the client.
+
+    Returns:
+        Tuple[str, str]: The position and the incident ID, not yet parsed.
+
+    Raises:
+        BadRequest: If the cursor is not base64 of two separated parts.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        position, incident_id = raw.rsplit(_SEPARATOR, 1)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise BadRequest(detail="Invalid cursor") from None
+    return position, incident_id
+
+
+def encode_cursor(created_at: datetime, incident_id: int) -> str:
+    """
+    Build an opaque keyset cursor pointing at the given incident.
+
+    The cursor encodes the ``(created_at, id)`` pair of the last incident
+    on a page, which is the position the next page continues from.
+
+    Args:
+        created_at (datetime): Creation time of the last incident on the page.
+        incident_id (int): ID of the last incident on the page.
+
+    Returns:
+        str: URL-safe base64 cursor string.
+    """
+    raw = f"{created_at.isoformat()}{_SEPARATOR}{incident_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Args:
+        cursor (str): Opaque cursor received from the client.
+
+    Returns:
+        Tuple[datetime, int]: The ``(created_at, id)`` keyset position.
+
+    Raises:
+        BadRequest: If the cursor is malformed.
+    """
+    created_at, incident_id = _decode(cursor)
+    try:
+        return datetime.fromisoformat(created_at), int(incident_id)
+    except ValueError:
+        raise BadRequest(detail="Invalid cursor") from None
+
+
+def encode_rank_cursor(rank: float, incident_id: int) -> str:
+    """
+    Build an opaque keyset cursor pointing at a search result.
+
+    Args:
+        rank (float): Rank of the last incident on the page.
+        incident_id (int): ID of the last incident on the page.
+
+    Returns:
+        str: URL-safe base64 cursor string.
+    """
+    raw = f"{rank!r}{_SEPARATOR}{incident_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_rank_cursor(cursor: str) -> Tuple[float, int]:
+    """
+    Decode a cursor produced by ``encode_rank_cursor``.
+
+    Args:
+        cursor (str): Opaque cursor received from the client.
+
+    Returns:
+        Tuple[float, int]: The ``(rank, id)`` keyset position.
+
+    Raises:
+        BadRequest: If the cursor is malformed.
+    """
+    rank, incident_id = _decode(cursor)
+    try:
+        return float(rank), int(incident_id)
+    except ValueError:
+        raise BadRequest(detail="Invalid cursor") from None
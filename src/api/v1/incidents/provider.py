@@ -1,16 +1,57 @@
-from dishka import Provider, Scope, provide
-from sqlalchemy.ext.asyncio import AsyncSession
+from typing import AsyncIterator, List
 
+from dishka import Provider, Scope, decorate, provide
+
+from src.cache import CacheBackend
+from src.core.config.settings import settings
+from src.database.helper import db_helper
+from src.database.partitions import IncidentPartitions
+from src.database.sessions import RequestSessions
+from src.live import IncidentStats
+
+from .batcher import IncidentWriteBatcher
+from .cache import IncidentCache
 from .services import IncidentService
 
 
 class IncidentsProvider(Provider):
     """
     Dishka provider for IncidentService.
-    Each request gets its own service instance.
+    Each request gets its own service instance,
+    while the write batcher and the incident cache are shared
+    by the whole application. Partition retention invalidates
+    the incident cache.
     """
     scope = Scope.REQUEST
 
+    @provide(scope=Scope.APP)
+    async def write_batcher(self) -> AsyncIterator[IncidentWriteBatcher]:
+        batcher = IncidentWriteBatcher(
+            db_helper.session_factory,
+            max_batch_size=settings.incidents.write_batch_max_size,
+            max_delay=settings.incidents.write_batch_max_delay_ms / 1000,
+        )
+        yield batcher
+        await batcher.close()
+
+    @provide(scope=Scope.APP)
+    async def cache(self, backend: CacheBackend) -> IncidentCache:
+        return IncidentCache(backend, ttl=settings.cache.ttl_seconds)
+
+    @decorate
+    async def partitions(self, partitions: IncidentPartitions, cache: IncidentCache) -> IncidentPartitions:
+        async def invalidate_cache(removed: List[str]) -> None:
+            await cache.invalidate_all()
+
+        partitions.on_removed = invalidate_cache
+        return partitions
+
     @provide
-    async def service(self, session: AsyncSession) -> IncidentService:
-        return IncidentService(session)
+    async def service(
+        self,
+        sessions: RequestSessions,
+        batcher: IncidentWriteBatcher,
+        cache: IncidentCache,
+        stats: IncidentStats,
+    ) -> IncidentService:
+        return IncidentService(sessions, batcher, cache, stats)
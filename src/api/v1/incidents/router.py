@@ -1,24 +1,56 @@
+from datetime import datetime
+from typing import List
+
 from dishka import FromDishka
-from dishka.integrations.fastapi import DishkaRoute
-from fastapi import APIRouter, Depends, HTTPException, status
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, WebSocket, status
+from fastapi.responses import StreamingResponse
 
+from src.core.config.settings import settings
+from src.core.infra import FastJSONResponse
 from src.core.infra.exceptions import NotFound
+from src.database.models.enums import IncidentSource, IncidentStatus
+from src.database.repositories.incident_repo import SearchMode
+from src.live import BroadcastHub
+from src.profiling import ProfiledDishkaRoute
 
+from .bulk import NDJSON_MEDIA_TYPE, parse_bulk_create
 from .scheams import (
     IncidentResponse,
+    IncidentStatsResponse,
+    SearchIncidentsResponse,
+    BulkCreateIncidentsResponse,
+    BulkUpdateIncidentStatusRequest,
+    BulkUpdateIncidentStatusResponse,
     CreateIncidentRequest,
     ListIncidentsResponse,
     UpdateIncidentStatusRequest,
+    WriteBatcherStatsResponse,
 )
+from .cache import EncodedEntry
+from .live import SSE_MEDIA_TYPE, sse_events, websocket_events
 from .services import IncidentService
 
 
 router = APIRouter(
     prefix="/incidents",
     tags=["incidents"],
-    route_class=DishkaRoute,
+    route_class=ProfiledDishkaRoute,
+    default_response_class=FastJSONResponse,
 )
 
+_not_modified = {304: {"description": "The client copy identified by If-None-Match is current."}}
+
+
+def _encoded_response(entry: EncodedEntry) -> Response:
+    """Send pre-encoded JSON with its ETag, or an empty 304 when the client copy is current."""
+    headers = {"Cache-Control": "no-cache"}
+    if entry.etag is not None:
+        headers["ETag"] = entry.etag
+    if entry.not_modified:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
 
 # ----- CREATE -----
 @router.post(
@@ -29,28 +61,126 @@ router = APIRouter(
 async def create_incident(
     data: CreateIncidentRequest,
     service: FromDishka[IncidentService],
-) -> IncidentResponse:
+) -> Response:
     incident = await service.create_incident(
         description=data.description,
         status=data.status,
         source=data.source,
     )
-    return IncidentResponse(incident=incident)
+    return FastJSONResponse(
+        IncidentResponse(incident=incident).model_dump(),
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+# ----- BULK CREATE -----
+_bulk_item_schema = {"$ref": "#/components/schemas/CreateIncidentRequest"}
+
+
+@router.post(
+    "/bulk",
+    response_model=BulkCreateIncidentsResponse,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"type": "array", "items": _bulk_item_schema},
+                },
+                NDJSON_MEDIA_TYPE: {"schema": _bulk_item_schema},
+            },
+        },
+    },
+)
+async def create_incidents_bulk(
+    request: Request,
+    service: FromDishka[IncidentService],
+) -> BulkCreateIncidentsResponse:
+    items, errors = parse_bulk_create(
+        await request.body(),
+        request.headers.get("content-type", ""),
+        max_items=settings.incidents.bulk_max_items,
+    )
+    created_ids = await service.create_incidents_bulk(items)
+    return BulkCreateIncidentsResponse(created_ids=created_ids, errors=errors)
 
 
 # ----- LIST -----
 @router.get(
     "",
     response_model=ListIncidentsResponse,
+    responses=_not_modified,
 )
 async def list_incidents(
     service: FromDishka[IncidentService],
-    status: str | None = None,
-) -> ListIncidentsResponse:
-    incidents = await service.list_incidents(
-        status=status if status is None else status
+    status: IncidentStatus | None = None,
+    cursor: str | None = None,
+    limit: int = Query(
+        default=settings.incidents.page_size,
+        ge=1,
+        le=settings.incidents.max_page_size,
+    ),
+    if_none_match: str | None = Header(default=None),
+) -> Response:
+    page = await service.list_incidents(
+        status=status,
+        cursor=cursor,
+        limit=limit,
+        if_none_match=if_none_match,
+    )
+    return _encoded_response(page)
+
+
+# ----- SEARCH -----
+@router.get(
+    "/search",
+    response_model=SearchIncidentsResponse,
+)
+async def search_incidents(
+    service: FromDishka[IncidentService],
+    q: str = Query(min_length=1, max_length=256),
+    mode: SearchMode = "fulltext",
+    status: IncidentStatus | None = None,
+    source: IncidentSource | None = None,
+    cursor: str | None = None,
+    limit: int = Query(
+        default=settings.incidents.page_size,
+        ge=1,
+        le=settings.incidents.max_page_size,
+    ),
+) -> Response:
+    body = await service.search_incidents(
+        query=q,
+        mode=mode,
+        status=status,
+        source=source,
+        cursor=cursor,
+        limit=limit,
+    )
+    return Response(content=body, media_type="application/json")
+
+
+# ----- EXPORT -----
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+async def export_incidents(
+    service: FromDishka[IncidentService],
+    status: IncidentStatus | None = None,
+    source: IncidentSource | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+) -> StreamingResponse:
+    chunks = service.export_incidents(
+        status=status,
+        source=source,
+        created_from=created_from,
+        created_to=created_to,
     )
-    return ListIncidentsResponse(incidents=incidents)
+    return StreamingResponse(chunks, media_type="application/x-ndjson")
 
 
 # ----- UPDATE STATUS -----
@@ -61,10 +191,123 @@ async def list_incidents(
 async def update_incident_status(
     body: UpdateIncidentStatusRequest,
     service: FromDishka[IncidentService],
-) -> IncidentResponse:
+) -> Response:
     incident = await service.update_status(
         incident_id=body.incident_id,
         new_status=body.status,
     )
-    return IncidentResponse(incident=incident)
+    return FastJSONResponse(IncidentResponse(incident=incident).model_dump())
+
+
+# ----- BULK UPDATE STATUS -----
+@router.patch(
+    "/status/bulk",
+    response_model=BulkUpdateIncidentStatusResponse,
+)
+async def update_incident_statuses(
+    body: BulkUpdateIncidentStatusRequest,
+    service: FromDishka[IncidentService],
+) -> BulkUpdateIncidentStatusResponse:
+    updated_ids, missing_ids = await service.update_statuses(
+        incident_ids=body.incident_ids,
+        new_status=body.status,
+    )
+    return BulkUpdateIncidentStatusResponse(
+        updated_ids=updated_ids,
+        missing_ids=missing_ids,
+    )
+
+
+# ----- STATS -----
+def _stats_enabled() -> None:
+    if not settings.stats.enabled:
+        raise NotFound("The incident stats are disabled.")
+
+
+@router.get(
+    "/stats",
+    response_model=IncidentStatsResponse,
+    dependencies=[Depends(_stats_enabled)],
+)
+async def incident_stats(
+    service: FromDishka[IncidentService],
+    hours: int = Query(default=24, ge=1, le=settings.stats.histogram_hours),
+) -> IncidentStatsResponse:
+    return service.incident_stats(hours=hours)
+
+
+# ----- WRITE BATCHER STATS -----
+@router.get(
+    "/write-batcher/stats",
+    response_model=WriteBatcherStatsResponse,
+)
+async def write_batcher_stats(
+    service: FromDishka[IncidentService],
+) -> WriteBatcherStatsResponse:
+    return service.write_batcher_stats()
+
+
+# ----- LIVE FEED -----
+def _live_feed_enabled() -> None:
+    if not settings.stream.enabled:
+        raise NotFound("The live feed is disabled.")
+
+
+@router.get(
+    "/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {SSE_MEDIA_TYPE: {}}}},
+    dependencies=[Depends(_live_feed_enabled)],
+)
+async def stream_incident_events(
+    hub: FromDishka[BroadcastHub],
+    statuses: List[IncidentStatus] = Query(default=[], alias="status"),
+    sources: List[IncidentSource] = Query(default=[], alias="source"),
+) -> StreamingResponse:
+    subscription = hub.subscribe(
+        statuses=frozenset(item.value for item in statuses),
+        sources=frozenset(item.value for item in sources),
+    )
+    return StreamingResponse(
+        sse_events(hub, subscription, settings.stream.heartbeat_seconds),
+        media_type=SSE_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/ws")
+@inject
+async def incident_events_websocket(
+    websocket: WebSocket,
+    hub: FromDishka[BroadcastHub],
+    statuses: List[IncidentStatus] = Query(default=[], alias="status"),
+    sources: List[IncidentSource] = Query(default=[], alias="source"),
+) -> None:
+    if not settings.stream.enabled:
+        await websocket.close(status.WS_1008_POLICY_VIOLATION, reason="The live feed is disabled.")
+        return
+
+    subscription = hub.subscribe(
+        statuses=frozenset(item.value for item in statuses),
+        sources=frozenset(item.value for item in sources),
+    )
+    await websocket.accept()
+    await websocket_events(websocket, hub, subscription, settings.stream.heartbeat_seconds)
 
+
+# ----- GET -----
+@router.get(
+    "/{incident_id}",
+    response_model=IncidentResponse,
+    responses=_not_modified,
+)
+async def get_incident(
+    incident_id: int,
+    service: FromDishka[IncidentService],
+    if_none_match: str | None = Header(default=None),
+) -> Response:
+    incident = await service.get_incident(
+        incident_id=incident_id,
+        if_none_match=if_none_match,
+    )
+    return _encoded_response(incident)
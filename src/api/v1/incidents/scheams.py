@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field, ConfigDict
 
@@ -24,17 +24,101 @@ class CreateIncidentRequest(BaseModel):
     source: IncidentSource
 
 
+class BulkItemError(BaseModel):
+    """Validation error for a single item of a bulk request."""
+    index: int = Field(description="Zero-based position of the item in the request body.")
+    message: str
+
+
+class BulkCreateIncidentsResponse(BaseModel):
+    """Response schema for a bulk incident creation."""
+    created_ids: List[int] = Field(
+        description="IDs of the created incidents, in the order of the valid items.",
+    )
+    errors: List[BulkItemError]
+
+
 class UpdateIncidentStatusRequest(BaseModel):
     """Request schema for updating the status of an incident."""
     incident_id: int
     status: IncidentStatus
 
 
+class BulkUpdateIncidentStatusRequest(BaseModel):
+    """Request schema for moving many incidents to a new status."""
+    incident_ids: List[int] = Field(min_length=1)
+    status: IncidentStatus
+
+
+class BulkUpdateIncidentStatusResponse(BaseModel):
+    """Response schema for a bulk status update."""
+    updated_ids: List[int]
+    missing_ids: List[int] = Field(description="Requested IDs that do not exist.")
+
+
 class ListIncidentsResponse(BaseModel):
-    """Response schema for returning a list of incidents."""
+    """Response schema for returning a page of incidents."""
     incidents: List[IncidentData]
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor of the next page, absent on the last page.",
+    )
+
+
+class IncidentSearchResult(IncidentData):
+    """An incident matching a search query."""
+    rank: float = Field(description="Relevance of the match; higher is better.")
+
+
+class SearchIncidentsResponse(BaseModel):
+    """Response schema for returning a page of search results."""
+    incidents: List[IncidentSearchResult]
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor of the next page, absent on the last page.",
+    )
 
 
 class IncidentResponse(BaseModel):
     """Response schema for a single incident."""
     incident: IncidentData
+
+
+class WriteBatcherStatsResponse(BaseModel):
+    """Response schema for the write batcher flush metrics."""
+    enabled: bool
+    flushes: int
+    failed_flushes: int
+    items: int
+    avg_flush_size: float
+    max_flush_size: int
+    flush_size_histogram: Dict[str, int] = Field(
+        description="Number of flushes per flush size bucket, keyed by the bucket upper bound.",
+    )
+    avg_flush_latency_ms: float
+    max_flush_latency_ms: float
+    avg_wait_ms: float = Field(
+        description="Average time between a create being queued and its row being returned.",
+    )
+
+
+class HourlyIncidentCount(BaseModel):
+    """Number of incidents created during one hour."""
+    hour: datetime = Field(description="Start of the hour, UTC.")
+    total: int
+    by_source: Dict[IncidentSource, int]
+
+
+class IncidentStatsResponse(BaseModel):
+    """Response schema for the incident stats."""
+    total: int
+    by_status: Dict[IncidentStatus, int]
+    by_source: Dict[IncidentSource, int]
+    by_status_and_source: Dict[IncidentStatus, Dict[IncidentSource, int]]
+    created_per_hour: List[HourlyIncidentCount] = Field(
+        description="Incidents created per hour, oldest first, ending with the current hour.",
+    )
+    rebuilt_at: Optional[datetime] = Field(
+        default=None,
+        description="When the counters of the serving worker were last recounted from the database.",
+    )
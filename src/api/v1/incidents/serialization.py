@@ -0,0 +1,88 @@
+from typing import Any, Dict, Optional, Sequence
+
+from sqlalchemy import Row
+
+from src.core.infra.serialization import dumps
+
+
+def incident_row_to_dict(row: Row) -> Dict[str, Any]:
+    """
+    Convert an incident row into a dict ready to be encoded with ``dumps``.
+
+    Produces the same shape as ``IncidentData`` without building
+    a Pydantic model for the row.
+
+    Args:
+        row (Row): A row or object with ``id``, ``description``, ``status``,
+            ``source`` and ``created_at`` attributes.
+
+    Returns:
+        Dict[str, Any]: Representation of the incident.
+    """
+    return {
+        "id": row.id,
+        "description": row.description,
+        "status": row.status,
+        "source": row.source,
+        "created_at": row.created_at,
+    }
+
+
+def dump_incident(row: Row) -> bytes:
+    """
+    Serialize an incident row as ``IncidentResponse`` JSON.
+
+    Args:
+        row (Row): Incident row.
+
+    Returns:
+        bytes: UTF-8 encoded JSON.
+    """
+    return dumps({"incident": incident_row_to_dict(row)})
+
+
+def dump_incident_page(rows: Sequence[Row], next_cursor: Optional[str]) -> bytes:
+    """
+    Serialize a page of incident rows as ``ListIncidentsResponse`` JSON.
+
+    Args:
+        rows (Sequence[Row]): Incident rows of the page.
+        next_cursor (Optional[str]): Cursor of the next page.
+
+    Returns:
+        bytes: UTF-8 encoded JSON.
+    """
+    return dumps({
+        "incidents": [incident_row_to_dict(row) for row in rows],
+        "next_cursor": next_cursor,
+    })
+
+
+def dump_search_page(rows: Sequence[Row], next_cursor: Optional[str]) -> bytes:
+    """
+    Serialize a page of search result rows as ``SearchIncidentsResponse`` JSON.
+
+    Args:
+        rows (Sequence[Row]): Incident rows of the page with a ``rank`` column.
+        next_cursor (Optional[str]): Cursor of the next page.
+
+    Returns:
+        bytes: UTF-8 encoded JSON.
+    """
+    return dumps({
+        "incidents": [{**incident_row_to_dict(row), "rank": row.rank} for row in rows],
+        "next_cursor": next_cursor,
+    })
+
+
+def dump_incident_rows_ndjson(rows: Sequence[Row]) -> bytes:
+    """
+    Serialize a batch of incident rows into newline-delimited JSON.
+
+    Args:
+        rows (Sequence[Row]): Incident rows.
+
+    Returns:
+        bytes: One JSON document per line, UTF-8 encoded.
+    """
+    return b"".join(dumps(incident_row_to_dict(row)) + b"\n" for row in rows)
@@ -1,12 +1,46 @@
-from typing import List, Optional
+import logging
+from datetime import datetime
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Tuple
 
-from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import NoResultFound
 
-from src.api.v1.incidents.scheams import IncidentData
-from src.core.infra.exceptions import NotFound
-from src.database.models.enums import IncidentStatus
-from src.database.repositories.incident_repo import IncidentRepo
+from src.api.v1.incidents.batcher import FLUSH_SIZE_BUCKETS, IncidentWriteBatcher
+from src.api.v1.incidents.cache import EncodedEntry, IncidentCache
+from src.api.v1.incidents.pagination import (
+    decode_cursor,
+    decode_rank_cursor,
+    encode_cursor,
+    encode_rank_cursor,
+)
+from src.api.v1.incidents.scheams import (
+    CreateIncidentRequest,
+    IncidentData,
+    HourlyIncidentCount,
+    IncidentResponse,
+    IncidentSearchResult,
+    IncidentStatsResponse,
+    ListIncidentsResponse,
+    SearchIncidentsResponse,
+    WriteBatcherStatsResponse,
+)
+from src.api.v1.incidents.serialization import (
+    dump_incident,
+    dump_incident_page,
+    dump_incident_rows_ndjson,
+    dump_search_page,
+)
+from src.core.config.settings import settings
+from src.core.infra.exceptions import BadRequest, NotFound, ServiceUnavailable
+from src.core.infra.http_cache import etag_matches
+from src.core.infra.timing import profile_phase
+from src.database.models.enums import IncidentSource, IncidentStatus
+from src.database.repositories.incident_repo import IncidentRepo, SearchMode
+from src.database.sessions import RequestSessions
+from src.live import IncidentStats
+from src.tasks import post_create_incidents, process_created_incidents
+
+
+logger = logging.getLogger(__name__)
 
 
 class IncidentService:
@@ -14,40 +48,367 @@ class IncidentService:
     Service layer for handling incident operations.
 
     Wraps IncidentRepo to provide business logic for creation,
-    listing, and status updates.
+    listing, and status updates. Reads go through IncidentCache,
+    and every write invalidates the affected cache entries before returning.
+    Every operation opens its own short-lived session: lists, lookups and
+    exports read from a replica when one is available, which may trail the
+    primary by the replication lag; writes always use the primary, and so do
+    the reads filling the cache.
+    Stats are served from the in-memory counters of the worker.
     """
 
-    def __init__(self, session: AsyncSession) -> None:
-        self.session = session
-        self.repo = IncidentRepo(session)
+    def __init__(
+        self,
+        sessions: RequestSessions,
+        batcher: IncidentWriteBatcher,
+        cache: IncidentCache,
+        stats: IncidentStats,
+    ) -> None:
+        self.sessions = sessions
+        self.batcher = batcher
+        self.cache = cache
+        self.stats = stats
 
     async def create_incident(
         self, description: str, status: IncidentStatus, source: str
     ) -> IncidentData:
-        """Create a new incident."""
-        incident = await self.repo.create_incident(
-            description=description,
-            status=status,
-            source=source,
-        )
-        return IncidentData.model_validate(incident)
+        """
+        Create a new incident.
+
+        When write batching is enabled the create is coalesced with concurrent
+        ones by the write batcher instead of using its own transaction.
+        """
+        if settings.incidents.write_batching:
+            incident = await self.batcher.create_incident(
+                description=description,
+                status=status,
+                source=source,
+            )
+            # The batch commits on its own session, so pin the client explicitly.
+            self.sessions.pin()
+        else:
+            async with self.sessions.write() as session:
+                incident = await IncidentRepo(session).create_incident(
+                    description=description,
+                    status=status,
+                    source=source,
+                )
+
+        await self.cache.invalidate(statuses=[status])
+        await self._after_create([incident.id])
+        with profile_phase("validate"):
+            return IncidentData.model_validate(incident)
+
+    async def create_incidents_bulk(
+        self, items: List[CreateIncidentRequest]
+    ) -> List[int]:
+        """
+        Create many incidents in one transaction.
+
+        Uses multi-row INSERTs for regular batches and COPY for batches
+        of at least ``bulk_copy_threshold`` items.
+        """
+        if not items:
+            return []
+
+        values = [item.model_dump() for item in items]
+        async with self.sessions.write() as session:
+            repo = IncidentRepo(session)
+            if len(values) >= settings.incidents.bulk_copy_threshold:
+                created_ids = await repo.copy_incidents(values)
+            else:
+                created_ids = await repo.create_incidents(
+                    values, chunk_size=settings.incidents.bulk_chunk_size
+                )
+
+        await self.cache.invalidate(statuses={item.status for item in items})
+        await self._after_create(created_ids)
+        return created_ids
+
+    async def _after_create(self, incident_ids: List[int]) -> None:
+        """
+        Run the post-create processing of committed incidents.
+
+        The processing is queued as a background task unless
+        ``settings.tasks.offload_post_create`` is disabled. A failure to queue it
+        is logged and does not fail the create.
+        """
+        if not settings.tasks.offload_post_create:
+            await process_created_incidents(incident_ids, self.sessions.session_factory)
+            return
+
+        try:
+            await post_create_incidents.kiq(incident_ids)
+        except Exception as exc:
+            logger.error("Failed to queue post-create processing of %d incidents: %s", len(incident_ids), exc)
+
+    async def _read_through(
+        self,
+        key: str,
+        if_none_match: Optional[str],
+        load: Callable[[bool], Awaitable[bytes]],
+    ) -> EncodedEntry:
+        """
+        Serve an encoded representation from the cache, loading it on a miss.
+
+        ``load`` is called with whether it must read from the primary: the key
+        was versioned after the last write, so a body read from a lagging replica
+        would be cached as the current version. The ETag is computed once, when
+        the body is loaded, and cached next to it. ``If-None-Match`` is checked
+        against the ETag once the body is known, so ``*`` only matches a resource
+        that exists.
+
+        Without a versioned cache nothing is stored, so any session will do, and
+        no ETag is sent: validating a conditional request would cost the same
+        query and serialization as answering it.
+        """
+        if not self.cache.versioned:
+            return EncodedEntry(etag=None, body=await load(False))
+
+        entry = await self.cache.get(key)
+        if entry is None:
+            body = await load(True)
+            entry = EncodedEntry(etag=self.cache.etag(body), body=body)
+            await self.cache.set(key, entry)
+
+        if etag_matches(if_none_match, entry.etag):
+            return EncodedEntry(etag=entry.etag, body=None)
+        return entry
 
     async def list_incidents(
-        self, status: Optional[IncidentStatus] = None
-    ) -> List[IncidentData]:
-        """List incidents, optionally filtered by status."""
-        incidents = await self.repo.list_incidents(status=status)
-        return [IncidentData.model_validate(incident) for incident in incidents]
+        self,
+        status: Optional[IncidentStatus] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        if_none_match: Optional[str] = None,
+    ) -> EncodedEntry:
+        """
+        List a page of incidents, optionally filtered by status.
+
+        Returns the page encoded as ``ListIncidentsResponse`` JSON together with
+        its ETag. The page carries the cursor of the next page, which is None
+        when there are no more incidents.
+        """
+        after = decode_cursor(cursor) if cursor else None
+
+        async def load(primary: bool) -> bytes:
+            async with self.sessions.read(primary=primary) as session:
+                incidents = await IncidentRepo(session).list_incidents(
+                    status=status, limit=limit + 1, after=after
+                )
+
+            next_cursor = None
+            if len(incidents) > limit:
+                incidents = incidents[:limit]
+                last = incidents[-1]
+                next_cursor = encode_cursor(last.created_at, last.id)
+
+            if settings.app.fast_json:
+                with profile_phase("serialize"):
+                    return dump_incident_page(incidents, next_cursor)
+
+            with profile_phase("validate"):
+                page = ListIncidentsResponse(
+                    incidents=[IncidentData.model_validate(incident) for incident in incidents],
+                    next_cursor=next_cursor,
+                )
+            with profile_phase("serialize"):
+                return page.model_dump_json().encode()
+
+        page_key = await self.cache.list_page_key(status, cursor, limit)
+        return await self._read_through(page_key, if_none_match, load)
+
+    async def search_incidents(
+        self,
+        query: str,
+        mode: SearchMode = "fulltext",
+        status: Optional[IncidentStatus] = None,
+        source: Optional[IncidentSource] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ) -> bytes:
+        """
+        Search a page of incidents by description, best matches first.
+
+        Only the ``search_candidates`` most recent matches are ranked and returned.
+        Returns the page encoded as ``SearchIncidentsResponse`` JSON. Results are
+        not cached: queries are too diverse for cached pages to be reused.
+        Raises BadRequest if a substring or fuzzy query is shorter than a trigram.
+        """
+        if mode != "fulltext" and len(query.strip()) < 3:
+            raise BadRequest(detail="Substring and fuzzy searches need at least 3 characters.")
+        after = decode_rank_cursor(cursor) if cursor else None
+
+        async with self.sessions.read() as session:
+            incidents = await IncidentRepo(session).search_incidents(
+                query=query,
+                mode=mode,
+                status=status,
+                source=source,
+                limit=limit + 1,
+                candidates=settings.incidents.search_candidates,
+                after=after,
+            )
+
+        next_cursor = None
+        if len(incidents) > limit:
+            incidents = incidents[:limit]
+            last = incidents[-1]
+            next_cursor = encode_rank_cursor(last.rank, last.id)
+
+        if settings.app.fast_json:
+            with profile_phase("serialize"):
+                return dump_search_page(incidents, next_cursor)
+
+        with profile_phase("validate"):
+            page = SearchIncidentsResponse(
+                incidents=[IncidentSearchResult.model_validate(incident) for incident in incidents],
+                next_cursor=next_cursor,
+            )
+        with profile_phase("serialize"):
+            return page.model_dump_json().encode()
+
+    async def get_incident(
+        self, incident_id: int, if_none_match: Optional[str] = None
+    ) -> EncodedEntry:
+        """
+        Get an incident by ID encoded as ``IncidentResponse`` JSON together with its ETag.
+        Raises NotFound if not exists.
+        """
+
+        async def load(primary: bool) -> bytes:
+            try:
+                async with self.sessions.read(primary=primary) as session:
+                    incident = await IncidentRepo(session).get_incident(incident_id=incident_id)
+            except NoResultFound:
+                raise NotFound(f"Incident with id {incident_id} not found.")
+
+            if settings.app.fast_json:
+                with profile_phase("serialize"):
+                    return dump_incident(incident)
+
+            with profile_phase("validate"):
+                response = IncidentResponse(incident=IncidentData.model_validate(incident))
+            with profile_phase("serialize"):
+                return response.model_dump_json().encode()
+
+        item_key = await self.cache.item_key(incident_id)
+        return await self._read_through(item_key, if_none_match, load)
+
+    async def export_incidents(
+        self,
+        status: Optional[IncidentStatus] = None,
+        source: Optional[IncidentSource] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> AsyncIterator[bytes]:
+        """Stream all matching incidents as NDJSON chunks, one chunk per fetched batch."""
+        async with self.sessions.read() as session:
+            async for rows in IncidentRepo(session).stream_incidents(
+                status=status,
+                source=source,
+                created_from=created_from,
+                created_to=created_to,
+                batch_size=settings.incidents.export_batch_size,
+            ):
+                yield dump_incident_rows_ndjson(rows)
 
     async def update_status(
         self, incident_id: int, new_status: IncidentStatus
     ) -> IncidentData:
         """Update the status of an incident by ID. Raises NotFound if not exists."""
         try:
-            incident = await self.repo.update_status(
-                incident_id=incident_id, new_status=new_status
-            )
+            async with self.sessions.write() as session:
+                incident = await IncidentRepo(session).update_status(
+                    incident_id=incident_id, new_status=new_status
+                )
         except NoResultFound:
             raise NotFound(f"Incident with id {incident_id} not found.")
 
-        return IncidentData.model_validate(incident)
+        await self.cache.invalidate(
+            statuses={incident.previous_status, new_status},
+            incident_ids=[incident_id],
+        )
+        with profile_phase("validate"):
+            return IncidentData.model_validate(incident)
+
+    async def update_statuses(
+        self, incident_ids: List[int], new_status: IncidentStatus
+    ) -> Tuple[List[int], List[int]]:
+        """
+        Move many incidents to a new status in one statement.
+
+        Returns the updated IDs and the requested IDs that do not exist.
+        Raises BadRequest if more than ``bulk_max_items`` IDs are given.
+        """
+        unique_ids = list(dict.fromkeys(incident_ids))
+        if len(unique_ids) > settings.incidents.bulk_max_items:
+            raise BadRequest(
+                detail=f"Bulk request is limited to {settings.incidents.bulk_max_items} items"
+            )
+
+        async with self.sessions.write() as session:
+            updated = await IncidentRepo(session).update_statuses(
+                incident_ids=unique_ids, new_status=new_status
+            )
+        updated_ids = [row.id for row in updated]
+        if updated_ids:
+            await self.cache.invalidate(
+                statuses={new_status, *(row.previous_status for row in updated)},
+                incident_ids=updated_ids,
+            )
+
+        updated_set = set(updated_ids)
+        return updated_ids, [incident_id for incident_id in unique_ids if incident_id not in updated_set]
+
+    def incident_stats(self, *, hours: int) -> IncidentStatsResponse:
+        """
+        Summarize the incident counters.
+
+        Args:
+            hours (int): Number of hours of the creation histogram.
+
+        Returns:
+            IncidentStatsResponse: Counts per status and source and the creation histogram.
+
+        Raises:
+            ServiceUnavailable: If the counters have not been built yet.
+        """
+        if self.stats.rebuilt_at is None:
+            raise ServiceUnavailable("The incident stats are not ready yet.")
+
+        counts = self.stats.counts()
+        by_source = {
+            source: sum(counts[status][source] for status in counts)
+            for source in IncidentSource
+        }
+        return IncidentStatsResponse(
+            total=sum(by_source.values()),
+            by_status={status: sum(counts[status].values()) for status in counts},
+            by_source=by_source,
+            by_status_and_source=counts,
+            created_per_hour=[
+                HourlyIncidentCount(hour=hour, total=sum(sources.values()), by_source=sources)
+                for hour, sources in self.stats.created_per_hour(hours)
+            ],
+            rebuilt_at=self.stats.rebuilt_at,
+        )
+
+    def write_batcher_stats(self) -> WriteBatcherStatsResponse:
+        """Summarize the flush metrics of the write batcher."""
+        metrics = self.batcher.metrics
+        flushes = metrics.flushes or 1
+        bucket_names = [str(bound) for bound in FLUSH_SIZE_BUCKETS] + ["+Inf"]
+
+        return WriteBatcherStatsResponse(
+            enabled=settings.incidents.write_batching,
+            flushes=metrics.flushes,
+            failed_flushes=metrics.failed_flushes,
+            items=metrics.items,
+            avg_flush_size=metrics.items / flushes,
+            max_flush_size=metrics.max_flush_size,
+            flush_size_histogram=dict(zip(bucket_names, metrics.flush_size_buckets)),
+            avg_flush_latency_ms=metrics.flush_seconds_total / flushes * 1000,
+            max_flush_latency_ms=metrics.max_flush_seconds * 1000,
+            avg_wait_ms=metrics.wait_seconds_total / (metrics.items or 1) * 1000,
+        )
@@ -0,0 +1,5 @@
+from .router import router as system_router
+
+__all__ = [
+    "system_router",
+]
@@ -0,0 +1,56 @@
+import os
+
+from fastapi import APIRouter
+
+from src.database.helper import db_helper
+from src.guards import api_key_index
+
+from .scheams import ApiKeyStats, ApiKeyStatsResponse, DatabasePoolStatsResponse
+
+
+router = APIRouter(
+    prefix="/system",
+    tags=["system"],
+)
+
+
+# ----- DATABASE POOL -----
+@router.get(
+    "/db-pool",
+    response_model=DatabasePoolStatsResponse,
+)
+async def database_pool_stats() -> DatabasePoolStatsResponse:
+    stats = db_helper.pool_stats()
+    checkouts = stats["checkouts"] or 1
+    return DatabasePoolStatsResponse(
+        pid=stats["pid"],
+        pool_size=stats["pool_size"],
+        max_overflow=stats["max_overflow"],
+        checked_out=stats["checked_out"],
+        checked_in=stats["checked_in"],
+        overflow=stats["overflow"],
+        checkouts=stats["checkouts"],
+        timeouts=stats["timeouts"],
+        avg_wait_ms=stats["wait_seconds_total"] / checkouts * 1000,
+        max_wait_ms=stats["max_wait_seconds"] * 1000,
+    )
+
+
+# ----- API KEYS -----
+@router.get(
+    "/api-keys",
+    response_model=ApiKeyStatsResponse,
+)
+async def api_key_stats() -> ApiKeyStatsResponse:
+    return ApiKeyStatsResponse(
+        pid=os.getpid(),
+        keys=[
+            ApiKeyStats(
+                name=key.name,
+                scopes=sorted(key.scopes),
+                requests=api_key_index.requests[key.name],
+            )
+            for key in api_key_index.keys()
+        ],
+        rejected=dict(api_key_index.rejected),
+    )
@@ -0,0 +1,33 @@
+from typing import Dict, List
+
+from pydantic import BaseModel, Field
+
+
+class DatabasePoolStatsResponse(BaseModel):
+    """Response schema for the connection pool statistics of one worker."""
+    pid: int = Field(description="Process ID of the worker that served the request.")
+    pool_size: int
+    max_overflow: int
+    checked_out: int = Field(description="Connections currently in use.")
+    checked_in: int = Field(description="Idle connections kept in the pool.")
+    overflow: int = Field(description="Connections currently open above pool_size.")
+    checkouts: int
+    timeouts: int = Field(description="Checkouts that failed after pool_timeout.")
+    avg_wait_ms: float
+    max_wait_ms: float
+
+
+class ApiKeyStats(BaseModel):
+    """Usage of one accepted API key."""
+    name: str
+    scopes: List[str]
+    requests: int = Field(description="Requests authorized with the key by this worker.")
+
+
+class ApiKeyStatsResponse(BaseModel):
+    """Response schema for the API key usage of one worker."""
+    pid: int = Field(description="Process ID of the worker that served the request.")
+    keys: List[ApiKeyStats]
+    rejected: Dict[str, int] = Field(
+        description="Rejected requests by reason: missing, invalid or scope."
+    )
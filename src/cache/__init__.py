@@ -0,0 +1,10 @@
+__all__ = [
+    "CacheBackend",
+    "MemoryCache",
+    "NullCache",
+    "RedisCache",
+]
+
+from .base import CacheBackend, NullCache
+from .memory import MemoryCache
+from .redis import RedisCache
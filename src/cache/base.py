@@ -0,0 +1,95 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Sequence
+
+
+COUNTER_SEED_BITS = 48
+"""Bits of the random start of a counter, leaving ample room below the 64-bit limit of Redis."""
+
+
+class CacheBackend(ABC):
+    """
+    Abstract key-value cache used for read-through caching.
+
+    Values are opaque bytes with a time-to-live. Counters created by ``incr``
+    never expire, so they can be used as version numbers for cache keys.
+    A counter starts at a random value, so that one recreated after a restart
+    or an eviction does not repeat the versions it went through before.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Get a cached value.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Optional[bytes]: The cached value, or None if it is missing or expired.
+        """
+
+    @abstractmethod
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        """
+        Get several cached values in one round trip.
+
+        Args:
+            keys (Sequence[str]): Cache keys.
+
+        Returns:
+            List[Optional[bytes]]: Values in the order of ``keys``, None for misses.
+        """
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """
+        Store a value.
+
+        Args:
+            key (str): Cache key.
+            value (bytes): Value to store.
+            ttl (float): Time-to-live in seconds.
+        """
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """
+        Remove values from the cache.
+
+        Args:
+            *keys (str): Cache keys to remove.
+        """
+
+    @abstractmethod
+    async def incr(self, key: str) -> int:
+        """
+        Atomically increment a counter, creating it at a random value if it does not exist.
+
+        Args:
+            key (str): Counter key.
+
+        Returns:
+            int: The new counter value.
+        """
+
+    async def close(self) -> None:
+        """Release the resources held by the backend."""
+
+
+class NullCache(CacheBackend):
+    """Cache backend that stores nothing, used when caching is disabled."""
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return None
+
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        return [None] * len(keys)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        return None
+
+    async def delete(self, *keys: str) -> None:
+        return None
+
+    async def incr(self, key: str) -> int:
+        return 0
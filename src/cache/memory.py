@@ -0,0 +1,64 @@
+import random
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .base import COUNTER_SEED_BITS, CacheBackend
+
+
+class MemoryCache(CacheBackend):
+    """
+    In-process cache with per-entry TTL and LRU eviction.
+
+    Entries live in the memory of a single worker process, so it only gives
+    consistent results when the application runs with one worker.
+    Counters are kept apart from the entries and are never evicted; they start
+    at a random value in every process.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries (int): Maximum number of values kept before the least
+                recently used ones are evicted.
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, Tuple[float, bytes]] = OrderedDict()
+        self._counters: Dict[str, int] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        if key in self._counters:
+            return str(self._counters[key]).encode()
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        return [await self.get(key) for key in keys]
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+            self._counters.pop(key, None)
+
+    async def incr(self, key: str) -> int:
+        value = self._counters.get(key, random.getrandbits(COUNTER_SEED_BITS)) + 1
+        self._counters[key] = value
+        return value
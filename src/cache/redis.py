@@ -0,0 +1,75 @@
+import random
+from typing import Any, List, Optional, Sequence
+
+from .base import COUNTER_SEED_BITS, CacheBackend
+
+
+class RedisCache(CacheBackend):
+    """
+    Cache backed by Redis or any server speaking the Redis protocol.
+
+    Works with any client exposing the ``redis.asyncio.Redis`` methods used here
+    (``get``, ``mget``, ``set``, ``delete``, ``pipeline``, ``aclose``), which allows
+    running it against a local stand-in such as ``fakeredis``.
+    """
+
+    def __init__(self, client: Any) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            client (Any): An asynchronous Redis client instance.
+        """
+        self.client = client
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisCache":
+        """
+        Create a cache connected to the given Redis URL.
+
+        Requires the optional ``redis`` package, installed with the ``redis``
+        extra (``poetry install --extras redis``).
+
+        Args:
+            url (str): Redis connection URL, e.g. ``redis://localhost:6379/0``.
+
+        Returns:
+            RedisCache: A cache using a new ``redis.asyncio`` client.
+
+        Raises:
+            RuntimeError: If the ``redis`` package is not installed.
+        """
+        try:
+            from redis.asyncio import Redis
+        except ImportError as exc:
+            raise RuntimeError(
+                "The redis cache backend requires the 'redis' package; "
+                "install the 'redis' extra: poetry install --extras redis"
+            ) from exc
+
+        return cls(Redis.from_url(url))
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.client.get(key)
+
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        if not keys:
+            return []
+        return await self.client.mget(keys)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self.client.set(key, value, px=max(int(ttl * 1000), 1))
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.client.delete(*keys)
+
+    async def incr(self, key: str) -> int:
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.set(key, random.getrandbits(COUNTER_SEED_BITS), nx=True)
+            pipe.incr(key)
+            _, value = await pipe.execute()
+        return value
+
+    async def close(self) -> None:
+        await self.client.aclose()
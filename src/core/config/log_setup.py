@@ -1,27 +1,245 @@
+import atexit
+import copy
+import json
 import logging
+import queue
+import random
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from src.core.config.settings import LogConfig
+from src.core.infra.request_id import current_request_id
 
-def setup_logging(debug: bool = False):
+
+TEXT_FORMAT = "[%(asctime)s] #%(levelname)-1s | [%(processName)s] | %(name)s: %(message)s"
+TEXT_DATE_FORMAT = "%m %d %Y %H:%M:%S"
+
+UVICORN_LOGGERS = ("uvicorn", "uvicorn.access")
+"""Loggers configured by uvicorn with their own handlers, routed to the application handler instead."""
+
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {
+    "message",
+    "asctime",
+    "request_id",
+    "taskName",
+    # Colored copy of the message added by uvicorn.
+    "color_message",
+}
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats records as one-line JSON documents.
+
+    Every document has ``ts`` (UTC, ISO 8601), ``level``, ``logger``,
+    ``message`` and ``process``, plus ``request_id`` inside a request,
+    the values passed with ``extra=`` and the traceback as ``exc_info``.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        created_at = datetime.fromtimestamp(record.created, timezone.utc)
+        document: Dict[str, Any] = {
+            "ts": created_at.isoformat(timespec="milliseconds").replace("+00:00", "Z"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "process": record.processName,
+        }
+        request_id = getattr(record, "request_id", None)
+        if request_id is not None:
+            document["request_id"] = request_id
+        for name, value in vars(record).items():
+            if name not in _RECORD_ATTRIBUTES and not name.startswith("_"):
+                document[name] = value
+
+        if record.exc_info:
+            document["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            document["exc_info"] = record.exc_text
+        if record.stack_info:
+            document["stack_info"] = self.formatStack(record.stack_info)
+        return json.dumps(document, default=str, ensure_ascii=False)
+
+
+class RequestIdFilter(logging.Filter):
+    """Adds the ID of the current request to every record as ``request_id``."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = current_request_id.get()
+        return True
+
+
+def parse_sampling_entry(entry: str) -> Tuple[str, float]:
+    """
+    Parse a ``logger:rate`` entry of the ``LOG_SAMPLING`` setting.
+
+    Args:
+        entry (str): The entry to parse.
+
+    Returns:
+        Tuple[str, float]: The logger name and the fraction of records kept.
+
+    Raises:
+        ValueError: If the entry is malformed or the rate is not within [0, 1].
+    """
+    name, _, rate = entry.strip().rpartition(":")
+    if not name:
+        raise ValueError(f"Malformed log sampling entry {entry!r}")
+    value = float(rate)
+    if not 0 <= value <= 1:
+        raise ValueError(f"Log sampling rate of {name} must be within [0, 1]")
+    return name, value
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps a fraction of the records below WARNING of chosen loggers.
+
+    A rate applies to a logger and its children, the most specific one
+    winning. Warnings and errors are always kept.
+    """
+
+    def __init__(self, rates: Dict[str, float]) -> None:
+        """
+        Initialize the filter.
+
+        Args:
+            rates (Dict[str, float]): Fraction of the records kept per logger name.
+        """
+        super().__init__()
+        self.rates = rates
+        self._resolved: Dict[str, Optional[float]] = {}
+
+    def _rate(self, name: str) -> Optional[float]:
+        if name not in self._resolved:
+            rate = None
+            candidate = name
+            while candidate:
+                if candidate in self.rates:
+                    rate = self.rates[candidate]
+                    break
+                candidate = candidate.rpartition(".")[0]
+            self._resolved[name] = rate
+        return self._resolved[name]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self._rate(record.name)
+        return rate is None or random.random() < rate
+
+
+class LogQueueHandler(QueueHandler):
+    """
+    Hands records over to a QueueListener thread without ever blocking.
+
+    The message is merged with its arguments and the traceback rendered in
+    the logging thread, since both may refer to objects that change later;
+    formatting and writing are left to the listener. Records are dropped and
+    counted in ``dropped`` when the queue is full.
+    """
+
+    def __init__(self, log_queue: queue.Queue) -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def build_handlers(
+    formatter: logging.Formatter,
+    stream: Any = None,
+    queue_size: Optional[int] = None,
+    filters: Iterable[logging.Filter] = (),
+) -> Tuple[logging.Handler, Optional[QueueListener]]:
+    """
+    Build the handler writing records to a stream, directly or through a queue.
+
+    Args:
+        formatter (logging.Formatter): Formatter of the records.
+        stream (Any): Stream written to, ``sys.stderr`` when None.
+        queue_size (Optional[int]): Size of the queue of the records waiting
+            to be written by a listener thread, None to write them directly.
+        filters (Iterable[logging.Filter]): Filters run in the logging thread.
+
+    Returns:
+        Tuple[logging.Handler, Optional[QueueListener]]: The handler to attach
+            to loggers and the listener to start, if any.
+    """
+    stream_handler = logging.StreamHandler(stream)
+    stream_handler.setFormatter(formatter)
+
+    handler: logging.Handler = stream_handler
+    listener = None
+    if queue_size is not None:
+        handler = LogQueueHandler(queue.Queue(queue_size))
+        listener = QueueListener(handler.queue, stream_handler)
+    for log_filter in filters:
+        handler.addFilter(log_filter)
+    return handler, listener
+
+
+def setup_logging(debug: bool = False, config: Optional[LogConfig] = None) -> None:
     """
     Configure application-wide logging.
 
-    Sets the global logging level and format for the application.
-    The log level is set to DEBUG if `debug` is True; otherwise, INFO.
-    Additionally, suppresses verbose logs from the "httpx" library
+    Sets the global logging level and attaches one handler to the root
+    logger, writing JSON or text records. With ``config.queue`` the records
+    are written by a QueueListener thread, so that logging calls on the
+    event loop never wait for the output; the listener is flushed at exit.
+    Records are tagged with the current request ID and sampled according
+    to ``config.sampling``. The uvicorn loggers are routed to the same
+    handler, and verbose logs from the "httpx" library are suppressed
     by raising its log level to WARNING.
 
     Args:
         debug (bool): Whether to enable debug-level logging. Defaults to False.
+        config (Optional[LogConfig]): Logging configuration, the defaults when None.
 
     Returns:
         None
     """
+    config = config or LogConfig()
     log_level = logging.DEBUG if debug else logging.INFO
 
-    logging.basicConfig(
-        level=log_level,
-        format="[%(asctime)s] #%(levelname)-1s | [%(processName)s] | %(name)s: %(message)s",
-        datefmt="%m %d %Y %H:%M:%S",
+    if config.format == "json":
+        formatter: logging.Formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(TEXT_FORMAT, datefmt=TEXT_DATE_FORMAT)
+
+    filters: List[logging.Filter] = []
+    if config.sampling:
+        filters.append(SamplingFilter(dict(parse_sampling_entry(entry) for entry in config.sampling)))
+    filters.append(RequestIdFilter())
+
+    handler, listener = build_handlers(
+        formatter,
+        queue_size=config.queue_size if config.queue else None,
+        filters=filters,
     )
+    logging.basicConfig(level=log_level, handlers=[handler], force=True)
+    if listener is not None:
+        listener.start()
+        atexit.register(listener.stop)
+
+    for name in UVICORN_LOGGERS:
+        uvicorn_logger = logging.getLogger(name)
+        uvicorn_logger.handlers.clear()
+        uvicorn_logger.propagate = True
 
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -1,4 +1,4 @@
-__all__ = ["ErrorStatus", "ErrorJsonResponse"]
+__all__ = ["ErrorStatus", "ErrorJsonResponse", "FastJSONResponse"]
 
 from .enums import ErrorStatus
-from .responses import ErrorJsonResponse
+from .responses import ErrorJsonResponse, FastJSONResponse
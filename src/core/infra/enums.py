@@ -8,7 +8,10 @@ class ErrorStatus(str, Enum):
     Defines a consistent set of error identifiers used in API responses
     to indicate the type of failure that occurred.
     """
+    INVALID_ARGUMENT = "INVALID_ARGUMENT"
     NOT_FOUND = "NOT_FOUND"
     UNAUTHENTICATED = "UNAUTHENTICATED"
     PERMISSION_DENIED = "PERMISSION_DENIED"
+    RESOURCE_EXHAUSTED = "RESOURCE_EXHAUSTED"
     INTERNAL = "INTERNAL"
+    UNAVAILABLE = "UNAVAILABLE"
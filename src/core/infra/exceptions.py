@@ -52,12 +52,8 @@ class AppException(Exception):
         logger.error(str(self))
 
 
-class NotApiKey(AppException):
-    """Exception raised when API key authorization is missing."""
-
-
-class InvalidApiKey(AppException):
-    """Exception raised when an invalid API key is provided."""
+class BadRequest(AppException):
+    """Exception raised when request data is malformed (e.g., an invalid cursor)."""
 
 
 class NotFound(AppException):
@@ -66,3 +62,7 @@ class NotFound(AppException):
 
 class Conflict(AppException):
     """Exception raised when there is a data conflict (e.g., duplicate entry)."""
+
+
+class ServiceUnavailable(AppException):
+    """Exception raised when a resource is not ready yet (e.g., stats still being counted)."""
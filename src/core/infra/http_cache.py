@@ -0,0 +1,40 @@
+import hashlib
+from typing import Optional
+
+
+def make_etag(data: bytes) -> str:
+    """
+    Build a strong ETag from arbitrary bytes.
+
+    Args:
+        data (bytes): Data identifying the representation, such as a versioned
+            cache key or the encoded response body.
+
+    Returns:
+        str: Quoted ETag value.
+    """
+    return f'"{hashlib.blake2b(data, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check whether an ``If-None-Match`` header matches the given ETag.
+
+    Uses the weak comparison required for ``If-None-Match``,
+    so ``W/`` prefixes are ignored.
+
+    Args:
+        if_none_match (Optional[str]): Value of the ``If-None-Match`` request header.
+        etag (str): Current quoted ETag of the resource.
+
+    Returns:
+        bool: True if the client already has the current representation.
+    """
+    if not if_none_match:
+        return False
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
@@ -0,0 +1,62 @@
+import re
+import uuid
+from contextvars import ContextVar
+from typing import Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+current_request_id: ContextVar[Optional[str]] = ContextVar("current_request_id", default=None)
+"""ID of the current request, set by RequestIdMiddleware and added to every log record."""
+
+_VALID_REQUEST_ID = re.compile(rb"[A-Za-z0-9._:-]{1,128}")
+
+
+class RequestIdMiddleware:
+    """
+    ASGI middleware giving every request an ID for log correlation.
+
+    The ID is taken from the request header when it is a short token, so
+    that an ID set by a proxy or a client is kept, and generated otherwise.
+    It is stored in ``current_request_id`` for the whole request, including
+    the tasks it starts, and sent back in the same header of HTTP responses.
+    """
+
+    def __init__(self, app: ASGIApp, header: str = "X-Request-ID") -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+            header (str): Header carrying the request ID.
+        """
+        self.app = app
+        self.header = header.lower().encode("latin-1")
+
+    def _request_id(self, scope: Scope) -> str:
+        for name, value in scope["headers"]:
+            if name == self.header:
+                if _VALID_REQUEST_ID.fullmatch(value):
+                    return value.decode("latin-1")
+                break
+        return uuid.uuid4().hex
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        request_id = self._request_id(scope)
+        encoded = request_id.encode("latin-1")
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Prebuilt responses share their header list, so it is copied rather than appended to.
+                message = {**message, "headers": [*message.get("headers", ()), (self.header, encoded)]}
+            await send(message)
+
+        token = current_request_id.set(request_id)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            current_request_id.reset(token)
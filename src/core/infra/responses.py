@@ -1,20 +1,41 @@
+from collections import Counter
+from typing import Any, ClassVar, Mapping, Optional
+
 from fastapi.responses import JSONResponse
+from starlette.types import Receive, Scope, Send
 
 from src.core.infra.enums import ErrorStatus
 from src.core.infra.schemas import ErrorResponse, ErrorData
+from src.core.infra.serialization import dumps
+from src.core.infra.timing import profile_phase
+
 
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered with ``orjson``.
 
-class ErrorJsonResponse(JSONResponse):
+    Accepts plain Python content (dicts, lists, datetimes, enums) and encodes it
+    in one pass, without FastAPI's ``jsonable_encoder`` conversion step.
+    """
+
+    def render(self, content: Any) -> bytes:
+        with profile_phase("serialize"):
+            return dumps(content)
+
+
+class ErrorJsonResponse(FastJSONResponse):
     """
     Custom JSON response for standardized API error messages.
 
     Constructs a JSON response containing structured error information,
     including HTTP status code, error message, and a defined error status.
+    Every response sent is counted per error status in ``sent``.
 
     Args:
         code (int): HTTP status code for the response.
         message (str): Human-readable error message.
         status (ErrorStatus): Machine-readable error status from ErrorStatus enum.
+        headers (Optional[Mapping[str, str]]): Extra response headers, e.g. ``Retry-After``.
 
     Example:
         ErrorJsonResponse(
@@ -24,16 +45,26 @@ class ErrorJsonResponse(JSONResponse):
         )
     """
 
+    sent: ClassVar[Counter[ErrorStatus]] = Counter()
+
     def __init__(
         self,
         *,
         code: int,
         message: str,
         status: ErrorStatus,
+        headers: Optional[Mapping[str, str]] = None,
     ):
+        self.error_status = status
         error_data = ErrorData(code=code, message=message, status=status)
         super().__init__(
             status_code=code,
-            content=ErrorResponse(error=error_data).model_dump(),
+            content=ErrorResponse(error=error_data).model_dump(mode="json"),
+            headers=headers,
             media_type="application/json; charset=utf-8",
         )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Middlewares send the same prebuilt responses, so they are counted when sent.
+        ErrorJsonResponse.sent[self.error_status] += 1
+        await super().__call__(scope, receive, send)
@@ -0,0 +1,19 @@
+from typing import Any
+
+import orjson
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Encode content to compact JSON bytes with ``orjson``.
+
+    Datetimes are encoded as ISO 8601 with a ``Z`` suffix for UTC and enums as
+    their values, matching Pydantic's JSON output.
+
+    Args:
+        content (Any): JSON-compatible content, possibly containing datetimes and enums.
+
+    Returns:
+        bytes: UTF-8 encoded JSON.
+    """
+    return orjson.dumps(content, option=orjson.OPT_UTC_Z)
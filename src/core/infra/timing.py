@@ -0,0 +1,82 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+
+class RequestProfile:
+    """
+    Phase timings of one profiled request, sent back in its ``Server-Timing`` header.
+
+    Phases are added up by name in the order they first run: ``auth_guard``,
+    ``dishka`` (dependency resolution), ``db`` (statement execution),
+    ``validate`` (Pydantic model validation) and ``serialize`` (JSON encoding).
+
+    Attributes:
+        started_at (float): ``time.perf_counter()`` value when the request came in.
+        phases (Dict[str, float]): Seconds spent per phase.
+        queries (int): Statements executed for the request.
+        resolving_since (Optional[float]): ``time.perf_counter()`` value when
+            the dependencies of the endpoint started being resolved.
+    """
+
+    def __init__(self) -> None:
+        self.started_at = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.queries = 0
+        self.resolving_since: Optional[float] = None
+
+    def add(self, phase: str, seconds: float) -> None:
+        """
+        Add time spent in a phase.
+
+        Args:
+            phase (str): Phase name, a valid ``Server-Timing`` metric name.
+            seconds (float): Time spent.
+        """
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def server_timing(self) -> str:
+        """
+        Format the phases as a ``Server-Timing`` header value.
+
+        Durations are in milliseconds; the ``total`` entry covers the request
+        up to the call, i.e. up to the start of the response.
+
+        Returns:
+            str: The header value.
+        """
+        entries = []
+        for phase, seconds in self.phases.items():
+            entry = f"{phase};dur={seconds * 1000:.3f}"
+            if phase == "db":
+                entry += f';desc="statements: {self.queries}"'
+            entries.append(entry)
+        entries.append(f"total;dur={(time.perf_counter() - self.started_at) * 1000:.3f}")
+        return ", ".join(entries)
+
+
+current_profile: ContextVar[Optional[RequestProfile]] = ContextVar("current_profile", default=None)
+"""Profile of the current request, set by ProfilingMiddleware when the request is profiled."""
+
+
+@contextmanager
+def profile_phase(phase: str) -> Iterator[None]:
+    """
+    Time a block as a phase of the current request profile.
+
+    Does nothing but run the block when the request is not profiled.
+
+    Args:
+        phase (str): Phase name.
+    """
+    profile = current_profile.get()
+    if profile is None:
+        yield
+        return
+
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.add(phase, time.perf_counter() - started_at)
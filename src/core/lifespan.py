@@ -3,8 +3,14 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
+from taskiq import InMemoryBroker
 
+from .config.settings import settings
 from ..database.helper import db_helper
+from ..database.partitions import IncidentPartitions
+from ..live import PgNotifyListener
+from ..outbox import OutboxRelay
+from ..tasks import broker
 
 
 logger = logging.getLogger(__name__)
@@ -17,8 +23,21 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     Handles startup and shutdown routines for the application, including:
         - Logging startup and shutdown events.
+        - Running the periodic health checks of the read replicas.
+        - Creating the upcoming incidents partitions and applying their
+          retention periodically (task worker processes skip it).
+        - Starting and stopping the incident events outbox relay.
+        - Listening to incident change notifications when the live feed or the
+          incident stats are enabled (task worker processes serve no clients and
+          skip it). Startup does not wait longer than the pool timeout for the
+          listener, which keeps connecting in the background; the stats report
+          that they are not ready until then.
+        - Loading the API keys stored in the database and reloading them periodically.
+        - Closing the rate limiter backend.
+        - Starting and stopping the task broker (worker processes manage it themselves).
+        - Closing the Dishka dependency injection container, which flushes
+          application-scoped resources such as the write batcher.
         - Disposing of the database connection helper.
-        - Closing the Dishka dependency injection container.
 
     Args:
         app (FastAPI): The FastAPI application instance.
@@ -29,9 +48,43 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Startup
     logger.info("Starting application....")
+    if not broker.is_worker_process:
+        await broker.startup()
+    db_helper.replicas.start_health_checks(settings.db.replica_health_check_interval)
+    if settings.partitions.maintenance_seconds and not broker.is_worker_process:
+        partitions = await app.state.dishka_container.get(IncidentPartitions)
+        partitions.start(settings.partitions.maintenance_seconds)
+    if settings.auth.keys_from_database:
+        await app.state.api_key_index.start_refresh(settings.auth.refresh_seconds)
+    if settings.outbox.relay_enabled:
+        relay = await app.state.dishka_container.get(OutboxRelay)
+        relay.start()
+    listening = (settings.stream.enabled or settings.stats.enabled) and not broker.is_worker_process
+    if listening:
+        listener = await app.state.dishka_container.get(PgNotifyListener)
+        try:
+            await listener.start(timeout=settings.db.pool_timeout)
+        except TimeoutError:
+            logger.warning("Incident change notifications are not listened to yet, retrying in the background")
     yield
     # Shutdown
-    await db_helper.dispose()
+    if listening:
+        # Ends the open live feed streams.
+        await listener.stop()
+    if settings.outbox.relay_enabled:
+        # Stopped before the broker, which the taskiq sink publishes to.
+        await relay.stop()
+    if not broker.is_worker_process:
+        if isinstance(broker, InMemoryBroker):
+            # In-process tasks would otherwise be cancelled with the event loop.
+            await broker.wait_all()
+        await broker.shutdown()
+    if settings.auth.keys_from_database:
+        app.state.api_key_index.stop_refresh()
+    rate_limiter = getattr(app.state, "rate_limiter", None)
+    if rate_limiter is not None:
+        await rate_limiter.close()
     await app.state.dishka_container.close()
+    await db_helper.dispose()
 
     logger.info("Application shutdown complete.")
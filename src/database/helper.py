@@ -1,5 +1,7 @@
 import logging
-from typing import AsyncGenerator
+import os
+from functools import cached_property
+from typing import Any, AsyncGenerator, Dict, Optional, Sequence
 
 from sqlalchemy import Engine, create_engine
 from sqlalchemy.ext.asyncio import (
@@ -10,6 +12,8 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from src.core.config.settings import settings
+from src.database.pool import InstrumentedAsyncQueuePool
+from src.database.replicas import ReplicaSet
 
 
 logger = logging.getLogger(__name__)
@@ -20,9 +24,11 @@ class DatabaseHelper:
     Helper class for managing synchronous and asynchronous SQLAlchemy database connections.
 
     Provides:
-        - Synchronous and asynchronous engines
+        - An asynchronous engine with an instrumented connection pool
+        - A synchronous engine, created lazily on first use (Alembic and tooling only)
         - Async session factory
-        - Methods to get sessions and dispose of the async engine
+        - Asynchronous engines for read replicas, routed through a ReplicaSet
+        - Methods to get sessions, report pool statistics and dispose of the engines
     """
 
     def __init__(
@@ -32,37 +38,89 @@ class DatabaseHelper:
         echo_pool: bool = False,
         pool_size: int = 10,
         max_overflow: int = 10,
+        pool_timeout: float = 30.0,
+        pool_recycle: int = -1,
+        pool_pre_ping: bool = False,
+        statement_cache_size: int = 100,
+        sync_url: Optional[str] = None,
+        replica_urls: Sequence[str] = (),
+        read_your_writes_seconds: float = 0.0,
     ) -> None:
         """
         Initialize the DatabaseHelper with connection parameters.
 
         Args:
-            url (str): Database connection URL.
+            url (str): Asynchronous database connection URL.
             echo (bool): If True, SQLAlchemy will log all statements. Defaults to False.
             echo_pool (bool): If True, SQLAlchemy will log connection pool events. Defaults to False.
             pool_size (int): The size of the connection pool. Defaults to 10.
             max_overflow (int): Maximum number of connections above the pool size. Defaults to 10.
+            pool_timeout (float): Seconds to wait for a free connection. Defaults to 30.
+            pool_recycle (int): Seconds after which connections are replaced, -1 to disable.
+            pool_pre_ping (bool): If True, connections are tested on checkout. Defaults to False.
+            statement_cache_size (int): Size of the asyncpg prepared statement cache. Defaults to 100.
+            sync_url (Optional[str]): Synchronous connection URL used by the lazy sync engine.
+            replica_urls (Sequence[str]): Asynchronous connection URLs of read replicas.
+            read_your_writes_seconds (float): How long a client is pinned to the primary
+                after a write. Defaults to 0 (disabled).
         """
-        self.engine: Engine = create_engine(
-            url,
+        self.sync_url = sync_url
+        self.pool_options: Dict[str, Any] = dict(
             echo=echo,
             echo_pool=echo_pool,
             pool_size=pool_size,
             max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
         )
 
+        connect_args = {"statement_cache_size": statement_cache_size}
+
         self.async_engine: AsyncEngine = create_async_engine(
             url,
-            echo=echo,
-            echo_pool=echo_pool,
-            pool_size=pool_size,
-            max_overflow=max_overflow,
+            poolclass=InstrumentedAsyncQueuePool,
+            connect_args=connect_args,
+            **self.pool_options,
         )
 
         self.session_factory = async_sessionmaker(
             bind=self.async_engine, expire_on_commit=False, autoflush=False
         )
 
+        self.replicas = ReplicaSet(
+            [
+                create_async_engine(
+                    replica_url,
+                    poolclass=InstrumentedAsyncQueuePool,
+                    connect_args=connect_args,
+                    **self.pool_options,
+                )
+                for replica_url in replica_urls
+            ],
+            read_your_writes_seconds=read_your_writes_seconds,
+        )
+
+    @cached_property
+    def engine(self) -> Engine:
+        """
+        Synchronous engine, created on first access.
+
+        The application itself only uses the asynchronous engine, so the sync
+        driver is imported and its pool is built only when tooling needs it.
+
+        Returns:
+            Engine: A synchronous SQLAlchemy engine.
+
+        Raises:
+            RuntimeError: If no synchronous connection URL was configured.
+        """
+        if self.sync_url is None:
+            raise RuntimeError("Synchronous database URL is not configured")
+
+        logger.info("Creating synchronous database engine...")
+        return create_engine(self.sync_url, **self.pool_options)
+
     async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
         """
         Create an asynchronous database session for use in a context manager.
@@ -74,22 +132,55 @@ class DatabaseHelper:
         async with self.session_factory() as session:
             yield session
 
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        Report the state of the asynchronous connection pool of this worker.
+
+        Returns:
+            Dict[str, Any]: Pool size and usage counters together with
+            checkout wait statistics.
+        """
+        pool = self.async_engine.pool
+        wait_stats = pool.wait_stats
+        return {
+            "pid": os.getpid(),
+            "pool_size": pool.size(),
+            "max_overflow": pool._max_overflow,
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "checkouts": wait_stats.checkouts,
+            "timeouts": wait_stats.timeouts,
+            "wait_seconds_total": wait_stats.wait_seconds_total,
+            "max_wait_seconds": wait_stats.max_wait_seconds,
+        }
+
     async def dispose(self) -> None:
         """
-        Dispose of the asynchronous engine and release all resources.
+        Dispose of the engines and release all resources.
 
         This should be called during application shutdown to close
         all active connections cleanly.
         """
         logger.info("Disposing database...")
+        await self.replicas.dispose()
         await self.async_engine.dispose()
+        if "engine" in self.__dict__:
+            self.engine.dispose()
 
 
 db_helper: DatabaseHelper = DatabaseHelper(
     settings.db.connection_url(),
-    echo=False,
+    echo=settings.db.echo,
     echo_pool=False,
-    pool_size=10,
-    max_overflow=50,
+    pool_size=settings.db.pool_size,
+    max_overflow=settings.db.max_overflow,
+    pool_timeout=settings.db.pool_timeout,
+    pool_recycle=settings.db.pool_recycle,
+    pool_pre_ping=settings.db.pool_pre_ping,
+    statement_cache_size=settings.db.statement_cache_size,
+    sync_url=settings.db.sync_connection_url(),
+    replica_urls=settings.db.replica_urls,
+    read_your_writes_seconds=settings.db.read_your_writes_seconds,
 )
 """Global instance of DatabaseHelper configured with application settings."""
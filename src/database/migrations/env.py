@@ -9,6 +9,7 @@ from alembic import context
 
 from src.core import settings
 from src.database.models import Base
+from src.database.partitions import is_partition_name
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -30,6 +31,13 @@ config.set_main_option(
     settings.db.connection_url(),
 )
 
+
+
+def include_object(object, name, type_, reflected, compare_to) -> bool:
+    """Leave the incidents partitions, managed by src.database.partitions, out of autogenerate."""
+    return not (type_ == "table" and reflected and compare_to is None and is_partition_name(name))
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -54,6 +62,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -61,7 +70,11 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
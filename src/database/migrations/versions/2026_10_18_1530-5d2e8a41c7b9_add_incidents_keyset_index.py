@@ -0,0 +1,27 @@
+"""Add incidents keyset index
+
+Revision ID: 5d2e8a41c7b9
+Revises: 0cfb57931f73
+Create Date: 2026-10-18 15:30:12.482913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2e8a41c7b9'
+down_revision: Union[str, Sequence[str], None] = '0cfb57931f73'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_incidents_created_at_id', 'incidents', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_incidents_created_at_id', table_name='incidents')
@@ -0,0 +1,67 @@
+"""Add incidents filter indexes
+
+Revision ID: 9b7f3c2d1e04
+Revises: 5d2e8a41c7b9
+Create Date: 2026-10-18 16:00:41.913207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b7f3c2d1e04'
+down_revision: Union[str, Sequence[str], None] = '5d2e8a41c7b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_incidents_id', table_name='incidents', postgresql_concurrently=True)
+        op.create_index(
+            'ix_incidents_status_created_at_id',
+            'incidents',
+            ['status', sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_incidents_source_created_at',
+            'incidents',
+            ['source', sa.text('created_at DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_incidents_new_created_at_id',
+            'incidents',
+            [sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False,
+            postgresql_where=sa.text("status = 'NEW'"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_incidents_in_progress_created_at_id',
+            'incidents',
+            [sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False,
+            postgresql_where=sa.text("status = 'IN_PROGRESS'"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_incidents_in_progress_created_at_id', table_name='incidents', postgresql_concurrently=True)
+        op.drop_index('ix_incidents_new_created_at_id', table_name='incidents', postgresql_concurrently=True)
+        op.drop_index('ix_incidents_source_created_at', table_name='incidents', postgresql_concurrently=True)
+        op.drop_index('ix_incidents_status_created_at_id', table_name='incidents', postgresql_concurrently=True)
+        op.create_index(
+            op.f('ix_incidents_id'), 'incidents', ['id'], unique=False, postgresql_concurrently=True
+        )
@@ -0,0 +1,39 @@
+"""Add incident events outbox
+
+Revision ID: 7c4d2e9f1a36
+Revises: 3f6a1c9e2b57
+Create Date: 2026-10-18 17:30:08.114502
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c4d2e9f1a36'
+down_revision: Union[str, Sequence[str], None] = '3f6a1c9e2b57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'incident_events',
+        sa.Column('id', sa.BigInteger(), nullable=False),
+        sa.Column('incident_id', sa.Integer(), nullable=False),
+        sa.Column('event_type', sa.String(length=32), nullable=False),
+        sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('created_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_incident_events_incident_id', 'incident_events', ['incident_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_incident_events_incident_id', table_name='incident_events')
+    op.drop_table('incident_events')
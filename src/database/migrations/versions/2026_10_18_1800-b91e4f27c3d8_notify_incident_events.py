@@ -0,0 +1,57 @@
+"""Notify incident events
+
+Revision ID: b91e4f27c3d8
+Revises: 7c4d2e9f1a36
+Create Date: 2026-10-18 18:00:42.503117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b91e4f27c3d8'
+down_revision: Union[str, Sequence[str], None] = '7c4d2e9f1a36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # NOTIFY payloads are limited to 8000 bytes: larger events are sent without
+    # their payload and listeners load the incident instead.
+    op.execute("""
+        CREATE FUNCTION notify_incident_event() RETURNS trigger AS $$
+        DECLARE
+            message text;
+        BEGIN
+            message := json_build_object(
+                'id', NEW.id,
+                'incident_id', NEW.incident_id,
+                'event_type', NEW.event_type,
+                'payload', NEW.payload
+            )::text;
+            IF octet_length(message) > 7900 THEN
+                message := json_build_object(
+                    'id', NEW.id,
+                    'incident_id', NEW.incident_id,
+                    'event_type', NEW.event_type
+                )::text;
+            END IF;
+            PERFORM pg_notify('incident_events', message);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER incident_events_notify
+        AFTER INSERT ON incident_events
+        FOR EACH ROW EXECUTE FUNCTION notify_incident_event()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER incident_events_notify ON incident_events")
+    op.execute("DROP FUNCTION notify_incident_event()")
@@ -0,0 +1,77 @@
+"""Notify incident events with transaction IDs
+
+Revision ID: e5a7d3c14b92
+Revises: b91e4f27c3d8
+Create Date: 2026-10-18 18:30:17.240951
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a7d3c14b92'
+down_revision: Union[str, Sequence[str], None] = 'b91e4f27c3d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Listeners compare the writing transaction ID with a snapshot to tell which
+    # changes a rebuilt aggregate already includes. Events over the NOTIFY size
+    # limit are sent without the description, the only unbounded field.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_incident_event() RETURNS trigger AS $$
+        DECLARE
+            message text;
+        BEGIN
+            message := json_build_object(
+                'id', NEW.id,
+                'incident_id', NEW.incident_id,
+                'event_type', NEW.event_type,
+                'xid', pg_current_xact_id()::text,
+                'payload', NEW.payload
+            )::text;
+            IF octet_length(message) > 7900 THEN
+                message := json_build_object(
+                    'id', NEW.id,
+                    'incident_id', NEW.incident_id,
+                    'event_type', NEW.event_type,
+                    'xid', pg_current_xact_id()::text,
+                    'payload', NEW.payload - 'description'
+                )::text;
+            END IF;
+            PERFORM pg_notify('incident_events', message);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_incident_event() RETURNS trigger AS $$
+        DECLARE
+            message text;
+        BEGIN
+            message := json_build_object(
+                'id', NEW.id,
+                'incident_id', NEW.incident_id,
+                'event_type', NEW.event_type,
+                'payload', NEW.payload
+            )::text;
+            IF octet_length(message) > 7900 THEN
+                message := json_build_object(
+                    'id', NEW.id,
+                    'incident_id', NEW.incident_id,
+                    'event_type', NEW.event_type
+                )::text;
+            END IF;
+            PERFORM pg_notify('incident_events', message);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
@@ -0,0 +1,61 @@
+"""Add incidents search
+
+Revision ID: 4a8c2f61d7e3
+Revises: e5a7d3c14b92
+Create Date: 2026-10-18 19:00:26.781340
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4a8c2f61d7e3'
+down_revision: Union[str, Sequence[str], None] = 'e5a7d3c14b92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Adding a stored generated column rewrites the table under an exclusive lock.
+    op.add_column(
+        'incidents',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed("to_tsvector('english', description)", persisted=True),
+            nullable=False,
+        ),
+    )
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_incidents_search_vector',
+            'incidents',
+            ['search_vector'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_incidents_description_trgm',
+            'incidents',
+            ['description'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'description': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_incidents_description_trgm', table_name='incidents', postgresql_concurrently=True)
+        op.drop_index('ix_incidents_search_vector', table_name='incidents', postgresql_concurrently=True)
+    op.drop_column('incidents', 'search_vector')
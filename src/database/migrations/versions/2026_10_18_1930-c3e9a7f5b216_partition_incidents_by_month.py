@@ -0,0 +1,160 @@
+"""Partition incidents by month
+
+Revision ID: c3e9a7f5b216
+Revises: 4a8c2f61d7e3
+Create Date: 2026-10-18 19:30:12.402519
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e9a7f5b216'
+down_revision: Union[str, Sequence[str], None] = '4a8c2f61d7e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = "id, description, status, source, created_at"
+
+MONTHS_AHEAD = 3
+"""Months after the current one created here; ``src.database.partitions`` keeps creating them."""
+
+
+def _create_table(name: str, partitioned: bool) -> None:
+    op.create_table(
+        name,
+        sa.Column('id', sa.Integer(), server_default=sa.text("nextval('incidents_id_seq')"), nullable=False),
+        sa.Column('description', sa.Text(), nullable=False),
+        sa.Column(
+            'status',
+            postgresql.ENUM('NEW', 'IN_PROGRESS', 'RESOLVED', 'CLOSED', name='incidentstatus', create_type=False),
+            nullable=False,
+        ),
+        sa.Column(
+            'source',
+            postgresql.ENUM('OPERATOR', 'MONITORING', 'PARTNER', name='incidentsource', create_type=False),
+            nullable=False,
+        ),
+        sa.Column('created_at', postgresql.TIMESTAMP(timezone=True), nullable=False),
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed("to_tsvector('english', description)", persisted=True),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint(*(['id', 'created_at'] if partitioned else ['id']), name=f'{name}_pkey'),
+        **({'postgresql_partition_by': 'RANGE (created_at)'} if partitioned else {}),
+    )
+
+
+def _create_indexes(table: str) -> None:
+    op.create_index('ix_incidents_created_at_id', table, ['created_at', 'id'], unique=False)
+    op.create_index(
+        'ix_incidents_status_created_at_id',
+        table,
+        ['status', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+    op.create_index(
+        'ix_incidents_source_created_at', table, ['source', sa.text('created_at DESC')], unique=False
+    )
+    op.create_index(
+        'ix_incidents_new_created_at_id',
+        table,
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_where=sa.text("status = 'NEW'"),
+    )
+    op.create_index(
+        'ix_incidents_in_progress_created_at_id',
+        table,
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_where=sa.text("status = 'IN_PROGRESS'"),
+    )
+    op.create_index('ix_incidents_search_vector', table, ['search_vector'], unique=False, postgresql_using='gin')
+    op.create_index(
+        'ix_incidents_description_trgm',
+        table,
+        ['description'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'description': 'gin_trgm_ops'},
+    )
+
+
+def _set_aside(table: str) -> None:
+    """Rename the current table and drop its indexes, whose names the new table reuses."""
+    op.rename_table(table, f'{table}_old')
+    op.execute(f"ALTER TABLE {table}_old RENAME CONSTRAINT {table}_pkey TO {table}_old_pkey")
+    for index in (
+        'ix_incidents_created_at_id',
+        'ix_incidents_status_created_at_id',
+        'ix_incidents_source_created_at',
+        'ix_incidents_new_created_at_id',
+        'ix_incidents_in_progress_created_at_id',
+        'ix_incidents_search_vector',
+        'ix_incidents_description_trgm',
+    ):
+        op.drop_index(index, table_name=f'{table}_old')
+
+
+def _move_rows(table: str) -> None:
+    """Copy the rows of the set aside table, hand it the ID sequence and drop it."""
+    op.execute(f"INSERT INTO {table} ({COLUMNS}) SELECT {COLUMNS} FROM {table}_old")
+    op.execute(f"ALTER SEQUENCE incidents_id_seq OWNED BY {table}.id")
+    op.drop_table(f'{table}_old')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The rows are copied into the partitions under an exclusive lock:
+    # run this while the application is stopped.
+    op.execute("SET LOCAL TimeZone = 'UTC'")
+    _set_aside('incidents')
+    _create_table('incidents', partitioned=True)
+
+    # A partition for every month from the oldest incident up to MONTHS_AHEAD
+    # months from now, and a default one for anything outside of them.
+    op.execute(f"""
+        DO $$
+        DECLARE
+            month timestamptz;
+        BEGIN
+            FOR month IN
+                SELECT generate_series(
+                    date_trunc('month', coalesce(min(created_at), now())),
+                    date_trunc('month', now()) + interval '{MONTHS_AHEAD} months',
+                    interval '1 month'
+                )
+                FROM incidents_old
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF incidents FOR VALUES FROM (%L) TO (%L)',
+                    'incidents_p' || to_char(month, 'YYYY_MM'),
+                    month,
+                    month + interval '1 month'
+                );
+            END LOOP;
+        END
+        $$
+    """)
+    op.execute("CREATE TABLE incidents_default PARTITION OF incidents DEFAULT")
+
+    _move_rows('incidents')
+    # Indexes are built once the rows are in place, one per partition.
+    _create_indexes('incidents')
+    op.execute("ANALYZE incidents")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Archived partitions (see PARTITIONS_ARCHIVE_SCHEMA) are not brought back.
+    _set_aside('incidents')
+    _create_table('incidents', partitioned=False)
+    _move_rows('incidents')
+    _create_indexes('incidents')
@@ -1,7 +1,11 @@
 __all__ = [
+    "ApiKey",
     "Base",
     "Incident",
+    "IncidentEvent",
 ]
 
 from .base import Base
+from .api_key import ApiKey
 from .incident import Incident
+from .incident_event import IncidentEvent
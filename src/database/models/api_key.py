@@ -0,0 +1,28 @@
+from sqlalchemy import Boolean, Column, Integer, String, func
+from sqlalchemy.dialects.postgresql import ARRAY, TIMESTAMP
+
+from src.database.models import Base
+
+
+class ApiKey(Base):
+    """
+    Database model representing an API key allowed to call the API.
+
+    Only the SHA-256 hash of the key is stored.
+
+    Attributes:
+        id (int): Primary key.
+        name (str): Unique name of the key owner.
+        key_hash (str): Hex-encoded SHA-256 hash of the key.
+        scopes (list[str]): Scopes granted to the key, "*" for all of them.
+        is_active (bool): Whether the key is accepted.
+        created_at (datetime): Timestamp of creation.
+    """
+    __tablename__ = "api_keys"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(100), unique=True, nullable=False)
+    key_hash = Column(String(64), unique=True, nullable=False)
+    scopes = Column(ARRAY(String), nullable=False, server_default="{}")
+    is_active = Column(Boolean, nullable=False, server_default="true")
+    created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
@@ -14,4 +14,9 @@ class IncidentSource(str, Enum):
     OPERATOR = "operator"
     MONITORING = "monitoring"
     PARTNER = "partner"
-    
\ No newline at end of file
+
+
+class IncidentEventType(str, Enum):
+    """Types of incident change events written to the outbox."""
+    CREATED = "incident.created"
+    STATUS_CHANGED = "incident.status_changed"
@@ -2,36 +2,84 @@ from datetime import datetime, timezone
 
 from sqlalchemy import (
     Column,
+    Computed,
     Integer,
     Text,
     DateTime,
     Enum as SqlEnum,
+    Index,
+    text,
 )
-from sqlalchemy.dialects.postgresql import TIMESTAMP
+from sqlalchemy.dialects.postgresql import TIMESTAMP, TSVECTOR
+from sqlalchemy.orm import deferred
 
 from src.database.models import Base
 from src.database.models.enums import IncidentStatus, IncidentSource
 
 
+PARTITIONED_BY = "created_at"
+"""Column ``incidents`` is range-partitioned on, by month; see ``src.database.partitions``."""
+
+SEARCH_CONFIG = "english"
+"""Text search configuration of ``Incident.search_vector``; queries must use the same one."""
+
+
 class Incident(Base):
     """
     Database model representing an incident.
 
+    The table is partitioned by month of ``created_at``, which is therefore
+    part of the primary key; IDs stay unique as they all come from one sequence.
+
     Attributes:
-        id (int): Primary key.
+        id (int): Primary key, together with ``created_at``.
         description (str): Text description of the incident.
         status (IncidentStatus): Current status of the incident.
         source (IncidentSource): Origin of the incident.
-        created_at (datetime): Timestamp of creation.
+        created_at (datetime): Timestamp of creation, the partition key.
+        search_vector (str): Full-text search document of the description,
+            generated by the database and loaded only on access.
     """
     __tablename__ = "incidents"
+    __table_args__ = (
+        Index("ix_incidents_created_at_id", "created_at", "id"),
+        Index(
+            "ix_incidents_status_created_at_id",
+            "status", text("created_at DESC"), text("id DESC"),
+        ),
+        Index("ix_incidents_source_created_at", "source", text("created_at DESC")),
+        Index(
+            "ix_incidents_new_created_at_id",
+            text("created_at DESC"), text("id DESC"),
+            postgresql_where=text("status = 'NEW'"),
+        ),
+        Index(
+            "ix_incidents_in_progress_created_at_id",
+            text("created_at DESC"), text("id DESC"),
+            postgresql_where=text("status = 'IN_PROGRESS'"),
+        ),
+        Index("ix_incidents_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_incidents_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
+        {"postgresql_partition_by": f"RANGE ({PARTITIONED_BY})"},
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True)
     description = Column(Text, nullable=False)
     status = Column(SqlEnum(IncidentStatus), default=IncidentStatus.NEW, nullable=False)
     source = Column(SqlEnum(IncidentSource), nullable=False)
     created_at = Column(
         TIMESTAMP(timezone=True),
-        default=datetime.now(timezone.utc),
+        default=lambda: datetime.now(timezone.utc),
+        primary_key=True,
+        nullable=False,
+    )
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(f"to_tsvector('{SEARCH_CONFIG}', description)", persisted=True),
         nullable=False,
-    )
\ No newline at end of file
+    ))
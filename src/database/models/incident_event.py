@@ -0,0 +1,31 @@
+from sqlalchemy import BigInteger, Column, Index, Integer, String, func
+from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP
+
+from src.database.models import Base
+
+
+class IncidentEvent(Base):
+    """
+    Outbox row describing a change of an incident.
+
+    Written in the same transaction as the change, only when an outbox sink
+    is configured, and deleted by the outbox relay once it has been published.
+
+    Attributes:
+        id (int): Primary key, increasing in commit order per writer.
+        incident_id (int): ID of the changed incident.
+        event_type (str): An ``IncidentEventType`` value.
+        payload (dict): The incident after the change, in API representation,
+            plus ``previous_status`` for status changes.
+        created_at (datetime): Timestamp of the change.
+    """
+    __tablename__ = "incident_events"
+    __table_args__ = (
+        Index("ix_incident_events_incident_id", "incident_id"),
+    )
+
+    id = Column(BigInteger, primary_key=True)
+    incident_id = Column(Integer, nullable=False)
+    event_type = Column(String(32), nullable=False)
+    payload = Column(JSONB, nullable=False)
+    created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
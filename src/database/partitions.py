@@ -0,0 +1,426 @@
+import argparse
+import asyncio
+import json
+import logging
+import re
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Literal, Optional
+
+from sqlalchemy import NullPool, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+
+from src.core.config.settings import settings
+from src.database.models import Incident
+from src.database.models.incident import PARTITIONED_BY
+
+
+logger = logging.getLogger(__name__)
+
+TABLE = Incident.__tablename__
+
+DEFAULT_PARTITION = f"{TABLE}_default"
+"""Partition catching incidents outside of every monthly partition."""
+
+STATS_REBUILD_CHANNEL = "incident_stats_rebuild"
+"""Channel notified when incidents were removed in bulk, so that workers recount their stats."""
+
+LOCK_TIMEOUT = "5s"
+"""How long DDL waits for the locks it needs instead of queueing every query behind it."""
+
+_ADVISORY_LOCK_KEY = 0x696E6369  # "inci"
+_BOUNDS = re.compile(r"FROM \('([^']+)'\) TO \('([^']+)'\)")
+_PARTITION_NAME = re.compile(rf"{TABLE}_(p\d{{4}}_\d{{2}}|default)")
+
+RetentionAction = Literal["detach", "drop"]
+"""What happens to a partition past retention: moved to the archive schema or dropped."""
+
+
+def month_start(value: datetime, months: int = 0) -> datetime:
+    """
+    Get the start of a UTC month.
+
+    Args:
+        value (datetime): An aware timestamp.
+        months (int): Number of months to move forward (or back, if negative).
+
+    Returns:
+        datetime: Midnight UTC of the first day of the month of ``value``,
+        moved by ``months``.
+    """
+    value = value.astimezone(timezone.utc)
+    index = value.year * 12 + value.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def partition_name(month: datetime) -> str:
+    """Name of the partition holding the incidents created in a month."""
+    return f"{TABLE}_p{month:%Y_%m}"
+
+
+def is_partition_name(name: str) -> bool:
+    """Whether a table name is one of the incidents partitions (monthly or default)."""
+    return _PARTITION_NAME.fullmatch(name) is not None
+
+
+@dataclass(frozen=True)
+class Partition:
+    """
+    A partition of the incidents table.
+
+    Attributes:
+        name (str): Table name of the partition.
+        start (Optional[datetime]): Inclusive lower bound, None for the default partition.
+        end (Optional[datetime]): Exclusive upper bound, None for the default partition.
+        estimated_rows (int): Row estimate of the planner statistics, -1 if never analyzed.
+    """
+    name: str
+    start: Optional[datetime]
+    end: Optional[datetime]
+    estimated_rows: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "start": self.start.isoformat() if self.start else None,
+            "end": self.end.isoformat() if self.end else None,
+            "estimated_rows": self.estimated_rows,
+        }
+
+
+class IncidentPartitions:
+    """
+    Maintenance of the monthly partitions of the incidents table.
+
+    Partitions are created ahead of time, so that new incidents never land in
+    the default partition, and partitions older than the retention are detached
+    to the archive schema or dropped in one statement instead of deleting their
+    rows. Maintenance runs under an advisory lock, so only one worker does it
+    at a time, and every DDL statement gives up after ``LOCK_TIMEOUT`` rather
+    than blocking incident queries behind a long-running transaction.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        months_ahead: int,
+        retention_months: int = 0,
+        retention_action: RetentionAction = "detach",
+        archive_schema: str = "archive",
+        on_removed: Optional[Callable[[List[str]], Awaitable[None]]] = None,
+    ) -> None:
+        """
+        Initialize the maintenance.
+
+        Args:
+            engine (AsyncEngine): Engine of the primary database.
+            months_ahead (int): Number of months after the current one to create partitions for.
+            retention_months (int): Number of full months kept before the current one,
+                0 to keep every partition.
+            retention_action (RetentionAction): What happens to partitions past retention.
+            archive_schema (str): Schema detached partitions are moved to.
+            on_removed (Optional[Callable[[List[str]], Awaitable[None]]]): Called with
+                the names of the partitions removed by a retention run, e.g. to
+                invalidate cached incidents.
+        """
+        self.engine = engine
+        self.months_ahead = months_ahead
+        self.retention_months = retention_months
+        self.retention_action = retention_action
+        self.archive_schema = archive_schema
+        self.on_removed = on_removed
+
+        self._task: Optional[asyncio.Task] = None
+
+    async def list(self) -> List[Partition]:
+        """
+        List the partitions of the incidents table.
+
+        Returns:
+            List[Partition]: Monthly partitions oldest first, then the default partition.
+        """
+        async with self.engine.connect() as connection:
+            return await self._list(connection)
+
+    async def _list(self, connection: AsyncConnection) -> List[Partition]:
+        # Bounds are printed in the session time zone.
+        await connection.execute(text("SET LOCAL TimeZone = 'UTC'"))
+        result = await connection.execute(text("""
+            SELECT c.relname, pg_get_expr(c.relpartbound, c.oid), c.reltuples::bigint
+            FROM pg_inherits AS i
+            JOIN pg_class AS c ON c.oid = i.inhrelid
+            WHERE i.inhparent = CAST(:table AS regclass)
+        """), {"table": TABLE})
+
+        partitions = []
+        for name, bound, estimated_rows in result:
+            match = _BOUNDS.search(bound)
+            start, end = (
+                (datetime.fromisoformat(match[1]), datetime.fromisoformat(match[2]))
+                if match else (None, None)
+            )
+            partitions.append(Partition(name, start, end, estimated_rows))
+        return sorted(partitions, key=lambda partition: (partition.start is None, partition.start))
+
+    async def ensure(self, now: Optional[datetime] = None) -> List[str]:
+        """
+        Create the missing partitions from the current month to ``months_ahead`` months later.
+
+        A partition is created as a standalone table with a matching CHECK
+        constraint and then attached, which only takes a SHARE UPDATE EXCLUSIVE
+        lock on the incidents table. Incidents of that month found in the default
+        partition are moved into it first.
+
+        Args:
+            now (Optional[datetime]): Current time, defaults to the system clock.
+
+        Returns:
+            List[str]: Names of the created partitions.
+        """
+        current = month_start(now or datetime.now(timezone.utc))
+        async with self._locked() as connection:
+            if connection is None:
+                return []
+            existing = {partition.name for partition in await self._list(connection)}
+            await connection.commit()
+
+            created = []
+            for offset in range(self.months_ahead + 1):
+                start = month_start(current, offset)
+                name = partition_name(start)
+                if name not in existing:
+                    await self._create(connection, name, start, month_start(start, 1))
+                    created.append(name)
+            return created
+
+    async def _create(self, connection: AsyncConnection, name: str, start: datetime, end: datetime) -> None:
+        quote = connection.dialect.identifier_preparer.quote
+        table, partition = quote(TABLE), quote(name)
+        bounds = {"start": start, "end": end}
+        in_range = f"{PARTITIONED_BY} >= :start AND {PARTITIONED_BY} < :end"
+        columns = ", ".join(
+            quote(column.name) for column in Incident.__table__.columns if column.computed is None
+        )
+
+        await connection.execute(text(f"SET LOCAL lock_timeout = '{LOCK_TIMEOUT}'"))
+        await connection.execute(text(f"CREATE TABLE {partition} (LIKE {table} INCLUDING GENERATED)"))
+        # Literal bounds: DDL cannot take parameters.
+        check = f"{PARTITIONED_BY} >= '{start.isoformat()}' AND {PARTITIONED_BY} < '{end.isoformat()}'"
+        await connection.execute(text(
+            f"ALTER TABLE {partition} ADD CONSTRAINT {quote(name + '_bounds')} CHECK ({check})"
+        ))
+        moved = await connection.execute(text(f"""
+            WITH moved AS (
+                DELETE FROM {quote(DEFAULT_PARTITION)} WHERE {in_range} RETURNING {columns}
+            )
+            INSERT INTO {partition} ({columns}) SELECT {columns} FROM moved
+        """), bounds)
+        await connection.execute(text(
+            f"ALTER TABLE {table} ATTACH PARTITION {partition} "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        ))
+        # The constraint only served to skip the validation scan of ATTACH.
+        await connection.execute(text(f"ALTER TABLE {partition} DROP CONSTRAINT {quote(name + '_bounds')}"))
+        await connection.commit()
+
+        if moved.rowcount:
+            logger.warning("Moved %d incidents from %s to %s", moved.rowcount, DEFAULT_PARTITION, name)
+        logger.info("Created partition %s", name)
+
+    async def retain(self, now: Optional[datetime] = None) -> List[str]:
+        """
+        Detach or drop the partitions that ended more than ``retention_months`` before the current month.
+
+        Partitions still holding NEW or IN_PROGRESS incidents are kept. After
+        removing partitions, the workers are notified to recount their stats
+        and ``on_removed`` is called.
+
+        Args:
+            now (Optional[datetime]): Current time, defaults to the system clock.
+
+        Returns:
+            List[str]: Names of the detached or dropped partitions.
+        """
+        if not self.retention_months:
+            return []
+
+        cutoff = month_start(now or datetime.now(timezone.utc), -self.retention_months)
+        async with self._locked() as connection:
+            if connection is None:
+                return []
+            expired = [
+                partition for partition in await self._list(connection)
+                if partition.end is not None and partition.end <= cutoff
+            ]
+            await connection.commit()
+
+            removed = []
+            for partition in expired:
+                if await self._remove(connection, partition.name):
+                    removed.append(partition.name)
+            if removed:
+                await connection.execute(text("SELECT pg_notify(:channel, '')"), {"channel": STATS_REBUILD_CHANNEL})
+                await connection.commit()
+        if removed and self.on_removed is not None:
+            await self.on_removed(removed)
+        return removed
+
+    async def _open_incidents(self, connection: AsyncConnection, partition: str) -> int:
+        result = await connection.execute(text(
+            f"SELECT count(*) FROM {partition} WHERE status IN ('NEW', 'IN_PROGRESS')"
+        ))
+        return result.scalar_one()
+
+    async def _remove(self, connection: AsyncConnection, name: str) -> bool:
+        """
+        Detach or drop a partition unless it holds open incidents.
+
+        The partition is detached first and its open incidents counted again
+        in the same transaction, while DETACH holds an ACCESS EXCLUSIVE lock
+        on it, so that no incident can be reopened between the check and the
+        removal; the transaction is rolled back when some are found. Taking
+        the lock before the count instead would make the DETACH upgrade it
+        while writers hold the lock on the incidents table, which can deadlock.
+        A count without locks skips the partitions that are obviously kept.
+        """
+        quote = connection.dialect.identifier_preparer.quote
+        partition = quote(name)
+
+        count = await self._open_incidents(connection, partition)
+        await connection.commit()
+        if not count:
+            await connection.execute(text(f"SET LOCAL lock_timeout = '{LOCK_TIMEOUT}'"))
+            await connection.execute(text(f"ALTER TABLE {quote(TABLE)} DETACH PARTITION {partition}"))
+            count = await self._open_incidents(connection, partition)
+        if count:
+            await connection.rollback()
+            logger.warning("Kept partition %s past retention, it has %d open incidents", name, count)
+            return False
+
+        if self.retention_action == "drop":
+            await connection.execute(text(f"DROP TABLE {partition}"))
+        else:
+            schema = quote(self.archive_schema)
+            await connection.execute(text(f"CREATE SCHEMA IF NOT EXISTS {schema}"))
+            await connection.execute(text(f"ALTER TABLE {partition} SET SCHEMA {schema}"))
+        await connection.commit()
+
+        if self.retention_action == "drop":
+            logger.info("Dropped partition %s", name)
+        else:
+            logger.info("Moved partition %s to the %s schema", name, self.archive_schema)
+        return True
+
+    async def maintain(self, now: Optional[datetime] = None) -> Dict[str, List[str]]:
+        """
+        Create the upcoming partitions, then apply the retention.
+
+        Args:
+            now (Optional[datetime]): Current time, defaults to the system clock.
+
+        Returns:
+            Dict[str, List[str]]: Names of the ``created`` and ``removed`` partitions.
+        """
+        return {"created": await self.ensure(now), "removed": await self.retain(now)}
+
+    @asynccontextmanager
+    async def _locked(self) -> AsyncIterator[Optional[AsyncConnection]]:
+        """Connection holding the maintenance advisory lock, or None when another process holds it."""
+        async with self.engine.connect() as connection:
+            locked = await connection.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": _ADVISORY_LOCK_KEY}
+            )
+            await connection.commit()
+            if not locked.scalar_one():
+                logger.debug("Partition maintenance is running in another process")
+                yield None
+                return
+            try:
+                yield connection
+            finally:
+                await connection.rollback()
+                await connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": _ADVISORY_LOCK_KEY})
+                await connection.commit()
+
+    def start(self, interval: float) -> None:
+        """
+        Run the maintenance now and then periodically in the background.
+
+        Args:
+            interval (float): Seconds between two runs.
+        """
+
+        async def loop() -> None:
+            while True:
+                try:
+                    await self.maintain()
+                except Exception as exc:
+                    logger.error("Failed to maintain the %s partitions: %s", TABLE, exc)
+                await asyncio.sleep(interval)
+
+        self._task = asyncio.create_task(loop())
+
+    async def stop(self) -> None:
+        """Stop the periodic maintenance."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+async def main(command: str) -> Any:
+    config = settings.partitions
+    engine = create_async_engine(settings.db.connection_url(), poolclass=NullPool)
+    partitions = IncidentPartitions(
+        engine,
+        months_ahead=config.months_ahead,
+        retention_months=config.retention_months,
+        retention_action=config.retention_action,
+        archive_schema=config.archive_schema,
+    )
+    # Only a Redis cache is shared with the application; the others live in its processes.
+    cache_backend = None
+    if settings.cache.backend == "redis":
+        # Imported here, the API package depends on this module through its providers.
+        from src.api.v1.incidents.cache import IncidentCache
+        from src.cache import RedisCache
+
+        cache_backend = RedisCache.from_url(settings.cache.redis_url)
+        cache = IncidentCache(cache_backend, ttl=settings.cache.ttl_seconds)
+
+        async def invalidate_cache(removed: List[str]) -> None:
+            await cache.invalidate_all()
+
+        partitions.on_removed = invalidate_cache
+    try:
+        if command == "list":
+            return [partition.to_dict() for partition in await partitions.list()]
+        if command == "ensure":
+            return {"created": await partitions.ensure()}
+        if command == "retain":
+            return {"removed": await partitions.retain()}
+        return await partitions.maintain()
+    finally:
+        await engine.dispose()
+        if cache_backend is not None:
+            await cache_backend.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Maintain the monthly partitions of the incidents table.",
+        epilog="Settings come from the PARTITIONS_* environment variables.",
+    )
+    parser.add_argument(
+        "command",
+        choices=["list", "ensure", "retain", "maintain"],
+        help="list partitions, create the upcoming ones, apply the retention, or both",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    print(json.dumps(asyncio.run(main(args.command)), indent=2))
@@ -0,0 +1,55 @@
+import time
+from dataclasses import dataclass
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+
+@dataclass
+class PoolWaitStats:
+    """
+    Statistics about waiting for a connection from the pool.
+
+    Attributes:
+        checkouts (int): Number of connections handed out by the pool.
+        timeouts (int): Number of checkouts that gave up after ``pool_timeout``.
+        wait_seconds_total (float): Total time spent waiting for connections.
+        max_wait_seconds (float): Longest single wait.
+    """
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    max_wait_seconds: float = 0.0
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool that measures how long checkouts wait for a connection.
+
+    The wait covers both queueing for a free connection and opening
+    a new one when the pool is allowed to grow.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started_at = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.wait_stats.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started_at
+            self.wait_stats.wait_seconds_total += waited
+            self.wait_stats.max_wait_seconds = max(self.wait_stats.max_wait_seconds, waited)
+
+        self.wait_stats.checkouts += 1
+        return connection
+
+    def recreate(self) -> "InstrumentedAsyncQueuePool":
+        pool = super().recreate()
+        pool.wait_stats = self.wait_stats
+        return pool
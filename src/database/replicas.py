@@ -0,0 +1,177 @@
+import asyncio
+import itertools
+import logging
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+
+logger = logging.getLogger(__name__)
+
+
+class ReplicaSet:
+    """
+    Round-robin routing of read-only sessions over a set of read replicas.
+
+    Replicas that fail a health check or lose their connection are taken out
+    of rotation until a later health check succeeds. Clients that recently
+    wrote can be pinned to the primary for a short window (read-your-writes).
+    Pins are kept per worker process.
+    """
+
+    def __init__(self, engines: List[AsyncEngine], read_your_writes_seconds: float) -> None:
+        """
+        Initialize the replica set.
+
+        Args:
+            engines (List[AsyncEngine]): Engines connected to the read replicas.
+            read_your_writes_seconds (float): How long a client is pinned to the
+                primary after a write, 0 to disable pinning.
+        """
+        self.engines = engines
+        self.read_your_writes_seconds = read_your_writes_seconds
+        self.session_factories = [
+            async_sessionmaker(bind=engine, expire_on_commit=False, autoflush=False)
+            for engine in engines
+        ]
+
+        self._healthy = [True] * len(engines)
+        self._next = itertools.count()
+        self._pinned: Dict[str, float] = {}
+        self._health_task: Optional[asyncio.Task] = None
+
+        for index, engine in enumerate(engines):
+            event.listen(engine.sync_engine, "do_connect", self._on_connect(index))
+            event.listen(engine.sync_engine, "handle_error", self._on_error(index))
+
+    def _on_connect(self, index: int):
+        """Build a ``do_connect`` listener taking a replica out of rotation when it refuses connections."""
+
+        def listener(dialect, connection_record, cargs, cparams):
+            try:
+                return dialect.connect(*cargs, **cparams)
+            except (OSError, dialect.loaded_dbapi.Error):
+                self.mark_unhealthy(index)
+                raise
+
+        return listener
+
+    def _on_error(self, index: int):
+        """Build a ``handle_error`` listener taking a replica out of rotation on disconnects."""
+
+        def listener(context: ExceptionContext) -> None:
+            if context.is_disconnect:
+                self.mark_unhealthy(index)
+
+        return listener
+
+    def mark_unhealthy(self, index: int) -> None:
+        """
+        Take a replica out of rotation until it passes a health check.
+
+        Args:
+            index (int): Position of the replica in ``engines``.
+        """
+        if self._healthy[index]:
+            logger.warning("Read replica #%d is unavailable, failing over", index)
+        self._healthy[index] = False
+
+    def pin(self, client_key: Optional[str]) -> None:
+        """
+        Route the reads of a client to the primary for ``read_your_writes_seconds``.
+
+        Args:
+            client_key (Optional[str]): Identifier of the client that wrote.
+        """
+        if client_key and self.read_your_writes_seconds > 0:
+            self._pinned[client_key] = time.monotonic() + self.read_your_writes_seconds
+
+    def is_pinned(self, client_key: Optional[str]) -> bool:
+        """
+        Check whether a client is currently pinned to the primary.
+
+        Args:
+            client_key (Optional[str]): Identifier of the client.
+
+        Returns:
+            bool: True if the client wrote within the read-your-writes window.
+        """
+        if not client_key:
+            return False
+
+        pinned_until = self._pinned.get(client_key)
+        if pinned_until is None:
+            return False
+        if pinned_until <= time.monotonic():
+            del self._pinned[client_key]
+            return False
+        return True
+
+    def session_factory(self, client_key: Optional[str] = None) -> Optional[async_sessionmaker[AsyncSession]]:
+        """
+        Pick the session factory of the next healthy replica.
+
+        Args:
+            client_key (Optional[str]): Identifier of the client issuing the read.
+
+        Returns:
+            Optional[async_sessionmaker[AsyncSession]]: A replica session factory,
+            or None when the read must go to the primary because no replica is
+            healthy or the client is pinned.
+        """
+        if not self.engines or self.is_pinned(client_key):
+            return None
+
+        for _ in range(len(self.engines)):
+            index = next(self._next) % len(self.engines)
+            if self._healthy[index]:
+                return self.session_factories[index]
+        return None
+
+    async def check_health(self, timeout: float = 5.0) -> None:
+        """
+        Ping every replica and update the rotation accordingly.
+
+        Args:
+            timeout (float): Seconds to wait for a replica to answer.
+        """
+        for index, engine in enumerate(self.engines):
+            try:
+                async with asyncio.timeout(timeout):
+                    async with engine.connect() as connection:
+                        await connection.execute(text("SELECT 1"))
+            except Exception as exc:
+                logger.debug("Health check of read replica #%d failed: %s", index, exc)
+                self.mark_unhealthy(index)
+            else:
+                if not self._healthy[index]:
+                    logger.info("Read replica #%d is back in rotation", index)
+                self._healthy[index] = True
+
+    def start_health_checks(self, interval: float) -> None:
+        """
+        Run ``check_health`` periodically in the background.
+
+        Args:
+            interval (float): Seconds between two health checks.
+        """
+        if not self.engines or self._health_task is not None:
+            return
+
+        async def loop() -> None:
+            while True:
+                await self.check_health()
+                await asyncio.sleep(interval)
+
+        self._health_task = asyncio.create_task(loop())
+
+    async def dispose(self) -> None:
+        """Stop the health checks and dispose of the replica engines."""
+        if self._health_task is not None:
+            self._health_task.cancel()
+            self._health_task = None
+        for engine in self.engines:
+            await engine.dispose()
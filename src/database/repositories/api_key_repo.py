@@ -0,0 +1,22 @@
+from typing import Sequence
+
+from sqlalchemy import Row, select
+
+from src.database.models import ApiKey
+from src.database.repositories import BaseRepo
+
+
+class ApiKeyRepo(BaseRepo):
+    """
+    Repository for operations on ApiKey table.
+    """
+
+    async def list_active(self) -> Sequence[Row]:
+        """
+        List the keys that are currently accepted.
+
+        Returns:
+            Sequence[Row]: Rows with ``name``, ``key_hash`` and ``scopes`` columns.
+        """
+        stmt = select(ApiKey.name, ApiKey.key_hash, ApiKey.scopes).where(ApiKey.is_active)
+        return (await self.session.execute(stmt)).all()
@@ -0,0 +1,177 @@
+import json
+from datetime import timezone
+from typing import Any, ClassVar, Dict, Iterable, List, Mapping, Sequence
+
+from sqlalchemy import Row, delete, insert, select, text
+
+from src.core.config.settings import settings
+from src.database.models import IncidentEvent
+from src.database.models.enums import IncidentEventType
+from src.database.repositories import BaseRepo
+
+
+def incident_event_payload(incident: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Build the payload of an incident change event.
+
+    The payload mirrors the API representation of the incident, so consumers
+    can use it without fetching the incident again.
+
+    Args:
+        incident (Mapping[str, Any]): Incident values with ``id``, ``description``,
+            ``status``, ``source`` and ``created_at`` keys, and ``previous_status``
+            for status changes (e.g. ``Row._mapping``).
+
+    Returns:
+        Dict[str, Any]: JSON-serializable payload.
+    """
+    payload = {
+        "id": incident["id"],
+        "description": incident["description"],
+        "status": incident["status"].value,
+        "source": incident["source"].value,
+        "created_at": incident["created_at"].astimezone(timezone.utc).isoformat().replace("+00:00", "Z"),
+    }
+    if incident.get("previous_status") is not None:
+        payload["previous_status"] = incident["previous_status"].value
+    return payload
+
+
+# Same message as the notify_incident_event() trigger of the outbox table, for events that are not stored.
+_NOTIFY_EVENTS = text("""
+    SELECT pg_notify('incident_events', CASE WHEN octet_length(event.message) > 7900 THEN event.short ELSE event.message END)
+    FROM (
+        SELECT
+            json_build_object(
+                'id', numbered.id,
+                'incident_id', (numbered.payload ->> 'id')::integer,
+                'event_type', CAST(:event_type AS text),
+                'xid', pg_current_xact_id()::text,
+                'payload', numbered.payload
+            )::text AS message,
+            json_build_object(
+                'id', numbered.id,
+                'incident_id', (numbered.payload ->> 'id')::integer,
+                'event_type', CAST(:event_type AS text),
+                'xid', pg_current_xact_id()::text,
+                'payload', numbered.payload - 'description'
+            )::text AS short
+        FROM (
+            SELECT nextval('incident_events_id_seq') AS id, element.payload
+            FROM jsonb_array_elements(CAST(:payloads AS jsonb)) WITH ORDINALITY AS element(payload, position)
+            ORDER BY element.position
+        ) AS numbered
+    ) AS event
+""")
+
+
+class IncidentEventRepo(BaseRepo):
+    """
+    Repository for operations on IncidentEvent table (the incident outbox).
+
+    Events are added in the caller's transaction and never committed here,
+    so they become visible exactly when the change they describe does.
+
+    Only the outbox relay deletes stored events, so events are stored only
+    when a sink is configured. Otherwise they are sent straight to the
+    ``incident_events`` listeners, as the outbox trigger would, when the live
+    feed or the stats use them, and dropped when nothing does.
+
+    Attributes:
+        store (bool): Whether events are written to the outbox table.
+        notify (bool): Whether events that are not stored are notified.
+    """
+    store: ClassVar[bool] = settings.outbox.sink is not None
+    notify: ClassVar[bool] = settings.stream.enabled or settings.stats.enabled
+
+    async def add_events(
+        self, event_type: IncidentEventType, payloads: Iterable[Dict[str, Any]]
+    ) -> None:
+        """
+        Add events of one type with a single multi-row INSERT, without committing.
+
+        Args:
+            event_type (IncidentEventType): Type of the events.
+            payloads (Iterable[Dict[str, Any]]): Payloads built with ``incident_event_payload``.
+        """
+        if not self.store:
+            await self._notify_events(event_type, payloads)
+            return
+
+        rows = [
+            {"incident_id": payload["id"], "event_type": event_type.value, "payload": payload}
+            for payload in payloads
+        ]
+        if rows:
+            await self.session.execute(insert(IncidentEvent), rows)
+
+    async def copy_events(
+        self, event_type: IncidentEventType, payloads: Iterable[Dict[str, Any]]
+    ) -> None:
+        """
+        Add events through the asyncpg binary COPY protocol, without committing.
+
+        Args:
+            event_type (IncidentEventType): Type of the events.
+            payloads (Iterable[Dict[str, Any]]): Payloads built with ``incident_event_payload``.
+        """
+        if not self.store:
+            await self._notify_events(event_type, payloads)
+            return
+
+        records = [
+            (payload["id"], event_type.value, json.dumps(payload))
+            for payload in payloads
+        ]
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            IncidentEvent.__tablename__,
+            records=records,
+            columns=["incident_id", "event_type", "payload"],
+        )
+
+    async def _notify_events(
+        self, event_type: IncidentEventType, payloads: Iterable[Dict[str, Any]]
+    ) -> None:
+        """Notify events without storing them, in one statement delivered on commit."""
+        payloads = list(payloads)
+        if self.notify and payloads:
+            await self.session.execute(
+                _NOTIFY_EVENTS, {"event_type": event_type.value, "payloads": json.dumps(payloads)}
+            )
+
+    async def claim_batch(self, limit: int) -> List[Row]:
+        """
+        Remove the oldest unpublished events and return them, without committing.
+
+        Rows are locked with ``FOR UPDATE SKIP LOCKED``, so concurrent relays
+        claim disjoint batches. The caller commits after publishing the events,
+        or rolls back to put them back in the outbox.
+
+        Args:
+            limit (int): Maximum number of events to claim.
+
+        Returns:
+            List[Row]: ``(id, incident_id, event_type, payload, created_at)`` rows ordered by ID.
+        """
+        claimed = (
+            select(IncidentEvent.id)
+            .order_by(IncidentEvent.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        stmt = (
+            delete(IncidentEvent)
+            .where(IncidentEvent.id.in_(claimed))
+            .returning(
+                IncidentEvent.id,
+                IncidentEvent.incident_id,
+                IncidentEvent.event_type,
+                IncidentEvent.payload,
+                IncidentEvent.created_at,
+            )
+        )
+        rows: Sequence[Row] = (await self.session.execute(stmt)).all()
+        return sorted(rows, key=lambda row: row.id)
@@ -1,19 +1,49 @@
-from datetime import datetime, timezone
-from typing import List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Sequence, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import Float, Integer, Row, and_, any_, bindparam, func, insert, literal, select, tuple_, update
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.exc import NoResultFound
+from sqlalchemy.orm import aliased
 
 from src.database.models import Incident
-from src.database.models.enums import IncidentStatus
+from src.database.models.incident import SEARCH_CONFIG
+from src.database.models.enums import IncidentEventType, IncidentSource, IncidentStatus
 from src.database.repositories import BaseRepo
+from src.database.repositories.incident_event_repo import IncidentEventRepo, incident_event_payload
+
+
+INCIDENT_COLUMNS = (
+    Incident.id,
+    Incident.description,
+    Incident.status,
+    Incident.source,
+    Incident.created_at,
+)
+"""Columns selected by read-only queries that return plain rows instead of ORM objects."""
+
+SearchMode = Literal["fulltext", "substring", "fuzzy"]
+"""How ``IncidentRepo.search_incidents`` matches descriptions."""
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
 
 class IncidentRepo(BaseRepo):
     """
     Repository for operations on Incident table.
+
+    Every write also adds the matching change events to the ``incident_events``
+    outbox in the same transaction (see ``IncidentEventRepo`` for when they are
+    stored).
     """
 
+    @property
+    def events(self) -> IncidentEventRepo:
+        """Outbox repository bound to the same session."""
+        return IncidentEventRepo(self.session)
+
     async def create_incident(
         self,
         *,
@@ -39,34 +69,332 @@ class IncidentRepo(BaseRepo):
             created_at=datetime.now(timezone.utc),
         )
         self.add(incident)
+        await self.session.flush()
+        await self.events.add_events(
+            IncidentEventType.CREATED,
+            [incident_event_payload({column.key: getattr(incident, column.key) for column in INCIDENT_COLUMNS})],
+        )
         await self.commit()
         return incident
 
+    async def create_incidents(
+        self,
+        items: Sequence[Dict[str, Any]],
+        *,
+        chunk_size: int,
+    ) -> List[int]:
+        """
+        Insert many incidents with one multi-row INSERT ... RETURNING per chunk.
+
+        All chunks are inserted in a single transaction which is committed at the end.
+
+        Args:
+            items (Sequence[Dict[str, Any]]): Incident values with ``description``,
+                ``status`` and ``source`` keys.
+            chunk_size (int): Maximum number of rows per INSERT statement.
+
+        Returns:
+            List[int]: IDs of the created incidents, in the order of ``items``.
+        """
+        created_at = datetime.now(timezone.utc)
+        stmt = (
+            insert(Incident)
+            .returning(Incident.id, sort_by_parameter_order=True)
+            .execution_options(insertmanyvalues_page_size=chunk_size)
+        )
+
+        ids: List[int] = []
+        for start in range(0, len(items), chunk_size):
+            chunk = [
+                {**item, "created_at": created_at}
+                for item in items[start:start + chunk_size]
+            ]
+            result = await self.session.execute(stmt, chunk)
+            chunk_ids = result.scalars().all()
+            await self.events.add_events(
+                IncidentEventType.CREATED,
+                [
+                    incident_event_payload({**values, "id": incident_id})
+                    for incident_id, values in zip(chunk_ids, chunk)
+                ],
+            )
+            ids.extend(chunk_ids)
+
+        await self.commit()
+        return ids
+
+    async def insert_incidents(self, items: Sequence[Dict[str, Any]]) -> Sequence[Row]:
+        """
+        Insert a batch of incidents with a single INSERT ... RETURNING and commit it.
+
+        Args:
+            items (Sequence[Dict[str, Any]]): Incident values with ``description``,
+                ``status`` and ``source`` keys.
+
+        Returns:
+            Sequence[Row]: Full rows of the created incidents, in the order of ``items``.
+        """
+        created_at = datetime.now(timezone.utc)
+        stmt = (
+            insert(Incident)
+            .returning(*INCIDENT_COLUMNS, sort_by_parameter_order=True)
+            .execution_options(insertmanyvalues_page_size=max(len(items), 1))
+        )
+        result = await self.session.execute(
+            stmt, [{**item, "created_at": created_at} for item in items]
+        )
+        rows = result.all()
+        await self.events.add_events(
+            IncidentEventType.CREATED,
+            [incident_event_payload(row._mapping) for row in rows],
+        )
+
+        await self.commit()
+        return rows
+
+    async def copy_incidents(self, items: Sequence[Dict[str, Any]]) -> List[int]:
+        """
+        Insert many incidents through the asyncpg binary COPY protocol.
+
+        COPY cannot return generated keys, so IDs are reserved from the table
+        sequence up front and written explicitly.
+
+        Args:
+            items (Sequence[Dict[str, Any]]): Incident values with ``description``,
+                ``status`` and ``source`` keys.
+
+        Returns:
+            List[int]: IDs of the created incidents, in the order of ``items``.
+        """
+        table = Incident.__table__
+        sequence = func.pg_get_serial_sequence(table.name, table.c.id.name)
+        result = await self.session.execute(
+            select(func.nextval(sequence)).select_from(func.generate_series(1, len(items)))
+        )
+        ids = list(result.scalars().all())
+
+        created_at = datetime.now(timezone.utc)
+        records = [
+            (incident_id, item["description"], item["status"].name, item["source"].name, created_at)
+            for incident_id, item in zip(ids, items)
+        ]
+
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            table.name,
+            records=records,
+            columns=["id", "description", "status", "source", "created_at"],
+        )
+        await self.events.copy_events(
+            IncidentEventType.CREATED,
+            [
+                incident_event_payload({**item, "id": incident_id, "created_at": created_at})
+                for incident_id, item in zip(ids, items)
+            ],
+        )
+
+        await self.commit()
+        return ids
+
     async def list_incidents(
-        self, *, status: Optional[IncidentStatus] = None
-    ) -> List[Incident]:
+        self,
+        *,
+        status: Optional[IncidentStatus] = None,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> Sequence[Row]:
         """
-        Get a list of incidents, optionally filtered by status.
+        Get a page of incidents, newest first, optionally filtered by status.
+
+        Uses keyset pagination on ``(created_at, id)`` so that every page is
+        served by the same index range scan regardless of its depth.
+        Plain column rows are returned, skipping ORM hydration and the identity map.
 
         Args:
             status (Optional[IncidentStatus]): Filter incidents by status.
+            limit (int): Maximum number of incidents to return.
+            after (Optional[Tuple[datetime, int]]): The ``(created_at, id)`` of the
+                last incident on the previous page; only older incidents are returned.
 
         Returns:
-            List[Incident]: List of Incident objects.
+            Sequence[Row]: Incident rows.
         """
-        stmt = select(Incident)
+        stmt = (
+            select(*INCIDENT_COLUMNS)
+            .order_by(Incident.created_at.desc(), Incident.id.desc())
+            .limit(limit)
+        )
         if status:
             stmt = stmt.where(Incident.status == status)
+        if after:
+            stmt = stmt.where(tuple_(Incident.created_at, Incident.id) < after)
 
         result = await self.session.execute(stmt)
-        return result.scalars().all()
+        return result.all()
+
+    async def stream_incidents(
+        self,
+        *,
+        status: Optional[IncidentStatus] = None,
+        source: Optional[IncidentSource] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        batch_size: int,
+    ) -> AsyncIterator[Sequence[Row]]:
+        """
+        Stream incidents in batches through a server-side cursor.
+
+        Selects plain columns instead of ORM objects, so rows are never
+        added to the identity map and memory usage stays bounded by the batch size.
+
+        Args:
+            status (Optional[IncidentStatus]): Filter incidents by status.
+            source (Optional[IncidentSource]): Filter incidents by source.
+            created_from (Optional[datetime]): Include incidents created at or after this time.
+            created_to (Optional[datetime]): Include incidents created before this time.
+            batch_size (int): Number of rows fetched from the cursor per batch.
+
+        Yields:
+            Sequence[Row]: Batches of incident rows ordered by ID.
+        """
+        stmt = (
+            select(*INCIDENT_COLUMNS)
+            .order_by(Incident.id)
+            .execution_options(yield_per=batch_size)
+        )
+        if status:
+            stmt = stmt.where(Incident.status == status)
+        if source:
+            stmt = stmt.where(Incident.source == source)
+        if created_from:
+            stmt = stmt.where(Incident.created_at >= created_from)
+        if created_to:
+            stmt = stmt.where(Incident.created_at < created_to)
+
+        result = await self.session.stream(stmt)
+        async for rows in result.partitions():
+            yield rows
+
+    async def search_incidents(
+        self,
+        *,
+        query: str,
+        mode: SearchMode,
+        status: Optional[IncidentStatus] = None,
+        source: Optional[IncidentSource] = None,
+        limit: int,
+        candidates: int,
+        after: Optional[Tuple[float, int]] = None,
+    ) -> Sequence[Row]:
+        """
+        Get a page of incidents whose description matches a query, best matches first.
+
+        Modes:
+            fulltext   ``websearch_to_tsquery`` syntax (words, "phrases", or, -not)
+                       against ``search_vector`` (GIN index), ranked by ``ts_rank``
+            substring  case-insensitive substring (trigram GIN index), ranked by
+                       ``similarity``
+            fuzzy      words similar to the query (``<%`` operator, trigram GIN
+                       index), ranked by ``word_similarity``
+
+        Only the ``candidates`` most recent matches are ranked, so that broad
+        queries matching a large share of the table cost no more than specific
+        ones: the matches are found newest first (through the ``created_at``
+        index or the search index, whichever the planner deems cheaper) and
+        older ones are never returned. Uses keyset pagination on ``(rank, id)``
+        within the candidates.
+
+        Args:
+            query (str): The search query.
+            mode (SearchMode): How descriptions are matched.
+            status (Optional[IncidentStatus]): Filter incidents by status.
+            source (Optional[IncidentSource]): Filter incidents by source.
+            limit (int): Maximum number of incidents to return.
+            candidates (int): Maximum number of most recent matches ranked.
+            after (Optional[Tuple[float, int]]): The ``(rank, id)`` of the last
+                incident on the previous page; only lower ranked incidents are returned.
+
+        Returns:
+            Sequence[Row]: Incident rows with an extra ``rank`` column.
+        """
+        ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+        columns = list(INCIDENT_COLUMNS)
+        if mode == "fulltext":
+            condition = Incident.search_vector.bool_op("@@")(ts_query)
+            columns.append(Incident.search_vector)
+        elif mode == "substring":
+            condition = Incident.description.ilike(f"%{_escape_like(query)}%", escape="\\")
+        else:
+            condition = literal(query).bool_op("<%")(Incident.description)
+
+        matches = (
+            select(*columns)
+            .where(condition)
+            .order_by(Incident.created_at.desc(), Incident.id.desc())
+            .limit(candidates)
+        )
+        if status:
+            matches = matches.where(Incident.status == status)
+        if source:
+            matches = matches.where(Incident.source == source)
+        matches = matches.subquery("matches")
+
+        if mode == "fulltext":
+            rank = func.ts_rank(matches.c.search_vector, ts_query, type_=Float)
+        elif mode == "substring":
+            rank = func.similarity(matches.c.description, query, type_=Float)
+        else:
+            rank = func.word_similarity(query, matches.c.description, type_=Float)
+
+        stmt = (
+            select(*(matches.c[column.key] for column in INCIDENT_COLUMNS), rank.label("rank"))
+            .order_by(rank.desc(), matches.c.id.desc())
+            .limit(limit)
+        )
+        if after:
+            stmt = stmt.where(tuple_(rank, matches.c.id) < after)
+
+        result = await self.session.execute(stmt)
+        return result.all()
+
+    async def get_incident(self, *, incident_id: int) -> Row:
+        """
+        Get a single incident by ID.
+
+        Without ``created_at`` the partition is unknown, so the primary key
+        index of every partition is probed.
+
+        Args:
+            incident_id (int): ID of the incident.
+
+        Raises:
+            NoResultFound: If no incident with the given ID exists.
+
+        Returns:
+            Row: The incident row.
+        """
+        stmt = select(*INCIDENT_COLUMNS).where(Incident.id == incident_id)
+        result = await self.session.execute(stmt)
+        incident = result.one_or_none()
+
+        if not incident:
+            raise NoResultFound(f"Incident with id {incident_id} not found.")
+
+        return incident
 
     async def update_status(
         self, *, incident_id: int, new_status: IncidentStatus
-    ) -> Incident:
+    ) -> Row:
         """
         Update the status of an incident by ID.
 
+        Runs a single ``UPDATE ... RETURNING`` statement, so the incident is
+        neither loaded beforehand nor tracked by the session identity map.
+        The status before the update is locked and read in the same statement
+        and returned as ``previous_status``; the update then targets the full
+        primary key, so only the partition holding the incident is touched.
+
         Args:
             incident_id (int): ID of the incident to update.
             new_status (IncidentStatus): New status to set.
@@ -75,15 +403,141 @@ class IncidentRepo(BaseRepo):
             NoResultFound: If no incident with the given ID exists.
 
         Returns:
-            Incident: The updated Incident instance.
+            Row: The updated incident row with an extra ``previous_status`` column.
         """
-        stmt = select(Incident).where(Incident.id == incident_id)
+        previous = (
+            select(Incident.id, Incident.created_at, Incident.status)
+            .where(Incident.id == incident_id)
+            .with_for_update()
+            .cte("previous")
+        )
+        stmt = (
+            update(Incident)
+            .where(Incident.id == previous.c.id, Incident.created_at == previous.c.created_at)
+            .values(status=new_status)
+            .returning(*INCIDENT_COLUMNS, previous.c.status.label("previous_status"))
+            .execution_options(synchronize_session=False)
+        )
         result = await self.session.execute(stmt)
-        incident = result.scalar_one_or_none()
+        incident = result.one_or_none()
 
         if not incident:
             raise NoResultFound(f"Incident with id {incident_id} not found.")
 
-        incident.status = new_status
+        await self.events.add_events(
+            IncidentEventType.STATUS_CHANGED,
+            [incident_event_payload(incident._mapping)],
+        )
         await self.commit()
         return incident
+
+    async def update_statuses(
+        self, *, incident_ids: Sequence[int], new_status: IncidentStatus
+    ) -> Sequence[Row]:
+        """
+        Update the status of many incidents with a single statement.
+
+        The IDs are sent as one array parameter, so the statement size does not
+        depend on the number of IDs.
+
+        Args:
+            incident_ids (Sequence[int]): IDs of the incidents to update.
+            new_status (IncidentStatus): New status to set.
+
+        Returns:
+            Sequence[Row]: Updated incident rows with an extra ``previous_status``
+            column, for the incidents that exist.
+        """
+        ids_param = bindparam("incident_ids", list(incident_ids), type_=ARRAY(Integer))
+        previous = (
+            select(Incident.id, Incident.created_at, Incident.status)
+            .where(Incident.id == any_(ids_param))
+            .with_for_update()
+            .cte("previous")
+        )
+        stmt = (
+            update(Incident)
+            .where(Incident.id == previous.c.id, Incident.created_at == previous.c.created_at)
+            .values(status=new_status)
+            .returning(*INCIDENT_COLUMNS, previous.c.status.label("previous_status"))
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        updated = result.all()
+        await self.events.add_events(
+            IncidentEventType.STATUS_CHANGED,
+            [incident_event_payload(row._mapping) for row in updated],
+        )
+
+        await self.commit()
+        return updated
+
+    async def count_by_status_and_source(self) -> Sequence[Row]:
+        """
+        Count the incidents of every status and source.
+
+        Returns:
+            Sequence[Row]: ``(status, source, count)`` rows for the pairs that have incidents.
+        """
+        stmt = (
+            select(Incident.status, Incident.source, func.count().label("count"))
+            .group_by(Incident.status, Incident.source)
+        )
+        return (await self.session.execute(stmt)).all()
+
+    async def count_created_per_hour(self, *, since: datetime) -> Sequence[Row]:
+        """
+        Count the incidents created per UTC hour and source.
+
+        Args:
+            since (datetime): Only count incidents created at or after this time.
+
+        Returns:
+            Sequence[Row]: ``(hour, source, count)`` rows for the hours that have incidents.
+        """
+        hour = func.date_trunc("hour", Incident.created_at, "UTC").label("hour")
+        stmt = (
+            select(hour, Incident.source, func.count().label("count"))
+            .where(Incident.created_at >= since)
+            .group_by(hour, Incident.source)
+        )
+        return (await self.session.execute(stmt)).all()
+
+    async def find_duplicates(
+        self, *, incident_ids: Sequence[int], window: timedelta
+    ) -> Sequence[Row]:
+        """
+        Find earlier open incidents that look like the same problem.
+
+        An incident is a duplicate candidate of an earlier NEW or IN_PROGRESS
+        incident with the same description and source created at most ``window``
+        before it.
+
+        Args:
+            incident_ids (Sequence[int]): IDs of the incidents to check.
+            window (timedelta): How far back to look for earlier incidents.
+
+        Returns:
+            Sequence[Row]: ``(id, duplicate_of)`` rows, ``duplicate_of`` being the
+            earliest matching incident, for the incidents that have one.
+        """
+        ids_param = bindparam("incident_ids", list(incident_ids), type_=ARRAY(Integer))
+        created = aliased(Incident, name="created")
+        earlier = aliased(Incident, name="earlier")
+        stmt = (
+            select(created.id, func.min(earlier.id).label("duplicate_of"))
+            .join(
+                earlier,
+                and_(
+                    earlier.source == created.source,
+                    earlier.description == created.description,
+                    earlier.created_at >= created.created_at - window,
+                    earlier.created_at <= created.created_at,
+                    earlier.id < created.id,
+                    earlier.status.in_([IncidentStatus.NEW, IncidentStatus.IN_PROGRESS]),
+                ),
+            )
+            .where(created.id == any_(ids_param))
+            .group_by(created.id)
+        )
+        return (await self.session.execute(stmt)).all()
@@ -0,0 +1,75 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.database.replicas import ReplicaSet
+
+
+class RequestSessions:
+    """
+    Opens short-lived sessions for the units of work of one request.
+
+    Nothing is opened when the object is created: every ``write()`` or
+    ``read()`` block gets its own session, which checks a connection out
+    of the pool on its first statement and returns it when the block ends.
+    Requests answered from the cache therefore never touch the pool, and
+    no connection is held while a response is being encoded or sent.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        replicas: ReplicaSet,
+        client_key: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize the request sessions.
+
+        Args:
+            session_factory (async_sessionmaker[AsyncSession]): Factory of primary sessions.
+            replicas (ReplicaSet): Read replicas used by ``read()``.
+            client_key (Optional[str]): Identifier of the client, used for read-your-writes.
+        """
+        self.session_factory = session_factory
+        self.replicas = replicas
+        self.client_key = client_key
+
+    @asynccontextmanager
+    async def write(self) -> AsyncIterator[AsyncSession]:
+        """
+        Open a session on the primary for one unit of work.
+
+        The unit of work is expected to commit before the block ends; anything
+        left uncommitted is rolled back. When the block succeeds the client is
+        pinned to the primary for the read-your-writes window.
+
+        Yields:
+            AsyncSession: A session bound to the primary.
+        """
+        async with self.session_factory() as session:
+            yield session
+        self.pin()
+
+    @asynccontextmanager
+    async def read(self, primary: bool = False) -> AsyncIterator[AsyncSession]:
+        """
+        Open a session for read-only queries.
+
+        Args:
+            primary (bool): Whether to read from the primary regardless of the
+                replicas, for results that must not lag behind committed writes.
+
+        Yields:
+            AsyncSession: A session bound to the next healthy read replica,
+            or to the primary when asked for, when no replica is available
+            or when the client wrote recently.
+        """
+        session_factory = None if primary else self.replicas.session_factory(self.client_key)
+        session_factory = session_factory or self.session_factory
+        async with session_factory() as session:
+            yield session
+
+    def pin(self) -> None:
+        """Pin the client to the primary after a write committed outside ``write()``."""
+        self.replicas.pin(self.client_key)
@@ -1,40 +1,57 @@
-from fastapi import Security
+__all__ = [
+    "ApiKeyIndex",
+    "ApiKeyInfo",
+    "ApiKeyMiddleware",
+    "api_key_index",
+    "hash_api_key",
+    "setup_auth",
+]
 
-from fastapi.security.api_key import APIKey, APIKeyHeader
+from typing import Any, Dict
 
-from src.core.infra.exceptions import NotApiKey, InvalidApiKey
-from src.core.config.settings import settings
+from fastapi import FastAPI
 
+from .keys import ApiKeyIndex, ApiKeyInfo, api_key_index, hash_api_key
+from .middleware import ApiKeyMiddleware
 
-api_key_header = APIKeyHeader(
-    name="x-api-key",
-    auto_error=False,
-    scheme_name="x-api-key",
-    description="Авторизация по API key",
-)
 
+API_KEY_SCHEME = {
+    "type": "apiKey",
+    "in": "header",
+    "name": "x-api-key",
+    "description": "Авторизация по API key",
+}
 
-async def auth_guard(api_key: APIKey = Security(api_key_header)) -> APIKey:
+
+def setup_auth(app: FastAPI, path_prefix: str = "/api") -> None:
     """
-    Guard that enforces API-key authorization.
+    Enforce API-key authorization on every path under ``path_prefix``.
 
-    Ensures that a request includes the header “x-api-key” and that its value
-    matches the configured API key (settings.app.api_key). If the header is
-    missing or the key is invalid, raises the respective exception.
+    Installs ApiKeyMiddleware with the global key index, exposes the index
+    as ``app.state.api_key_index`` for the lifespan, and documents the
+    ``x-api-key`` security scheme on the protected operations of the
+    OpenAPI schema.
 
     Args:
-        api_key (APIKey): The API key value extracted from the “x-api-key” header via FastAPI’s
-                         Security mechanism.
+        app (FastAPI): The FastAPI application.
+        path_prefix (str): Prefix of the paths requiring an API key.
+    """
+    app.state.api_key_index = api_key_index
+    app.add_middleware(ApiKeyMiddleware, index=api_key_index, path_prefix=path_prefix)
 
-    Returns:
-        APIKey: The validated API key.
+    build_openapi = app.openapi
 
-    Raises:
-        NotApiKey: If no API key header was provided.
-        InvalidApiKey: If the provided API key does not match the expected value.
-    """
-    if not api_key:
-        raise NotApiKey(detail="Api key not found")
-    if api_key != settings.app.api_key:
-        raise InvalidApiKey(detail="Invalid api key")
-    return api_key
+    def openapi() -> Dict[str, Any]:
+        if app.openapi_schema:
+            return app.openapi_schema
+
+        schema = build_openapi()
+        components = schema.setdefault("components", {})
+        components.setdefault("securitySchemes", {})["x-api-key"] = API_KEY_SCHEME
+        for path, operations in schema.get("paths", {}).items():
+            if path.startswith(path_prefix):
+                for operation in operations.values():
+                    operation["security"] = [{"x-api-key": []}]
+        return schema
+
+    app.openapi = openapi
@@ -0,0 +1,178 @@
+import asyncio
+import hashlib
+import logging
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional
+
+from src.core.config.settings import settings
+from src.database.helper import db_helper
+from src.database.repositories.api_key_repo import ApiKeyRepo
+
+
+logger = logging.getLogger(__name__)
+
+ALL_SCOPES = "*"
+
+
+def hash_api_key(api_key: str | bytes) -> str:
+    """
+    Hash an API key the way it is stored in settings and in the database.
+
+    Args:
+        api_key (str | bytes): The plain API key.
+
+    Returns:
+        str: Hex-encoded SHA-256 hash of the key.
+    """
+    if isinstance(api_key, str):
+        api_key = api_key.encode()
+    return hashlib.sha256(api_key).hexdigest()
+
+
+@dataclass(frozen=True)
+class ApiKeyInfo:
+    """
+    An accepted API key.
+
+    Attributes:
+        name (str): Name of the key owner.
+        key_hash (str): Hex-encoded SHA-256 hash of the key.
+        scopes (FrozenSet[str]): Scopes granted to the key.
+    """
+    name: str
+    key_hash: str
+    scopes: FrozenSet[str]
+
+    def allows(self, scope: str) -> bool:
+        """Whether the key grants ``scope``."""
+        return ALL_SCOPES in self.scopes or scope in self.scopes
+
+
+def parse_api_key_entry(entry: str) -> ApiKeyInfo:
+    """
+    Parse a ``name:sha256_hex:scope|scope`` entry of the ``API_KEYS`` setting.
+
+    Args:
+        entry (str): The entry to parse.
+
+    Returns:
+        ApiKeyInfo: The parsed key.
+
+    Raises:
+        ValueError: If the entry is malformed.
+    """
+    parts = entry.strip().split(":", 2)
+    if len(parts) != 3 or len(parts[1]) != 64:
+        raise ValueError(f"Malformed API key entry for {parts[0]!r}")
+    name, key_hash, scopes = parts
+    return ApiKeyInfo(
+        name=name,
+        key_hash=key_hash.lower(),
+        scopes=frozenset(scope for scope in scopes.split("|") if scope),
+    )
+
+
+class ApiKeyIndex:
+    """
+    In-memory index of the accepted API keys, looked up by key hash.
+
+    Keys come from settings and, optionally, from the ``api_keys`` table,
+    which is reloaded periodically. Request counters are kept per key name
+    and survive reloads.
+    """
+
+    def __init__(self, static_keys: Iterable[ApiKeyInfo] = ()) -> None:
+        """
+        Initialize the index.
+
+        Args:
+            static_keys (Iterable[ApiKeyInfo]): Keys that are always accepted.
+        """
+        self.static_keys = list(static_keys)
+        self.requests: Counter[str] = Counter()
+        self.rejected: Counter[str] = Counter()
+
+        self._keys: Dict[str, ApiKeyInfo] = {}
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.replace([])
+
+    def replace(self, keys: Iterable[ApiKeyInfo]) -> None:
+        """
+        Replace the non-static keys of the index.
+
+        Args:
+            keys (Iterable[ApiKeyInfo]): Keys loaded from the database.
+        """
+        self._keys = {key.key_hash: key for key in (*self.static_keys, *keys)}
+
+    def lookup(self, api_key: bytes) -> Optional[ApiKeyInfo]:
+        """
+        Find the key matching a presented API key by the hash of the key.
+
+        Args:
+            api_key (bytes): The raw value of the ``x-api-key`` header.
+
+        Returns:
+            Optional[ApiKeyInfo]: The matching key, or None if it is not accepted.
+        """
+        return self._keys.get(hash_api_key(api_key))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def keys(self) -> List[ApiKeyInfo]:
+        """List the accepted keys ordered by name."""
+        return sorted(self._keys.values(), key=lambda key: key.name)
+
+    async def refresh(self) -> None:
+        """Reload the keys of the ``api_keys`` table."""
+        async with db_helper.session_factory() as session:
+            rows = await ApiKeyRepo(session).list_active()
+
+        self.replace(
+            ApiKeyInfo(name=row.name, key_hash=row.key_hash.lower(), scopes=frozenset(row.scopes))
+            for row in rows
+        )
+        logger.debug("Loaded %d API keys", len(self))
+
+    async def start_refresh(self, interval: float) -> None:
+        """
+        Load the database keys and keep reloading them in the background.
+
+        Args:
+            interval (float): Seconds between two reloads.
+        """
+        await self.refresh()
+
+        async def loop() -> None:
+            while True:
+                await asyncio.sleep(interval)
+                try:
+                    await self.refresh()
+                except Exception as exc:
+                    logger.error("Failed to reload API keys: %s", exc)
+
+        self._refresh_task = asyncio.create_task(loop())
+
+    def stop_refresh(self) -> None:
+        """Stop reloading the database keys."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+
+
+def _static_keys() -> List[ApiKeyInfo]:
+    """Build the keys configured in settings, including the legacy ``API_KEY``."""
+    keys = [parse_api_key_entry(entry) for entry in settings.auth.api_keys]
+    if settings.app.api_key:
+        keys.append(ApiKeyInfo(
+            name="default",
+            key_hash=hash_api_key(settings.app.api_key),
+            scopes=frozenset({ALL_SCOPES}),
+        ))
+    return keys
+
+
+api_key_index: ApiKeyIndex = ApiKeyIndex(_static_keys())
+"""Global index of the accepted API keys."""
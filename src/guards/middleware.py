@@ -0,0 +1,122 @@
+from typing import Optional
+
+from fastapi import status
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.core.infra import ErrorJsonResponse, ErrorStatus
+from src.core.infra.timing import profile_phase
+
+from .keys import ApiKeyIndex
+
+
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+_API_KEY_HEADER = b"x-api-key"
+
+
+def required_scope(scope: Scope, path_prefix: str) -> str:
+    """
+    Derive the scope an API key needs for a request.
+
+    The scope is ``<area>:read`` for safe methods and WebSocket connections
+    and ``<area>:write`` otherwise, where the area is the first path segment
+    after the prefix (``/api/incidents/42`` -> ``incidents``).
+
+    Args:
+        scope (Scope): ASGI connection scope.
+        path_prefix (str): Prefix of the protected paths.
+
+    Returns:
+        str: The required scope.
+    """
+    area = scope["path"][len(path_prefix) + 1:].split("/", 1)[0]
+    if scope["type"] == "websocket" or scope["method"] in _SAFE_METHODS:
+        return f"{area}:read"
+    return f"{area}:write"
+
+
+class ApiKeyMiddleware:
+    """
+    ASGI middleware authorizing API requests by their ``x-api-key`` header.
+
+    Runs before routing and dependency resolution: the header is looked up
+    in the ApiKeyIndex, the key must grant the scope of the request, and the
+    matching ApiKeyInfo is stored as ``request.state.api_key``. Rejected
+    requests get the same error responses as the former dependency guard.
+    """
+
+    def __init__(self, app: ASGIApp, index: ApiKeyIndex, path_prefix: str = "/api") -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+            index (ApiKeyIndex): Index of the accepted keys.
+            path_prefix (str): Prefix of the paths requiring an API key.
+        """
+        self.app = app
+        self.index = index
+        self.path_prefix = path_prefix
+
+        self._missing = ErrorJsonResponse(
+            code=status.HTTP_401_UNAUTHORIZED,
+            message="API key not found",
+            status=ErrorStatus.UNAUTHENTICATED,
+        )
+        self._invalid = ErrorJsonResponse(
+            code=status.HTTP_403_FORBIDDEN,
+            message="Invalid API key",
+            status=ErrorStatus.PERMISSION_DENIED,
+        )
+
+    def _protects(self, path: str) -> bool:
+        prefix = self.path_prefix
+        return path.startswith(prefix) and (len(path) == len(prefix) or path[len(prefix)] == "/")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket") or not self._protects(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        with profile_phase("auth_guard"):
+            rejection = self._authorize(scope)
+        if rejection is not None:
+            await self._reject(scope, receive, send, rejection)
+            return
+        await self.app(scope, receive, send)
+
+    def _authorize(self, scope: Scope) -> Optional[ErrorJsonResponse]:
+        """Authorize a protected request, returning the response rejecting it if it is not."""
+        api_key = None
+        for name, value in scope["headers"]:
+            if name == _API_KEY_HEADER:
+                api_key = value
+                break
+
+        if not api_key:
+            self.index.rejected["missing"] += 1
+            return self._missing
+
+        info = self.index.lookup(api_key)
+        if info is None:
+            self.index.rejected["invalid"] += 1
+            return self._invalid
+
+        required = required_scope(scope, self.path_prefix)
+        if not info.allows(required):
+            self.index.rejected["scope"] += 1
+            return ErrorJsonResponse(
+                code=status.HTTP_403_FORBIDDEN,
+                message=f"API key does not grant the {required} scope",
+                status=ErrorStatus.PERMISSION_DENIED,
+            )
+
+        self.index.requests[info.name] += 1
+        scope.setdefault("state", {})["api_key"] = info
+        return None
+
+    @staticmethod
+    async def _reject(scope: Scope, receive: Receive, send: Send, response: ErrorJsonResponse) -> None:
+        if scope["type"] == "websocket":
+            await send({"type": "websocket.close", "code": 1008})
+            return
+        await response(scope, receive, send)
@@ -0,0 +1,11 @@
+__all__ = [
+    "BroadcastHub",
+    "IncidentStats",
+    "LiveEvent",
+    "PgNotifyListener",
+    "Subscription",
+]
+
+from .hub import BroadcastHub, LiveEvent, Subscription
+from .listener import PgNotifyListener
+from .stats import IncidentStats
@@ -0,0 +1,189 @@
+import asyncio
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, FrozenSet, Optional, Set
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class LiveEvent:
+    """
+    An incident change event broadcast to live feed clients.
+
+    Attributes:
+        id (int): ID of the outbox row the event was written to.
+        event_type (str): An ``IncidentEventType`` value.
+        status (str): Status of the incident after the change.
+        source (str): Source of the incident.
+        data (str): The event encoded once as JSON, sent as is to every client.
+    """
+    id: int
+    event_type: str
+    status: str
+    source: str
+    data: str
+
+    @classmethod
+    def build(cls, event_id: int, event_type: str, incident: Dict[str, Any]) -> "LiveEvent":
+        """
+        Build an event from an outbox payload.
+
+        Args:
+            event_id (int): ID of the outbox row.
+            event_type (str): An ``IncidentEventType`` value.
+            incident (Dict[str, Any]): The outbox payload (the incident in API representation).
+
+        Returns:
+            LiveEvent: The event.
+        """
+        return cls(
+            id=event_id,
+            event_type=event_type,
+            status=incident["status"],
+            source=incident["source"],
+            data=json.dumps({"id": event_id, "event_type": event_type, "incident": incident}),
+        )
+
+
+@dataclass(eq=False)
+class Subscription:
+    """
+    A live feed client registered with the hub.
+
+    Attributes:
+        statuses (FrozenSet[str]): Statuses to receive, empty for all.
+        sources (FrozenSet[str]): Sources to receive, empty for all.
+        queue (asyncio.Queue[Optional[LiveEvent]]): Events waiting to be sent;
+            None marks the end of the subscription.
+        evicted (bool): Whether the client was dropped for not keeping up.
+    """
+    statuses: FrozenSet[str]
+    sources: FrozenSet[str]
+    queue: asyncio.Queue[Optional[LiveEvent]]
+    evicted: bool = field(default=False)
+
+    def matches(self, event: LiveEvent) -> bool:
+        """Whether the event passes the status and source filters."""
+        return (
+            (not self.statuses or event.status in self.statuses)
+            and (not self.sources or event.source in self.sources)
+        )
+
+    async def events(self, timeout: Optional[float] = None) -> AsyncIterator[Optional[LiveEvent]]:
+        """
+        Iterate over the events of the subscription until it is closed.
+
+        Args:
+            timeout (Optional[float]): Seconds after which None is yielded when
+                no event arrived, so that callers can send heartbeats.
+
+        Yields:
+            Optional[LiveEvent]: The next event, or None after ``timeout``.
+        """
+        while True:
+            try:
+                event = await asyncio.wait_for(self.queue.get(), timeout)
+            except asyncio.TimeoutError:
+                yield None
+                continue
+            if event is None:
+                return
+            yield event
+
+
+class BroadcastHub:
+    """
+    Fan-out of incident change events to the live feed clients of a worker.
+
+    Every client has a bounded queue. Publishing never waits: a client whose
+    queue is full is evicted, its stream ends, and it is expected to reconnect
+    and resynchronise with ``GET /api/incidents``.
+    """
+
+    def __init__(self, queue_size: int) -> None:
+        """
+        Initialize the hub.
+
+        Args:
+            queue_size (int): Maximum number of events waiting for one client.
+        """
+        self.queue_size = queue_size
+        self.published = 0
+        self.evicted = 0
+
+        self._subscriptions: Set[Subscription] = set()
+
+    def __len__(self) -> int:
+        return len(self._subscriptions)
+
+    def subscribe(
+        self,
+        statuses: FrozenSet[str] = frozenset(),
+        sources: FrozenSet[str] = frozenset(),
+    ) -> Subscription:
+        """
+        Register a client.
+
+        Args:
+            statuses (FrozenSet[str]): Statuses to receive, empty for all.
+            sources (FrozenSet[str]): Sources to receive, empty for all.
+
+        Returns:
+            Subscription: The subscription; pass it to ``unsubscribe`` when the client leaves.
+        """
+        subscription = Subscription(
+            statuses=statuses,
+            sources=sources,
+            # One extra slot keeps room for the end marker.
+            queue=asyncio.Queue(maxsize=self.queue_size + 1),
+        )
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Unregister a client.
+
+        Args:
+            subscription (Subscription): The subscription of the client.
+        """
+        self._subscriptions.discard(subscription)
+
+    def publish(self, event: LiveEvent) -> None:
+        """
+        Queue an event for every matching client, evicting the clients that fell behind.
+
+        Args:
+            event (LiveEvent): The event to broadcast.
+        """
+        self.published += 1
+        for subscription in list(self._subscriptions):
+            if not subscription.matches(event):
+                continue
+            if subscription.queue.qsize() >= self.queue_size:
+                self._evict(subscription)
+            else:
+                subscription.queue.put_nowait(event)
+
+    def _evict(self, subscription: Subscription) -> None:
+        """Drop a slow client: discard its backlog and end its stream."""
+        self.evicted += 1
+        subscription.evicted = True
+        self._close(subscription)
+        logger.warning("Evicted a live feed client with %d pending events", self.queue_size)
+
+    def _close(self, subscription: Subscription) -> None:
+        """Unregister a client and end its stream after the events already queued."""
+        self._subscriptions.discard(subscription)
+        if subscription.evicted:
+            while not subscription.queue.empty():
+                subscription.queue.get_nowait()
+        subscription.queue.put_nowait(None)
+
+    def close(self) -> None:
+        """End the streams of all clients."""
+        for subscription in list(self._subscriptions):
+            self._close(subscription)
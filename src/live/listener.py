@@ -0,0 +1,181 @@
+import asyncio
+import json
+import logging
+from typing import Any, Optional
+
+import asyncpg
+from sqlalchemy.exc import NoResultFound
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.database.partitions import STATS_REBUILD_CHANNEL
+from src.database.repositories.incident_event_repo import incident_event_payload
+from src.database.repositories.incident_repo import IncidentRepo
+
+from .hub import BroadcastHub, LiveEvent
+from .stats import IncidentStats
+
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "incident_events"
+"""Channel notified by the ``incident_events_notify`` trigger."""
+
+
+class PgNotifyListener:
+    """
+    Single ``LISTEN incident_events`` subscriber of a worker process.
+
+    Uses a dedicated asyncpg connection outside of the pool, publishes every
+    notification to the broadcast hub and applies it to the incident stats, if kept.
+    The connection is re-established when it is lost; live feed clients miss
+    the notifications sent in the meantime, while the stats are rebuilt after
+    every (re)connection, periodically, and when incidents were removed in bulk
+    (``STATS_REBUILD_CHANNEL``).
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        hub: BroadcastHub,
+        stats: Optional[IncidentStats],
+        session_factory: async_sessionmaker[AsyncSession],
+        rebuild_seconds: float = 0.0,
+        reconnect_seconds: float = 1.0,
+    ) -> None:
+        """
+        Initialize the listener.
+
+        Args:
+            dsn (str): libpq connection string of the primary database.
+            hub (BroadcastHub): Hub the events are published to.
+            stats (Optional[IncidentStats]): Counters kept up to date with the
+                notifications, None when the stats are disabled.
+            session_factory (async_sessionmaker[AsyncSession]): Factory of primary sessions,
+                used to rebuild the stats and to load incidents whose event was too
+                large for a notification.
+            rebuild_seconds (float): Seconds between two rebuilds of the stats,
+                0 to only rebuild them on (re)connection.
+            reconnect_seconds (float): Pause before reconnecting after a failure.
+        """
+        self.dsn = dsn
+        self.hub = hub
+        self.stats = stats
+        self.session_factory = session_factory
+        self.rebuild_seconds = rebuild_seconds
+        self.reconnect_seconds = reconnect_seconds
+
+        self._task: Optional[asyncio.Task] = None
+        self._ready = asyncio.Event()
+        self._rebuild = asyncio.Event()
+        self._pending: set[asyncio.Task] = set()
+
+    def _on_notification(self, connection: Any, pid: int, channel: str, message: str) -> None:
+        notification = json.loads(message)
+        if self.stats is not None:
+            self.stats.apply(notification)
+
+        payload = notification["payload"]
+        if "description" not in payload:
+            task = asyncio.create_task(self._publish_loaded(notification))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+            return
+
+        self.hub.publish(LiveEvent.build(notification["id"], notification["event_type"], payload))
+
+    def _on_rebuild_request(self, connection: Any, pid: int, channel: str, message: str) -> None:
+        self._rebuild.set()
+
+    async def _publish_loaded(self, notification: dict) -> None:
+        """Publish an event sent without its payload, with the incident loaded from the database."""
+        try:
+            async with self.session_factory() as session:
+                incident = await IncidentRepo(session).get_incident(
+                    incident_id=notification["incident_id"]
+                )
+        except NoResultFound:
+            return
+        except Exception as exc:
+            logger.error("Failed to load incident #%d for the live feed: %s", notification["incident_id"], exc)
+            return
+
+        self.hub.publish(LiveEvent.build(
+            notification["id"], notification["event_type"], incident_event_payload(incident._mapping)
+        ))
+
+    async def _rebuild_stats(self) -> None:
+        if self.stats is not None:
+            await self.stats.rebuild(self.session_factory)
+
+    async def _listen(self, lost: asyncio.Event) -> None:
+        """Rebuild the stats, then periodically or on request until the connection is lost."""
+        self._rebuild.clear()
+        await self._rebuild_stats()
+        self._ready.set()
+
+        lost_wait = asyncio.create_task(lost.wait())
+        try:
+            while not lost.is_set():
+                rebuild_wait = asyncio.create_task(self._rebuild.wait())
+                try:
+                    await asyncio.wait(
+                        [lost_wait, rebuild_wait],
+                        timeout=self.rebuild_seconds or None,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                finally:
+                    rebuild_wait.cancel()
+                if not lost.is_set():
+                    self._rebuild.clear()
+                    await self._rebuild_stats()
+        finally:
+            lost_wait.cancel()
+
+    async def run(self) -> None:
+        """Listen until cancelled, reconnecting after failures."""
+        while True:
+            lost = asyncio.Event()
+            connection = None
+            try:
+                connection = await asyncpg.connect(self.dsn)
+                connection.add_termination_listener(lambda _: lost.set())
+                await connection.add_listener(CHANNEL, self._on_notification)
+                await connection.add_listener(STATS_REBUILD_CHANNEL, self._on_rebuild_request)
+                logger.info("Listening to %s notifications", CHANNEL)
+                await self._listen(lost)
+                logger.warning("Lost the %s listener connection, reconnecting", CHANNEL)
+            except Exception as exc:
+                logger.error("Failed to listen to %s notifications: %s", CHANNEL, exc)
+            finally:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+            await asyncio.sleep(self.reconnect_seconds)
+
+    async def start(self, timeout: float) -> None:
+        """
+        Run the listener in the background and wait until it listens and the stats are built.
+
+        Args:
+            timeout (float): Seconds to wait for the first connection.
+
+        Raises:
+            TimeoutError: If the listener could not connect in time; it keeps
+                trying in the background until stopped.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+        async with asyncio.timeout(timeout):
+            await self._ready.wait()
+
+    async def stop(self) -> None:
+        """Stop listening and end the streams of all clients."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for task in list(self._pending):
+            task.cancel()
+        self.hub.close()
@@ -0,0 +1,165 @@
+import logging
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from sqlalchemy import Text, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.database.models.enums import IncidentEventType, IncidentSource, IncidentStatus
+from src.database.repositories.incident_repo import IncidentRepo
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """
+    A PostgreSQL MVCC snapshot, as returned by ``pg_current_snapshot()``.
+
+    Attributes:
+        xmin (int): Transactions below this ID are finished.
+        xmax (int): Transactions at or above this ID had not started.
+        xip (FrozenSet[int]): Transactions in progress when the snapshot was taken.
+    """
+    xmin: int
+    xmax: int
+    xip: FrozenSet[int]
+
+    @classmethod
+    def parse(cls, value: str) -> "Snapshot":
+        """Parse the ``xmin:xmax:xip,...`` text representation."""
+        xmin, xmax, xip = value.split(":")
+        return cls(int(xmin), int(xmax), frozenset(int(xid) for xid in xip.split(",") if xid))
+
+    def sees(self, xid: int) -> bool:
+        """Whether the changes of a committed transaction are visible in the snapshot."""
+        return xid < self.xmin or (xid < self.xmax and xid not in self.xip)
+
+
+def _hour(value: datetime) -> datetime:
+    return value.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+class IncidentStats:
+    """
+    In-memory incident counters of a worker process.
+
+    Counts per status and source, and per creation hour and source, are
+    rebuilt from the database and then kept up to date from the incident change
+    notifications, so reading them never touches the database. Notifications
+    received while rebuilding are applied afterwards unless the rebuild
+    snapshot already includes their transaction.
+    """
+
+    def __init__(self, histogram_hours: int) -> None:
+        """
+        Initialize empty counters.
+
+        Args:
+            histogram_hours (int): Number of hours kept in the hourly histogram.
+        """
+        self.histogram_hours = histogram_hours
+        self.rebuilt_at: Optional[datetime] = None
+
+        self._counts: Counter[Tuple[str, str]] = Counter()
+        self._hourly: Counter[Tuple[datetime, str]] = Counter()
+        self._pending: Optional[List[Dict[str, Any]]] = None
+
+    async def rebuild(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        """
+        Recount the incidents in the database.
+
+        Args:
+            session_factory (async_sessionmaker[AsyncSession]): Factory of primary sessions.
+        """
+        self._pending = []
+        try:
+            since = _hour(datetime.now(timezone.utc)) - timedelta(hours=self.histogram_hours - 1)
+            async with session_factory() as session:
+                await session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+                snapshot = Snapshot.parse(
+                    (await session.execute(select(func.pg_current_snapshot().cast(Text)))).scalar_one()
+                )
+                repo = IncidentRepo(session)
+                counts = await repo.count_by_status_and_source()
+                hourly = await repo.count_created_per_hour(since=since)
+
+            self._counts = Counter({(row.status.value, row.source.value): row.count for row in counts})
+            self._hourly = Counter({(_hour(row.hour), row.source.value): row.count for row in hourly})
+            pending = [
+                notification for notification in self._pending
+                if not snapshot.sees(int(notification["xid"]))
+            ]
+        finally:
+            self._pending = None
+
+        for notification in pending:
+            self._apply(notification)
+        self.rebuilt_at = datetime.now(timezone.utc)
+        logger.debug("Rebuilt incident stats, %d changes applied afterwards", len(pending))
+
+    def apply(self, notification: Dict[str, Any]) -> None:
+        """
+        Update the counters with an incident change notification.
+
+        Args:
+            notification (Dict[str, Any]): Decoded ``incident_events`` notification.
+        """
+        if self._pending is not None:
+            self._pending.append(notification)
+        else:
+            self._apply(notification)
+
+    def _apply(self, notification: Dict[str, Any]) -> None:
+        incident = notification["payload"]
+        source = incident["source"]
+        if notification["event_type"] == IncidentEventType.CREATED.value:
+            self._counts[incident["status"], source] += 1
+            hour = _hour(datetime.fromisoformat(incident["created_at"]))
+            if hour > self._oldest_hour():
+                self._hourly[hour, source] += 1
+        elif notification["event_type"] == IncidentEventType.STATUS_CHANGED.value:
+            self._counts[incident["previous_status"], source] -= 1
+            self._counts[incident["status"], source] += 1
+
+    def _oldest_hour(self) -> datetime:
+        """Start of the hour just before the histogram window."""
+        return _hour(datetime.now(timezone.utc)) - timedelta(hours=self.histogram_hours)
+
+    def counts(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get the number of incidents per status and source.
+
+        Returns:
+            Dict[str, Dict[str, int]]: Counts keyed by status, then by source,
+            including zero counts.
+        """
+        return {
+            status.value: {source.value: self._counts[status.value, source.value] for source in IncidentSource}
+            for status in IncidentStatus
+        }
+
+    def created_per_hour(self, hours: int) -> List[Tuple[datetime, Dict[str, int]]]:
+        """
+        Get the number of incidents created per hour and source.
+
+        Args:
+            hours (int): Number of hours to return, up to ``histogram_hours``,
+                ending with the current hour.
+
+        Returns:
+            List[Tuple[datetime, Dict[str, int]]]: Oldest first, the start of
+            every hour with the counts keyed by source.
+        """
+        current = _hour(datetime.now(timezone.utc))
+        for key in [key for key in self._hourly if key[0] <= self._oldest_hour()]:
+            del self._hourly[key]
+
+        hours = min(hours, self.histogram_hours)
+        return [
+            (hour, {source.value: self._hourly[hour, source.value] for source in IncidentSource})
+            for hour in (current - timedelta(hours=offset) for offset in range(hours - 1, -1, -1))
+        ]
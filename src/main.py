@@ -8,18 +8,23 @@ from starlette.responses import RedirectResponse
 
 from src.api import setup_container, api_router
 from src.api.exception_handlers import (
-    not_api_key_exception_handler,
-    invalid_api_key_exception_handler,
     http_exception_handler, not_found_exception_handler,
+    bad_request_exception_handler,
+    service_unavailable_exception_handler,
 )
 
 from src.core import setup_logging, settings, lifespan
+from src.guards import setup_auth
+from src.metrics import setup_metrics
+from src.profiling import setup_profiling
+from src.ratelimit import setup_rate_limit
 
-from src.core.infra.exceptions import NotApiKey, InvalidApiKey, NotFound
+from src.core.infra.exceptions import NotFound, BadRequest, ServiceUnavailable
+from src.core.infra.request_id import RequestIdMiddleware
 
 logger = logging.getLogger(__name__)
 
-setup_logging(settings.app.debug)
+setup_logging(settings.app.debug, settings.log)
 
 
 app = FastAPI(
@@ -34,18 +39,23 @@ app = FastAPI(
 
 
 setup_container(app)
+setup_rate_limit(app)
+setup_auth(app)
+setup_profiling(app)
+app.add_middleware(RequestIdMiddleware, header=settings.log.request_id_header)
+setup_metrics(app)
 
 # Error handlers
 
-# 401
-app.add_exception_handler(NotApiKey, not_api_key_exception_handler)
-
-# 403
-app.add_exception_handler(InvalidApiKey, invalid_api_key_exception_handler)
+# 400
+app.add_exception_handler(BadRequest, bad_request_exception_handler)
 
 # 404
 app.add_exception_handler(NotFound, not_found_exception_handler)
 
+# 503
+app.add_exception_handler(ServiceUnavailable, service_unavailable_exception_handler)
+
 # 500
 app.add_exception_handler(Exception, http_exception_handler)
 
@@ -68,6 +78,7 @@ app.include_router(api_router)
 
 if __name__ == "__main__":
     try:
-        uvicorn.run(app, host="0.0.0.0", port=8000)
+        # Logging is already set up, uvicorn is not to replace its handlers.
+        uvicorn.run(app, host="0.0.0.0", port=8000, log_config=None)
     except (KeyboardInterrupt, SystemExit):
         pass
\ No newline at end of file
@@ -0,0 +1,110 @@
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsMiddleware",
+    "MetricsRegistry",
+    "QueryStats",
+    "instrument_engine",
+    "registry",
+    "request_queries",
+    "setup_metrics",
+]
+
+from typing import Dict
+
+from fastapi import FastAPI
+from starlette.requests import Request
+from starlette.responses import Response
+
+from src.core.config.settings import settings
+from src.core.infra import ErrorJsonResponse
+from src.database.helper import db_helper
+
+from .middleware import MetricsMiddleware
+from .registry import CONTENT_TYPE, Counter, Gauge, Histogram, LabelValues, MetricsRegistry
+from .sql import QueryStats, instrument_engine, request_queries
+
+
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100)
+"""Upper bounds of the statements-per-request histogram."""
+
+registry = MetricsRegistry()
+"""MetricsRegistry: Metrics of this worker process, served by ``setup_metrics``."""
+
+
+def _pool_connections() -> Dict[LabelValues, float]:
+    stats = db_helper.pool_stats()
+    return {(state,): stats[state] for state in ("checked_out", "checked_in", "overflow")}
+
+
+def _pool_value(name: str):
+    return lambda: {(): db_helper.pool_stats()[name]}
+
+
+def _errors() -> Dict[LabelValues, float]:
+    return {(status.value,): count for status, count in ErrorJsonResponse.sent.items()}
+
+
+def setup_metrics(app: FastAPI) -> None:
+    """
+    Record request, database and error metrics and serve them on ``settings.metrics.path``.
+
+    Must be called after every other middleware is added, so that the metrics
+    middleware wraps them. The primary and replica engines are instrumented
+    with cursor execution events. The endpoint is outside of the API prefix,
+    so no API key is needed to scrape it.
+
+    Args:
+        app (FastAPI): The FastAPI application.
+    """
+    config = settings.metrics
+    if not config.enabled:
+        return
+
+    queries = registry.counter("db_queries_total", "Statements executed.", ["engine"])
+    query_durations = registry.histogram(
+        "db_query_duration_seconds", "Statement execution time.", ["engine"]
+    )
+    query_errors = registry.counter("db_query_errors_total", "Statements that failed.", ["engine"])
+    instrument_engine(db_helper.async_engine, "primary", queries, query_durations, query_errors)
+    for engine in db_helper.replicas.engines:
+        instrument_engine(engine, "replica", queries, query_durations, query_errors)
+
+    registry.gauge(
+        "db_pool_connections", "Connections of the primary pool by state.", ["state"], _pool_connections
+    )
+    registry.gauge("db_pool_size", "Connections kept open by the primary pool.", callback=_pool_value("pool_size"))
+    registry.counter(
+        "db_pool_checkouts_total", "Connections checked out of the primary pool.", callback=_pool_value("checkouts")
+    )
+    registry.counter(
+        "db_pool_timeouts_total", "Checkouts that timed out waiting for a connection.", callback=_pool_value("timeouts")
+    )
+    registry.counter(
+        "db_pool_wait_seconds_total", "Time spent waiting for a connection.", callback=_pool_value("wait_seconds_total")
+    )
+    registry.counter("api_errors_total", "Error responses by error status.", ["status"], _errors)
+
+    app.add_middleware(
+        MetricsMiddleware,
+        routes=app.router.routes,
+        requests=registry.counter(
+            "http_requests_total", "Requests by method, route and response status.", ["method", "route", "status"]
+        ),
+        durations=registry.histogram(
+            "http_request_duration_seconds", "Request processing time.", ["method", "route"]
+        ),
+        in_flight=registry.gauge("http_requests_in_flight", "Requests being processed."),
+        request_queries_count=registry.histogram(
+            "http_request_db_queries", "Statements executed per request.", ["route"], QUERY_COUNT_BUCKETS
+        ),
+        request_queries_seconds=registry.histogram(
+            "http_request_db_seconds", "Statement execution time per request.", ["route"]
+        ),
+    )
+
+    async def metrics_endpoint(_request: Request) -> Response:
+        return Response(registry.render(), media_type=CONTENT_TYPE)
+
+    app.add_route(config.path, metrics_endpoint, include_in_schema=False)
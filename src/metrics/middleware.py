@@ -0,0 +1,96 @@
+import time
+from typing import Sequence
+
+from starlette.routing import BaseRoute, Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .registry import Counter, Gauge, Histogram
+from .sql import QueryStats, request_queries
+
+
+UNMATCHED_ROUTE = "<unmatched>"
+"""Route label of requests that match no route, so that unknown paths do not create series."""
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording the requests of every route.
+
+    Must be the outermost middleware, so that requests rejected by the API key
+    and rate limit middlewares are counted too. Requests are labelled by
+    method, route template (``/api/incidents/{incident_id}``) and response
+    status; the statements run for a request are counted and timed through
+    the ``request_queries`` context. The duration of streamed responses
+    covers the whole stream.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        routes: Sequence[BaseRoute],
+        requests: Counter,
+        durations: Histogram,
+        in_flight: Gauge,
+        request_queries_count: Histogram,
+        request_queries_seconds: Histogram,
+    ) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+            routes (Sequence[BaseRoute]): Routes of the application, matched to
+                label the requests that never reached the router.
+            requests (Counter): Requests by method, route and status.
+            durations (Histogram): Request durations in seconds by method and route.
+            in_flight (Gauge): Requests being processed.
+            request_queries_count (Histogram): Statements per request by route.
+            request_queries_seconds (Histogram): Time spent in statements per request by route.
+        """
+        self.app = app
+        self.routes = routes
+        self.requests = requests
+        self.durations = durations
+        self.in_flight = in_flight
+        self.request_queries_count = request_queries_count
+        self.request_queries_seconds = request_queries_seconds
+
+    def _route(self, scope: Scope) -> str:
+        route = scope.get("route")
+        if route is None:
+            # Rejected before routing: match the routes the way the router would.
+            for candidate in self.routes:
+                if candidate.matches(scope)[0] == Match.FULL:
+                    route = candidate
+                    break
+        return getattr(route, "path", UNMATCHED_ROUTE)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats = QueryStats()
+        token = request_queries.set(stats)
+        self.in_flight.inc()
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started_at
+            self.in_flight.dec()
+            request_queries.reset(token)
+
+            route = self._route(scope)
+            self.requests.inc((scope["method"], route, str(status_code)))
+            self.durations.observe(elapsed, (scope["method"], route))
+            self.request_queries_count.observe(stats.count, (route,))
+            self.request_queries_seconds.observe(stats.seconds, (route,))
@@ -0,0 +1,239 @@
+import math
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+LabelValues = Tuple[str, ...]
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+"""Media type of the Prometheus text exposition format."""
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+"""Upper bounds in seconds of the latency histograms, the Prometheus client defaults."""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, int) or value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class Metric:
+    """
+    Base class of the metrics of a registry.
+
+    Attributes:
+        name (str): Metric name.
+        help (str): Description shown in the ``# HELP`` line.
+        labelnames (Tuple[str, ...]): Names of the labels, in the order of the label values.
+    """
+    type = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+
+    def samples(self) -> Iterable[str]:
+        """Yield the sample lines of the metric."""
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        """Render the metric in the text exposition format."""
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}", *self.samples()]
+
+
+class _Value(Metric):
+    """A value per label set, either kept by the metric or read from a callback at scrape time."""
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        callback: Optional[Callable[[], Dict[LabelValues, float]]] = None,
+    ) -> None:
+        """
+        Initialize the metric.
+
+        Args:
+            name (str): Metric name.
+            help (str): Description shown in the ``# HELP`` line.
+            labelnames (Sequence[str]): Names of the labels.
+            callback (Optional[Callable[[], Dict[LabelValues, float]]]): Function
+                returning the values per label set, called on every scrape, for
+                values already kept elsewhere (pool statistics, error counters).
+        """
+        super().__init__(name, help, labelnames)
+        self.callback = callback
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, labels: LabelValues = (), amount: float = 1) -> None:
+        """
+        Increase the value of a label set.
+
+        Args:
+            labels (LabelValues): Label values, in the order of ``labelnames``.
+            amount (float): The increment.
+        """
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self) -> Iterable[str]:
+        values = self.callback() if self.callback is not None else self._values
+        for labels, value in values.items():
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+
+
+class Counter(_Value):
+    """A monotonically increasing value per label set."""
+    type = "counter"
+
+
+class Gauge(_Value):
+    """A value per label set that goes up and down."""
+    type = "gauge"
+
+    def dec(self, labels: LabelValues = (), amount: float = 1) -> None:
+        """Decrease the value of a label set."""
+        self._values[labels] = self._values.get(labels, 0) - amount
+
+    def set(self, value: float, labels: LabelValues = ()) -> None:
+        """Set the value of a label set."""
+        self._values[labels] = value
+
+
+class Histogram(Metric):
+    """
+    Observations counted in cumulative buckets per label set, with their sum and count.
+
+    Only the bucket an observation falls in is incremented; the counts are
+    accumulated when rendering, so observing costs one bisection.
+    """
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """
+        Initialize the histogram.
+
+        Args:
+            name (str): Metric name.
+            help (str): Description shown in the ``# HELP`` line.
+            labelnames (Sequence[str]): Names of the labels.
+            buckets (Sequence[float]): Increasing upper bounds of the buckets,
+                the +Inf bucket is added.
+        """
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, labels: LabelValues = ()) -> None:
+        """
+        Record an observation.
+
+        Args:
+            value (float): The observed value.
+            labels (LabelValues): Label values, in the order of ``labelnames``.
+        """
+        series = self._series.get(labels)
+        if series is None:
+            # Bucket counts, then the +Inf count, the sum and the total count.
+            series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def samples(self) -> Iterable[str]:
+        names = (*self.labelnames, "le")
+        for labels, series in self._series.items():
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), series):
+                cumulative += count
+                yield f"{self.name}_bucket{_format_labels(names, (*labels, _format_value(bound)))} {cumulative}"
+            label_text = _format_labels(self.labelnames, labels)
+            yield f"{self.name}_sum{label_text} {_format_value(series[-2])}"
+            yield f"{self.name}_count{label_text} {series[-1]}"
+
+
+class MetricsRegistry:
+    """
+    The metrics of a worker process, rendered in the Prometheus text exposition format.
+
+    Metrics are plain in-process values updated without locks: they are only
+    touched from the event loop thread. Every worker exposes its own values,
+    Prometheus sums them up across the scraped targets.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        """
+        Add a metric to the registry.
+
+        Args:
+            metric (Metric): The metric.
+
+        Returns:
+            Metric: The same metric.
+
+        Raises:
+            ValueError: If a metric with the same name is already registered.
+        """
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        callback: Optional[Callable[[], Dict[LabelValues, float]]] = None,
+    ) -> Counter:
+        return self.register(Counter(name, help, labelnames, callback))
+
+    def gauge(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        callback: Optional[Callable[[], Dict[LabelValues, float]]] = None,
+    ) -> Gauge:
+        return self.register(Gauge(name, help, labelnames, callback))
+
+    def histogram(
+        self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, help, labelnames, buckets))
+
+    def render(self) -> bytes:
+        """
+        Render every metric.
+
+        Returns:
+            bytes: The text exposition, ready to be served as ``CONTENT_TYPE``.
+        """
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        lines.append("")
+        return "\n".join(lines).encode()
@@ -0,0 +1,67 @@
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .registry import Counter, Histogram
+
+
+@dataclass
+class QueryStats:
+    """
+    Queries run on behalf of one request.
+
+    Attributes:
+        count (int): Number of statements executed.
+        seconds (float): Total time spent executing them.
+    """
+    count: int = 0
+    seconds: float = 0.0
+
+
+request_queries: ContextVar[Optional[QueryStats]] = ContextVar("request_queries", default=None)
+"""Query stats of the current request, set by MetricsMiddleware."""
+
+
+def instrument_engine(
+    engine: AsyncEngine,
+    role: str,
+    queries: Counter,
+    durations: Histogram,
+    errors: Counter,
+) -> None:
+    """
+    Time every statement of an engine with cursor execution events.
+
+    Each statement is counted and observed per engine role, and added to the
+    ``request_queries`` stats of the request it runs for, if any.
+
+    Args:
+        engine (AsyncEngine): The engine to instrument.
+        role (str): Label value of the engine ("primary" or "replica").
+        queries (Counter): Statements executed, labelled by role.
+        durations (Histogram): Statement durations in seconds, labelled by role.
+        errors (Counter): Statements that failed, labelled by role.
+    """
+    labels = (role,)
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        context._metrics_started_at = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        elapsed = time.perf_counter() - context._metrics_started_at
+        queries.inc(labels)
+        durations.observe(elapsed, labels)
+        stats = request_queries.get()
+        if stats is not None:
+            stats.count += 1
+            stats.seconds += elapsed
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def handle_error(exception_context: Any) -> None:
+        errors.inc(labels)
@@ -0,0 +1,15 @@
+__all__ = [
+    "EventSink",
+    "MemoryQueueSink",
+    "OutboxEvent",
+    "OutboxRelay",
+    "TaskiqSink",
+    "WebhookDeliveryError",
+    "WebhookSink",
+]
+
+from .base import EventSink, OutboxEvent
+from .memory import MemoryQueueSink
+from .relay import OutboxRelay
+from .tasks import TaskiqSink
+from .webhook import WebhookDeliveryError, WebhookSink
@@ -0,0 +1,59 @@
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Dict, Sequence
+
+from sqlalchemy import Row
+
+
+@dataclass(frozen=True)
+class OutboxEvent:
+    """
+    An incident change event relayed from the outbox.
+
+    Attributes:
+        id (int): ID of the outbox row, increasing in commit order per writer.
+            Consumers can use it to drop events delivered twice.
+        incident_id (int): ID of the changed incident.
+        event_type (str): An ``IncidentEventType`` value.
+        payload (Dict[str, Any]): The incident after the change.
+        created_at (datetime): Timestamp of the change.
+    """
+    id: int
+    incident_id: int
+    event_type: str
+    payload: Dict[str, Any]
+    created_at: datetime
+
+    @classmethod
+    def from_row(cls, row: Row) -> "OutboxEvent":
+        """Build an event from a row returned by ``IncidentEventRepo.claim_batch``."""
+        return cls(**row._mapping)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable representation of the event."""
+        return {**asdict(self), "created_at": self.created_at.isoformat()}
+
+
+class EventSink(ABC):
+    """
+    Destination the outbox relay publishes incident change events to.
+
+    Delivery is at-least-once: a batch whose ``publish`` raises stays in the
+    outbox and is published again later, possibly after a partial delivery.
+    """
+
+    @abstractmethod
+    async def publish(self, events: Sequence[OutboxEvent]) -> None:
+        """
+        Publish a batch of events.
+
+        Args:
+            events (Sequence[OutboxEvent]): Events ordered by ID.
+
+        Raises:
+            Exception: Any error; the batch is then kept in the outbox.
+        """
+
+    async def close(self) -> None:
+        """Release the resources held by the sink."""
@@ -0,0 +1,92 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from .base import EventSink, OutboxEvent
+
+
+logger = logging.getLogger(__name__)
+
+EventHandler = Callable[[List[Dict[str, Any]]], Awaitable[None]]
+"""Consumer of batches of ``OutboxEvent.to_dict`` dictionaries ordered by ID."""
+
+
+class MemoryQueueSink(EventSink):
+    """
+    Sink handing events to a consumer task of the same process through a bounded queue.
+
+    The consumer task takes the queued events in batches and passes them to
+    ``handler``, the same way the taskiq sink passes them to the
+    ``incidents.events`` task, but without a broker.
+
+    Events leave the outbox as soon as they are queued, so this sink trades
+    durability for latency:
+        - when the consumer falls ``max_size`` events behind, the oldest queued
+          events are dropped, logged and counted in ``dropped``, so that a slow
+          consumer never blocks the relay;
+        - a batch whose handler raises is logged, counted in ``failed`` and not
+          retried;
+        - events still queued when the sink is closed are lost.
+    """
+
+    def __init__(self, handler: EventHandler, max_size: int, max_batch_size: int = 500) -> None:
+        """
+        Initialize the sink.
+
+        Args:
+            handler (EventHandler): Consumer of the events.
+            max_size (int): Maximum number of events waiting in the queue.
+            max_batch_size (int): Maximum number of events passed to one handler call.
+        """
+        self.handler = handler
+        self.max_batch_size = max_batch_size
+        self.queue: asyncio.Queue[OutboxEvent] = asyncio.Queue(maxsize=max_size)
+        self.handled = 0
+        self.dropped = 0
+        self.failed = 0
+
+        self._task: Optional[asyncio.Task] = None
+
+    async def publish(self, events: Sequence[OutboxEvent]) -> None:
+        dropped = 0
+        for event in events:
+            if self.queue.full():
+                self.queue.get_nowait()
+                dropped += 1
+            self.queue.put_nowait(event)
+
+        if dropped:
+            self.dropped += dropped
+            logger.warning("Incident events queue is full, dropped the %d oldest events", dropped)
+        if self._task is None:
+            self._task = asyncio.create_task(self._consume())
+
+    async def _consume(self) -> None:
+        while True:
+            batch = [await self.queue.get()]
+            while len(batch) < self.max_batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+
+            try:
+                await self.handler([event.to_dict() for event in batch])
+            except Exception as exc:
+                self.failed += len(batch)
+                logger.error(
+                    "Failed to handle incident events #%d..#%d, dropping them: %s",
+                    batch[0].id, batch[-1].id, exc,
+                )
+            else:
+                self.handled += len(batch)
+
+    async def close(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        if not self.queue.empty():
+            logger.warning("Closed the incident events queue with %d events left", self.queue.qsize())
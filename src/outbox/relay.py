@@ -0,0 +1,101 @@
+import asyncio
+import logging
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.database.repositories.incident_event_repo import IncidentEventRepo
+
+from .base import EventSink, OutboxEvent
+
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxRelay:
+    """
+    Background loop moving incident change events from the outbox to a sink.
+
+    Each batch is claimed, published and deleted in one transaction. Claims
+    use ``FOR UPDATE SKIP LOCKED``, so the relays of several worker processes
+    share the outbox without publishing the same batch concurrently. When
+    publishing fails the transaction is rolled back and the batch is retried.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        sink: EventSink,
+        *,
+        batch_size: int,
+        poll_interval: float,
+    ) -> None:
+        """
+        Initialize the relay.
+
+        Args:
+            session_factory (async_sessionmaker[AsyncSession]): Factory of primary sessions.
+            sink (EventSink): Where events are published.
+            batch_size (int): Maximum number of events claimed per transaction.
+            poll_interval (float): Seconds to wait after a batch that did not fill up.
+        """
+        self.session_factory = session_factory
+        self.sink = sink
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.published = 0
+        self.failures = 0
+
+        self._task: Optional[asyncio.Task] = None
+
+    async def relay_once(self) -> int:
+        """
+        Claim, publish and delete one batch of events.
+
+        Returns:
+            int: Number of events published.
+        """
+        async with self.session_factory() as session:
+            rows = await IncidentEventRepo(session).claim_batch(self.batch_size)
+            if not rows:
+                return 0
+
+            await self.sink.publish([OutboxEvent.from_row(row) for row in rows])
+            await session.commit()
+
+        self.published += len(rows)
+        return len(rows)
+
+    async def run(self) -> None:
+        """Relay events until cancelled, draining the outbox as fast as it fills up."""
+        while True:
+            try:
+                relayed = await self.relay_once()
+            except Exception as exc:
+                self.failures += 1
+                logger.error("Failed to relay incident events: %s", exc)
+                relayed = 0
+
+            if relayed < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
+
+    def start(self) -> None:
+        """Run the relay in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """
+        Stop the relay.
+
+        A batch being published is rolled back and relayed again later.
+        """
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
@@ -0,0 +1,16 @@
+from typing import Sequence
+
+from .base import EventSink, OutboxEvent
+
+
+class TaskiqSink(EventSink):
+    """
+    Sink sending each batch as one ``incidents.events`` task to the task broker.
+
+    Consumers subscribe by running task workers; see ``handle_incident_events``.
+    """
+
+    async def publish(self, events: Sequence[OutboxEvent]) -> None:
+        from src.tasks import handle_incident_events
+
+        await handle_incident_events.kiq([event.to_dict() for event in events])
@@ -0,0 +1,112 @@
+import asyncio
+import json
+import logging
+from typing import Any, Sequence
+
+from .base import EventSink, OutboxEvent
+
+
+logger = logging.getLogger(__name__)
+
+RETRIED_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+"""Response statuses after which a delivery is attempted again."""
+
+
+class WebhookDeliveryError(Exception):
+    """Raised when a batch of events could not be delivered to the webhook."""
+
+
+class WebhookSink(EventSink):
+    """
+    Sink POSTing each batch of events to a webhook as one JSON document.
+
+    The body is ``{"events": [...]}`` with the events in ``OutboxEvent.to_dict``
+    form, ordered by ID. Connection errors, timeouts and the statuses in
+    ``RETRIED_STATUSES`` are retried with exponential backoff; any other
+    non-2xx response fails the delivery at once. A failed batch stays in the
+    outbox and is delivered again by the relay, so receivers should ignore
+    the event IDs they have already processed.
+    """
+
+    def __init__(self, client: Any, url: str, *, max_attempts: int = 3, backoff: float = 0.5) -> None:
+        """
+        Initialize the sink.
+
+        Args:
+            client (Any): An ``httpx.AsyncClient`` instance.
+            url (str): URL the events are POSTed to.
+            max_attempts (int): Deliveries attempted per batch before giving up.
+            backoff (float): Seconds to wait before the second attempt, doubled
+                before every further one.
+        """
+        self.client = client
+        self.url = url
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.delivered = 0
+        self.retries = 0
+
+    @classmethod
+    def from_url(cls, url: str, *, timeout: float, max_attempts: int, backoff: float) -> "WebhookSink":
+        """
+        Create a sink with its own HTTP client.
+
+        Requires the optional ``httpx`` package, installed with the ``webhook``
+        extra (``poetry install --extras webhook``).
+
+        Args:
+            url (str): URL the events are POSTed to.
+            timeout (float): Timeout of one delivery attempt in seconds.
+            max_attempts (int): Deliveries attempted per batch before giving up.
+            backoff (float): Seconds to wait before the second attempt.
+
+        Returns:
+            WebhookSink: A sink using a new ``httpx.AsyncClient``.
+
+        Raises:
+            RuntimeError: If the ``httpx`` package is not installed.
+        """
+        try:
+            import httpx
+        except ImportError as exc:
+            raise RuntimeError(
+                "The webhook outbox sink requires the 'httpx' package; "
+                "install the 'webhook' extra: poetry install --extras webhook"
+            ) from exc
+
+        return cls(httpx.AsyncClient(timeout=timeout), url, max_attempts=max_attempts, backoff=backoff)
+
+    async def publish(self, events: Sequence[OutboxEvent]) -> None:
+        body = json.dumps({"events": [event.to_dict() for event in events]}, ensure_ascii=False).encode()
+        headers = {"Content-Type": "application/json"}
+
+        delay = self.backoff
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                response = await self.client.post(self.url, content=body, headers=headers)
+            except Exception as exc:
+                # Transport errors and timeouts of httpx; the request may not have reached the webhook.
+                error = f"{type(exc).__name__}: {exc}"
+            else:
+                if response.is_success:
+                    self.delivered += len(events)
+                    return
+                error = f"HTTP {response.status_code}"
+                if response.status_code not in RETRIED_STATUSES:
+                    break
+
+            if attempt < self.max_attempts:
+                self.retries += 1
+                logger.warning(
+                    "Webhook delivery of %d incident events failed (%s), attempt %d of %d",
+                    len(events), error, attempt, self.max_attempts,
+                )
+                await asyncio.sleep(delay)
+                delay *= 2
+
+        raise WebhookDeliveryError(
+            f"Could not deliver incident events #{events[0].id}..#{events[-1].id} to {self.url}: {error}"
+        )
+
+    async def close(self) -> None:
+        await self.client.aclose()
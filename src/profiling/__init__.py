@@ -0,0 +1,50 @@
+__all__ = [
+    "ProfiledDishkaRoute",
+    "ProfilingMiddleware",
+    "SlowQueryLog",
+    "profile_engine",
+    "setup_profiling",
+]
+
+from fastapi import FastAPI
+
+from src.core.config.settings import settings
+from src.database.helper import db_helper
+
+from .middleware import ProfilingMiddleware
+from .route import ProfiledDishkaRoute
+from .sql import SlowQueryLog, profile_engine
+
+
+def setup_profiling(app: FastAPI) -> None:
+    """
+    Profile requests into a ``Server-Timing`` header and log slow statements.
+
+    Requests are profiled when ``settings.profiling.enabled`` is set or when
+    they send the ``settings.profiling.header`` header. Must be called after
+    ``setup_auth``, so that the profiling middleware wraps the API key check,
+    and before ``setup_metrics``. The primary and replica engines are
+    instrumented with cursor execution events whenever profiling or the slow
+    query log can be active.
+
+    Args:
+        app (FastAPI): The FastAPI application.
+    """
+    config = settings.profiling
+    profiling = config.enabled or bool(config.header)
+    slow_queries = None
+    if config.slow_query_ms > 0:
+        slow_queries = SlowQueryLog(
+            threshold_seconds=config.slow_query_ms / 1000,
+            explain=config.slow_query_explain,
+            explain_cooldown_seconds=config.explain_cooldown_seconds,
+            explain_timeout_seconds=config.explain_timeout_seconds,
+        )
+
+    if profiling or slow_queries is not None:
+        profile_engine(db_helper.async_engine, "primary", slow_queries)
+        for engine in db_helper.replicas.engines:
+            profile_engine(engine, "replica", slow_queries)
+
+    if profiling:
+        app.add_middleware(ProfilingMiddleware, always=config.enabled, header=config.header)
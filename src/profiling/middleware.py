@@ -0,0 +1,63 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.infra.timing import RequestProfile, current_profile
+
+
+_ENABLING_VALUES = frozenset({b"1", b"true", b"yes", b"on"})
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware profiling requests and sending a ``Server-Timing`` header.
+
+    Every request is profiled when ``always`` is set, otherwise only those
+    sending ``header`` with a true value (``X-Profile: 1``). Must wrap the
+    API key middleware, so that the authorization is timed too. The phases
+    are collected through the ``current_profile`` context; the header is
+    added when the response starts, so the body of streamed responses is
+    not covered.
+    """
+
+    def __init__(self, app: ASGIApp, always: bool = False, header: str = "") -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+            always (bool): Whether every request is profiled.
+            header (str): Request header enabling profiling per request,
+                empty to only profile when ``always`` is set.
+        """
+        self.app = app
+        self.always = always
+        self.header = header.lower().encode("latin-1")
+
+    def _profiled(self, scope: Scope) -> bool:
+        if self.always:
+            return True
+        if not self.header:
+            return False
+        for name, value in scope["headers"]:
+            if name == self.header:
+                return value.lower() in _ENABLING_VALUES
+        return False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._profiled(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Prebuilt responses share their header list, so it is copied rather than appended to.
+                headers = [*message.get("headers", ()), (b"server-timing", profile.server_timing().encode("latin-1"))]
+                message = {**message, "headers": headers}
+            await send(message)
+
+        token = current_profile.set(profile)
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_profile.reset(token)
@@ -0,0 +1,159 @@
+import asyncio
+import logging
+import re
+import time
+from typing import Any, Dict, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.infra.timing import current_profile
+
+
+logger = logging.getLogger(__name__)
+
+PARAMETERS_REPR_LIMIT = 1000
+"""Parameters of a slow statement are logged up to this many characters."""
+
+EXPLAINED_STATEMENTS_LIMIT = 1000
+"""The explain cooldowns are forgotten past this many distinct statements."""
+
+_EXPLAINABLE = re.compile(r"\s*SELECT\b", re.IGNORECASE)
+
+_SIDE_EFFECTS = re.compile(
+    r"\bFOR\s+(?:NO\s+KEY\s+UPDATE|UPDATE|KEY\s+SHARE|SHARE)\b"
+    r"|\bINTO\b"
+    r"|\b(?:nextval|setval|pg_notify|set_config|txid_current|pg_current_xact_id"
+    r"|pg_cancel_backend|pg_terminate_backend|pg_\w*lock\w*|lo_\w+|dblink\w*)\s*\(",
+    re.IGNORECASE,
+)
+"""SELECT statements that lock rows, create a table or call a function with side effects."""
+
+
+def _format_parameters(parameters: Any) -> str:
+    text = repr(parameters)
+    if len(text) > PARAMETERS_REPR_LIMIT:
+        return text[:PARAMETERS_REPR_LIMIT] + "..."
+    return text
+
+
+class SlowQueryLog:
+    """
+    Log of the statements slower than a threshold, with their parameters.
+
+    When ``explain`` is set, slow SELECT statements are run again with
+    ``EXPLAIN (ANALYZE, BUFFERS)`` in a background task, on their own
+    connection and in a rolled back transaction, and the plan is logged.
+    Statements that modify data are never explained, since ANALYZE executes
+    them. SELECT statements with side effects a rollback does not undo or
+    that wait for other transactions, such as ``nextval()``, advisory locks
+    or ``FOR UPDATE``, only get their estimated plan from a plain ``EXPLAIN``.
+    A statement is explained at most once per ``explain_cooldown_seconds``.
+    """
+
+    def __init__(
+        self,
+        threshold_seconds: float,
+        explain: bool = False,
+        explain_cooldown_seconds: float = 60.0,
+        explain_timeout_seconds: float = 10.0,
+    ) -> None:
+        """
+        Initialize the log.
+
+        Args:
+            threshold_seconds (float): Statements running at least this long are logged.
+            explain (bool): Whether the plan of slow SELECT statements is logged.
+            explain_cooldown_seconds (float): Minimal time between two plans of the same statement.
+            explain_timeout_seconds (float): Statement timeout of the EXPLAIN.
+        """
+        self.threshold_seconds = threshold_seconds
+        self.explain = explain
+        self.explain_cooldown_seconds = explain_cooldown_seconds
+        self.explain_timeout_seconds = explain_timeout_seconds
+
+        self._explained: Dict[str, float] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    def record(
+        self,
+        engine: AsyncEngine,
+        role: str,
+        statement: str,
+        parameters: Any,
+        seconds: float,
+        executemany: bool,
+    ) -> None:
+        """
+        Log a slow statement and schedule its EXPLAIN if it qualifies.
+
+        Args:
+            engine (AsyncEngine): Engine the statement ran on.
+            role (str): Role of the engine ("primary" or "replica").
+            statement (str): The statement as sent to the driver.
+            parameters (Any): Its driver-level parameters.
+            seconds (float): Its execution time.
+            executemany (bool): Whether it ran once per parameter set.
+        """
+        logger.warning(
+            "Slow query on %s took %.1f ms: %s; parameters: %s",
+            role, seconds * 1000, statement, _format_parameters(parameters),
+        )
+        if not self.explain or executemany or not _EXPLAINABLE.match(statement):
+            return
+
+        now = time.monotonic()
+        if now - self._explained.get(statement, -self.explain_cooldown_seconds) < self.explain_cooldown_seconds:
+            return
+        if len(self._explained) >= EXPLAINED_STATEMENTS_LIMIT:
+            self._explained.clear()
+        self._explained[statement] = now
+
+        task = asyncio.get_running_loop().create_task(self._explain(engine, role, statement, parameters))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _explain(self, engine: AsyncEngine, role: str, statement: str, parameters: Any) -> None:
+        # The task inherits the context of the request; its statements are not the request's.
+        current_profile.set(None)
+        try:
+            async with engine.connect() as connection:
+                await connection.exec_driver_sql(
+                    f"SET LOCAL statement_timeout = {int(self.explain_timeout_seconds * 1000)}"
+                )
+                options = "" if _SIDE_EFFECTS.search(statement) else " (ANALYZE, BUFFERS)"
+                result = await connection.exec_driver_sql(f"EXPLAIN{options} {statement}", parameters)
+                plan = "\n".join(row[0] for row in result)
+        except Exception as exc:
+            logger.warning("Failed to explain a slow query on %s: %s", role, exc)
+            return
+
+        logger.warning("Plan of a slow query on %s: %s\n%s", role, statement, plan)
+
+
+def profile_engine(engine: AsyncEngine, role: str, slow_queries: Optional[SlowQueryLog] = None) -> None:
+    """
+    Time every statement of an engine for request profiles and the slow query log.
+
+    Each statement is added to the ``db`` phase of the current request
+    profile, if any, and recorded in ``slow_queries`` when it reaches its threshold.
+
+    Args:
+        engine (AsyncEngine): The engine to instrument.
+        role (str): Role of the engine ("primary" or "replica").
+        slow_queries (Optional[SlowQueryLog]): The slow query log, None to disable it.
+    """
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        context._profiling_started_at = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        elapsed = time.perf_counter() - context._profiling_started_at
+        profile = current_profile.get()
+        if profile is not None:
+            profile.add("db", elapsed)
+            profile.queries += 1
+        if slow_queries is not None and elapsed >= slow_queries.threshold_seconds:
+            slow_queries.record(engine, role, statement, parameters, elapsed, executemany)
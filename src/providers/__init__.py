@@ -1,3 +1,6 @@
-__all__ = ["DatabaseProvider"]
+__all__ = ["CacheProvider", "DatabaseProvider", "LiveProvider", "OutboxProvider"]
 
+from .cache_provider import CacheProvider
 from .db_provider import DatabaseProvider
+from .live_provider import LiveProvider
+from .outbox_provider import OutboxProvider
@@ -0,0 +1,35 @@
+from typing import AsyncGenerator
+
+from dishka import Provider, Scope, provide
+
+from ..cache import CacheBackend, MemoryCache, NullCache, RedisCache
+from ..core.config.settings import settings
+
+
+class CacheProvider(Provider):
+    """
+    Dishka provider for the application cache backend.
+
+    A single backend instance is shared by the whole application
+    and closed when the container shuts down.
+    """
+    scope = Scope.APP
+
+    @provide
+    async def provide_cache(self) -> AsyncGenerator[CacheBackend, None]:
+        """
+        Provide the cache backend selected by ``settings.cache.backend``.
+
+        Yields:
+            CacheBackend: The configured cache backend.
+        """
+        config = settings.cache
+        if config.backend == "redis":
+            cache: CacheBackend = RedisCache.from_url(config.redis_url)
+        elif config.backend == "memory":
+            cache = MemoryCache(max_entries=config.max_entries)
+        else:
+            cache = NullCache()
+
+        yield cache
+        await cache.close()
@@ -1,28 +1,76 @@
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
 from dishka import Provider, Scope, provide
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from ..core.config.settings import settings
 from ..database.helper import db_helper
+from ..database.partitions import IncidentPartitions
+from ..database.sessions import RequestSessions
+
+
+def _client_key(request: Request) -> Optional[str]:
+    """Name of the API key that authorized the request."""
+    api_key = getattr(request.state, "api_key", None)
+    return api_key.name if api_key is not None else None
 
 
 class DatabaseProvider(Provider):
     """
     Dishka provider for asynchronous database sessions.
 
-    This provider manages the lifecycle of SQLAlchemy async sessions
-    with request scope, ensuring that each request receives its own session.
+    This provider gives each request a RequestSessions object which opens
+    sessions lazily, one per unit of work, instead of holding a session
+    open for the whole request. Background tasks get the primary session
+    factory instead. The partition maintenance of the incidents table is
+    shared by the whole worker.
     """
     scope = Scope.REQUEST
 
-    @provide
-    async def provide_session(self) -> AsyncGenerator[AsyncSession, None]:
+    @provide(scope=Scope.APP)
+    def provide_session_factory(self) -> async_sessionmaker[AsyncSession]:
+        """
+        Provide the factory of primary sessions.
+
+        Returns:
+            async_sessionmaker[AsyncSession]: The global DatabaseHelper session factory.
+        """
+        return db_helper.session_factory
+
+    @provide(scope=Scope.APP)
+    async def provide_partitions(self) -> AsyncGenerator[IncidentPartitions, None]:
         """
-        Provide an asynchronous SQLAlchemy session for a request.
+        Provide the partition maintenance; it is started by the application lifespan.
 
         Yields:
-            AsyncSession: A new asynchronous session instance from the
-            global DatabaseHelper session factory.
+            IncidentPartitions: The partition maintenance of the incidents table.
+        """
+        config = settings.partitions
+        partitions = IncidentPartitions(
+            db_helper.async_engine,
+            months_ahead=config.months_ahead,
+            retention_months=config.retention_months,
+            retention_action=config.retention_action,
+            archive_schema=config.archive_schema,
+        )
+        yield partitions
+        await partitions.stop()
+
+    @provide
+    def provide_sessions(self, request: Request) -> RequestSessions:
+        """
+        Provide the session factory of a request.
+
+        Args:
+            request (Request): The current request; the name of its API key
+                identifies the client for read-your-writes.
+
+        Returns:
+            RequestSessions: Factory of primary and read-only sessions.
         """
-        async with db_helper.session_factory() as session:
-            yield session
+        return RequestSessions(
+            db_helper.session_factory,
+            db_helper.replicas,
+            client_key=_client_key(request),
+        )
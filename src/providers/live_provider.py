@@ -0,0 +1,66 @@
+from typing import AsyncGenerator
+
+from dishka import Provider, Scope, provide
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..core.config.settings import settings
+from ..live import BroadcastHub, IncidentStats, PgNotifyListener
+
+
+class LiveProvider(Provider):
+    """
+    Dishka provider for the live feed of incident changes and the incident stats.
+
+    The hub, the stats and their notification listener are shared by the whole worker;
+    the listener is stopped and every client stream ended when the container shuts down.
+    """
+    scope = Scope.APP
+
+    @provide
+    def provide_hub(self) -> BroadcastHub:
+        """
+        Provide the broadcast hub of the worker.
+
+        Returns:
+            BroadcastHub: The broadcast hub.
+        """
+        return BroadcastHub(queue_size=settings.stream.queue_size)
+
+    @provide
+    def provide_stats(self) -> IncidentStats:
+        """
+        Provide the incident counters of the worker.
+
+        Returns:
+            IncidentStats: The incident counters.
+        """
+        return IncidentStats(histogram_hours=settings.stats.histogram_hours)
+
+    @provide
+    async def provide_listener(
+        self,
+        hub: BroadcastHub,
+        stats: IncidentStats,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> AsyncGenerator[PgNotifyListener, None]:
+        """
+        Provide the notification listener; it is started by the application lifespan.
+
+        Args:
+            hub (BroadcastHub): Hub the events are published to.
+            stats (IncidentStats): Counters kept up to date with the notifications
+                unless the stats are disabled.
+            session_factory (async_sessionmaker[AsyncSession]): Factory of primary sessions.
+
+        Yields:
+            PgNotifyListener: The notification listener.
+        """
+        listener = PgNotifyListener(
+            settings.db.dsn(),
+            hub,
+            stats if settings.stats.enabled else None,
+            session_factory,
+            rebuild_seconds=settings.stats.rebuild_seconds,
+        )
+        yield listener
+        await listener.stop()
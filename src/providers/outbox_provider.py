@@ -0,0 +1,77 @@
+from typing import AsyncGenerator
+
+from dishka import Provider, Scope, provide
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..core.config.settings import settings
+from ..outbox import EventSink, MemoryQueueSink, OutboxRelay, TaskiqSink, WebhookSink
+
+
+class OutboxProvider(Provider):
+    """
+    Dishka provider for the incident change events outbox relay.
+
+    The sink and the relay are shared by the whole application;
+    the relay is stopped and the sink closed when the container shuts down.
+    """
+    scope = Scope.APP
+
+    @provide
+    async def provide_sink(self) -> AsyncGenerator[EventSink, None]:
+        """
+        Provide the event sink selected by ``settings.outbox.sink``.
+
+        Yields:
+            EventSink: The configured event sink.
+
+        Raises:
+            ValueError: If no sink is selected, or the "webhook" sink is
+                selected without a URL.
+        """
+        config = settings.outbox
+        if config.sink == "memory":
+            from ..tasks import handle_incident_events
+
+            # Runs the handler of the taskiq task in this process, without the broker.
+            sink: EventSink = MemoryQueueSink(handle_incident_events, max_size=config.memory_queue_size)
+        elif config.sink == "taskiq":
+            sink = TaskiqSink()
+        elif config.sink == "webhook":
+            if not config.webhook_url:
+                raise ValueError("OUTBOX_WEBHOOK_URL is required by the webhook sink")
+            sink = WebhookSink.from_url(
+                config.webhook_url,
+                timeout=config.webhook_timeout_seconds,
+                max_attempts=config.webhook_max_attempts,
+                backoff=config.webhook_backoff_ms / 1000,
+            )
+        else:
+            raise ValueError("OUTBOX_SINK is required when the outbox relay is enabled")
+
+        yield sink
+        await sink.close()
+
+    @provide
+    async def provide_relay(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        sink: EventSink,
+    ) -> AsyncGenerator[OutboxRelay, None]:
+        """
+        Provide the outbox relay; it is started by the application lifespan.
+
+        Args:
+            session_factory (async_sessionmaker[AsyncSession]): Factory of primary sessions.
+            sink (EventSink): Where events are published.
+
+        Yields:
+            OutboxRelay: The outbox relay.
+        """
+        relay = OutboxRelay(
+            session_factory,
+            sink,
+            batch_size=settings.outbox.batch_size,
+            poll_interval=settings.outbox.poll_interval_ms / 1000,
+        )
+        yield relay
+        await relay.stop()
@@ -0,0 +1,46 @@
+__all__ = [
+    "RateLimit",
+    "RateLimitMiddleware",
+    "RateLimitResult",
+    "RateLimitRule",
+    "RateLimitRules",
+    "RateLimiter",
+    "SlidingWindowLimiter",
+    "TokenBucketLimiter",
+    "setup_rate_limit",
+]
+
+from fastapi import FastAPI
+
+from src.core.config.settings import settings
+
+from .base import RateLimit, RateLimiter, RateLimitResult
+from .memory import TokenBucketLimiter
+from .middleware import RateLimitMiddleware
+from .redis import SlidingWindowLimiter
+from .rules import RateLimitRule, RateLimitRules
+
+
+def setup_rate_limit(app: FastAPI) -> None:
+    """
+    Apply the rate limits configured in ``settings.rate_limit``.
+
+    Must be called before ``setup_auth`` so that the rate limit middleware
+    ends up inside the API key middleware. The limiter is exposed as
+    ``app.state.rate_limiter`` so that the lifespan can close it.
+
+    Args:
+        app (FastAPI): The FastAPI application.
+    """
+    config = settings.rate_limit
+    rules = RateLimitRules(RateLimitRule.parse(entry) for entry in config.rules)
+    if not config.enabled or not rules:
+        return
+
+    if config.backend == "redis":
+        limiter: RateLimiter = SlidingWindowLimiter.from_url(config.redis_url)
+    else:
+        limiter = TokenBucketLimiter()
+
+    app.state.rate_limiter = limiter
+    app.add_middleware(RateLimitMiddleware, limiter=limiter, rules=rules)
@@ -0,0 +1,65 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    A number of requests allowed per period.
+
+    Attributes:
+        requests (int): Requests allowed in one period.
+        period (float): Length of the period in seconds.
+    """
+    requests: int
+    period: float
+
+    @classmethod
+    def parse(cls, value: str) -> "RateLimit":
+        """
+        Parse a ``<requests>/<seconds>`` limit such as ``10/1`` or ``600/60``.
+
+        Raises:
+            ValueError: If the value is malformed.
+        """
+        requests, _, period = value.strip().partition("/")
+        limit = cls(requests=int(requests), period=float(period or 1))
+        if limit.requests < 0 or limit.period <= 0:
+            raise ValueError(f"Invalid rate limit {value!r}")
+        return limit
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    """
+    Outcome of a rate limit check.
+
+    Attributes:
+        allowed (bool): Whether the request may proceed.
+        retry_after (float): Seconds to wait before retrying a rejected request.
+    """
+    allowed: bool
+    retry_after: float = 0.0
+
+
+ALLOWED = RateLimitResult(allowed=True)
+
+
+class RateLimiter(ABC):
+    """Abstract rate limiter counting requests per key."""
+
+    @abstractmethod
+    async def hit(self, key: str, limit: RateLimit) -> RateLimitResult:
+        """
+        Count one request against the limit of a key.
+
+        Args:
+            key (str): Key the requests are counted for.
+            limit (RateLimit): Limit applied to the key.
+
+        Returns:
+            RateLimitResult: Whether the request is allowed.
+        """
+
+    async def close(self) -> None:
+        """Release the resources held by the limiter."""
@@ -0,0 +1,32 @@
+import time
+from typing import Dict, Tuple
+
+from .base import ALLOWED, RateLimit, RateLimiter, RateLimitResult
+
+
+class TokenBucketLimiter(RateLimiter):
+    """
+    In-process token bucket per key.
+
+    Each bucket holds up to ``limit.requests`` tokens and refills at
+    ``limit.requests / limit.period`` tokens per second, so short bursts up
+    to the limit are allowed. Buckets live in the memory of a single worker
+    process, so the limits only hold as configured with one worker.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+
+    async def hit(self, key: str, limit: RateLimit) -> RateLimitResult:
+        now = time.monotonic()
+        rate = limit.requests / limit.period
+        tokens, updated_at = self._buckets.get(key, (float(limit.requests), now))
+        tokens = min(float(limit.requests), tokens + (now - updated_at) * rate)
+
+        if tokens < 1:
+            self._buckets[key] = (tokens, now)
+            retry_after = (1 - tokens) / rate if rate else limit.period
+            return RateLimitResult(allowed=False, retry_after=retry_after)
+
+        self._buckets[key] = (tokens - 1, now)
+        return ALLOWED
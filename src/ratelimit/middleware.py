@@ -0,0 +1,66 @@
+import logging
+import math
+
+from fastapi import status
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.core.infra import ErrorJsonResponse, ErrorStatus
+
+from .base import RateLimiter
+from .rules import RateLimitRules
+
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitMiddleware:
+    """
+    ASGI middleware applying per-API-key rate limits before routing.
+
+    Must run inside ApiKeyMiddleware: requests are counted for the name of the
+    key stored in ``request.state.api_key``, so unauthenticated requests are
+    never counted. Rejected requests get a 429 with a ``Retry-After`` header.
+    When the limiter backend fails the request is let through.
+    """
+
+    def __init__(self, app: ASGIApp, limiter: RateLimiter, rules: RateLimitRules) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+            limiter (RateLimiter): Backend counting the requests.
+            rules (RateLimitRules): Configured limits.
+        """
+        self.app = app
+        self.limiter = limiter
+        self.rules = rules
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        api_key = scope.get("state", {}).get("api_key") if scope["type"] == "http" else None
+        match = self.rules.match(api_key.name, scope["method"], scope["path"]) if api_key else None
+        if match is None:
+            await self.app(scope, receive, send)
+            return
+
+        counter_key, rule = match
+        try:
+            result = await self.limiter.hit(counter_key, rule.limit)
+        except Exception as exc:
+            logger.warning("Rate limiter unavailable, letting the request through: %s", exc)
+            await self.app(scope, receive, send)
+            return
+
+        if result.allowed:
+            await self.app(scope, receive, send)
+            return
+
+        retry_after = max(math.ceil(result.retry_after), 1)
+        response = ErrorJsonResponse(
+            code=status.HTTP_429_TOO_MANY_REQUESTS,
+            message=f"Rate limit of {rule.limit.requests} requests per "
+                    f"{rule.limit.period:g}s exceeded",
+            status=ErrorStatus.RESOURCE_EXHAUSTED,
+            headers={"Retry-After": str(retry_after)},
+        )
+        await response(scope, receive, send)
@@ -0,0 +1,86 @@
+import math
+import time
+from typing import Any
+
+from .base import ALLOWED, RateLimit, RateLimiter, RateLimitResult
+
+
+class SlidingWindowLimiter(RateLimiter):
+    """
+    Sliding window counter shared by all workers through Redis.
+
+    Requests are counted in fixed windows of ``limit.period`` seconds with
+    ``INCR``/``PEXPIRE``; the previous window is weighted by how much of it
+    still overlaps the sliding window. A check costs one pipelined round trip.
+    Works with any client exposing the ``redis.asyncio.Redis`` API, including
+    ``fakeredis``.
+    """
+
+    def __init__(self, client: Any, prefix: str = "ratelimit") -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            client (Any): An asynchronous Redis client instance.
+            prefix (str): Prefix of the counter keys.
+        """
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str) -> "SlidingWindowLimiter":
+        """
+        Create a limiter connected to the given Redis URL.
+
+        Requires the optional ``redis`` package, installed with the ``redis``
+        extra (``poetry install --extras redis``).
+
+        Args:
+            url (str): Redis connection URL, e.g. ``redis://localhost:6379/0``.
+
+        Returns:
+            SlidingWindowLimiter: A limiter using a new ``redis.asyncio`` client.
+
+        Raises:
+            RuntimeError: If the ``redis`` package is not installed.
+        """
+        try:
+            from redis.asyncio import Redis
+        except ImportError as exc:
+            raise RuntimeError(
+                "The redis rate limit backend requires the 'redis' package; "
+                "install the 'redis' extra: poetry install --extras redis"
+            ) from exc
+
+        return cls(Redis.from_url(url))
+
+    async def hit(self, key: str, limit: RateLimit) -> RateLimitResult:
+        now = time.time()
+        window = math.floor(now / limit.period)
+        elapsed = now / limit.period - window
+        current_key = f"{self.prefix}:{key}:{window}"
+        previous_key = f"{self.prefix}:{key}:{window - 1}"
+
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.incr(current_key)
+            pipe.pexpire(current_key, math.ceil(limit.period * 2000))
+            pipe.get(previous_key)
+            current, _, previous = await pipe.execute()
+
+        previous = int(previous or 0)
+        if previous * (1 - elapsed) + current <= limit.requests:
+            return ALLOWED
+
+        # Rejected requests do not count against the window.
+        await self.client.decr(current_key)
+
+        if previous and current <= limit.requests:
+            # Wait until the previous window weighs little enough.
+            wait = 1 - elapsed - (limit.requests - current) / previous
+        else:
+            # Wait until the current window becomes the previous one.
+            wait = 1 - elapsed
+        return RateLimitResult(allowed=False, retry_after=max(wait, 0) * limit.period)
+
+    async def close(self) -> None:
+        await self.client.aclose()
@@ -0,0 +1,111 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .base import RateLimit
+
+
+ANY = "*"
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """
+    A rate limit applied to the requests of one API key on one route.
+
+    Attributes:
+        key (str): Name of the API key, "*" for every key.
+        method (str): HTTP method, "*" for every method.
+        path (str): Request path; a trailing "*" matches every path with that prefix.
+        limit (RateLimit): The limit applied.
+    """
+    key: str
+    method: str
+    path: str
+    limit: RateLimit
+
+    @property
+    def route(self) -> str:
+        """The route part of the rule, as written in settings."""
+        return f"{self.method} {self.path}"
+
+    def matches_route(self, method: str, path: str) -> bool:
+        """Whether the rule applies to a request method and path."""
+        if self.method != ANY and self.method != method:
+            return False
+        if self.path.endswith(ANY):
+            return path.startswith(self.path[:-1])
+        return path == self.path
+
+    @classmethod
+    def parse(cls, entry: str) -> "RateLimitRule":
+        """
+        Parse a ``<key>:<route>:<requests>/<seconds>`` entry of ``RATE_LIMIT_RULES``.
+
+        The route is either "*" or ``<METHOD> <path>``, e.g.
+        ``partner:POST /api/incidents:10/1``.
+
+        Raises:
+            ValueError: If the entry is malformed.
+        """
+        parts = entry.strip().split(":")
+        if len(parts) != 3:
+            raise ValueError(f"Malformed rate limit rule {entry!r}")
+
+        key, route, limit = (part.strip() for part in parts)
+        method, _, path = route.partition(" ")
+        return cls(
+            key=key,
+            method=method.upper(),
+            path=path.strip() or ANY,
+            limit=RateLimit.parse(limit),
+        )
+
+
+class RateLimitRules:
+    """
+    Resolves the rule applying to a request.
+
+    The most specific rule wins: a rule for the key itself beats a rule for
+    every key, and a rule with a route beats a "*" route. Among rules of the
+    same kind the first configured one wins.
+    """
+
+    def __init__(self, rules: Iterable[RateLimitRule]) -> None:
+        """
+        Initialize the rules.
+
+        Args:
+            rules (Iterable[RateLimitRule]): Configured rules.
+        """
+        self.rules = list(rules)
+        self._by_key: Dict[str, List[RateLimitRule]] = {}
+        for rule in self.rules:
+            self._by_key.setdefault(rule.key, []).append(rule)
+
+    def __bool__(self) -> bool:
+        return bool(self.rules)
+
+    def match(self, key: str, method: str, path: str) -> Optional[Tuple[str, RateLimitRule]]:
+        """
+        Find the rule applying to a request.
+
+        Args:
+            key (str): Name of the API key of the request.
+            method (str): HTTP method of the request.
+            path (str): Path of the request.
+
+        Returns:
+            Optional[Tuple[str, RateLimitRule]]: The counter key and the rule,
+            or None if no rule applies.
+        """
+        for rule_key in (key, ANY):
+            rules = self._by_key.get(rule_key, ())
+            fallback = None
+            for rule in rules:
+                if rule.method == ANY and rule.path == ANY:
+                    fallback = fallback or rule
+                elif rule.matches_route(method, path):
+                    return f"{key}|{rule.route}", rule
+            if fallback is not None:
+                return f"{key}|{fallback.route}", fallback
+        return None
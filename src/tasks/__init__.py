@@ -0,0 +1,9 @@
+__all__ = [
+    "broker",
+    "handle_incident_events",
+    "post_create_incidents",
+    "process_created_incidents",
+]
+
+from .broker import broker
+from .incidents import handle_incident_events, post_create_incidents, process_created_incidents
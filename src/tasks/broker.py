@@ -0,0 +1,28 @@
+import taskiq_fastapi
+from taskiq import AsyncBroker, InMemoryBroker
+
+from src.core.config.settings import settings
+
+
+def make_broker() -> AsyncBroker:
+    """
+    Build the task broker selected by ``settings.tasks.backend``.
+
+    Returns:
+        AsyncBroker: An in-memory broker running tasks inside the API process,
+        or an AMQP broker publishing them to RabbitMQ.
+    """
+    config = settings.tasks
+    if config.backend == "amqp":
+        from taskiq_aio_pika import AioPikaBroker
+
+        return AioPikaBroker(url=config.amqp_url, queue_name=config.queue_name)
+    return InMemoryBroker()
+
+
+broker: AsyncBroker = make_broker()
+"""Global task broker."""
+
+# Worker processes start the FastAPI application, so tasks get the same
+# Dishka container and resources as the API.
+taskiq_fastapi.init(broker, "src.main:app")
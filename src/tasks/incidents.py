@@ -0,0 +1,67 @@
+import logging
+from datetime import timedelta
+from typing import Any, Dict, List
+
+from dishka.integrations.taskiq import FromDishka, inject
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.config.settings import settings
+from src.database.repositories.incident_repo import IncidentRepo
+
+from .broker import broker
+
+
+logger = logging.getLogger(__name__)
+
+
+async def process_created_incidents(
+    incident_ids: List[int],
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """
+    Run the post-create processing of newly created incidents.
+
+    Looks for earlier open incidents with the same description and source
+    within ``settings.incidents.dedup_window_minutes`` and reports them.
+
+    Args:
+        incident_ids (List[int]): IDs of the created incidents.
+        session_factory (async_sessionmaker[AsyncSession]): Factory of primary sessions.
+    """
+    window = timedelta(minutes=settings.incidents.dedup_window_minutes)
+    async with session_factory() as session:
+        duplicates = await IncidentRepo(session).find_duplicates(
+            incident_ids=incident_ids, window=window
+        )
+
+    for row in duplicates:
+        logger.warning(
+            "Incident #%d looks like a duplicate of open incident #%d",
+            row.id, row.duplicate_of,
+        )
+    logger.debug("Processed %d created incidents", len(incident_ids))
+
+
+@broker.task(task_name="incidents.post_create")
+@inject(patch_module=True)
+async def post_create_incidents(
+    incident_ids: List[int],
+    session_factory: FromDishka[async_sessionmaker[AsyncSession]],
+) -> None:
+    """Background task running ``process_created_incidents``."""
+    await process_created_incidents(incident_ids, session_factory)
+
+
+@broker.task(task_name="incidents.events")
+async def handle_incident_events(events: List[Dict[str, Any]]) -> None:
+    """
+    Background task receiving batches of incident change events from the outbox relay.
+
+    Events are ``OutboxEvent.to_dict()`` dictionaries ordered by ID and may be
+    delivered more than once.
+    """
+    for event in events:
+        logger.debug(
+            "Incident event #%d: %s of incident #%d",
+            event["id"], event["event_type"], event["incident_id"],
+        )
@@ -0,0 +1,16 @@
+import os
+
+
+# Settings are loaded when ``src`` is imported; the tests never connect to these services.
+for name, value in {
+    "DEBUG": "false",
+    "DB_NAME": "incidents",
+    "DB_USER": "postgres",
+    "DB_PASSWORD": "postgres",
+    "DB_HOST": "localhost",
+    "DB_PORT": "5432",
+}.items():
+    os.environ.setdefault(name, value)
+
+# Imported first, like the application does, since src.core and the database modules import each other.
+import src.core  # noqa: E402,F401
@@ -0,0 +1,105 @@
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import pytest
+
+from src.api.v1.incidents import batcher
+from src.api.v1.incidents.batcher import IncidentWriteBatcher
+from src.database.models.enums import IncidentSource, IncidentStatus
+
+
+class FakeRepo:
+    inserts: List[List[Dict[str, Any]]] = []
+    error: Optional[Exception] = None
+
+    def __init__(self, session: Any) -> None:
+        self.session = session
+
+    async def insert_incidents(self, values: List[Dict[str, Any]]) -> List[SimpleNamespace]:
+        if FakeRepo.error is not None:
+            raise FakeRepo.error
+        FakeRepo.inserts.append(values)
+        first_id = sum(len(insert) for insert in FakeRepo.inserts) - len(values) + 1
+        return [SimpleNamespace(id=first_id + offset, **item) for offset, item in enumerate(values)]
+
+
+@pytest.fixture(autouse=True)
+def fake_repo(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(FakeRepo, "inserts", [])
+    monkeypatch.setattr(FakeRepo, "error", None)
+    monkeypatch.setattr(batcher, "IncidentRepo", FakeRepo)
+
+
+@asynccontextmanager
+async def session_factory() -> AsyncIterator[object]:
+    yield object()
+
+
+def create(write_batcher: IncidentWriteBatcher, description: str) -> Any:
+    return write_batcher.create_incident(
+        description=description, status=IncidentStatus.NEW, source=IncidentSource.OPERATOR
+    )
+
+
+def test_full_batch_is_flushed_at_once() -> None:
+    write_batcher = IncidentWriteBatcher(session_factory, max_batch_size=3, max_delay=60)
+
+    async def run() -> List[Any]:
+        return await asyncio.gather(*(create(write_batcher, f"incident {index}") for index in range(3)))
+
+    rows = asyncio.run(run())
+
+    assert [(row.id, row.description) for row in rows] == [(1, "incident 0"), (2, "incident 1"), (3, "incident 2")]
+    assert len(FakeRepo.inserts) == 1
+    metrics = write_batcher.metrics
+    assert (metrics.flushes, metrics.failed_flushes, metrics.items, metrics.max_flush_size) == (1, 0, 3, 3)
+    assert metrics.flush_size_buckets[2] == 1  # the (2, 5] bucket
+
+
+def test_partial_batch_is_flushed_after_the_delay() -> None:
+    write_batcher = IncidentWriteBatcher(session_factory, max_batch_size=10, max_delay=0.01)
+
+    async def run() -> List[Any]:
+        first = await asyncio.gather(create(write_batcher, "a"), create(write_batcher, "b"))
+        second = await create(write_batcher, "c")
+        return [*first, second]
+
+    rows = asyncio.run(run())
+
+    assert [row.id for row in rows] == [1, 2, 3]
+    assert [len(insert) for insert in FakeRepo.inserts] == [2, 1]
+    assert write_batcher.metrics.flushes == 2
+
+
+def test_failed_flush_fails_every_create_of_the_batch() -> None:
+    FakeRepo.error = RuntimeError("connection lost")
+    write_batcher = IncidentWriteBatcher(session_factory, max_batch_size=2, max_delay=60)
+
+    async def run() -> List[Any]:
+        return await asyncio.gather(create(write_batcher, "a"), create(write_batcher, "b"), return_exceptions=True)
+
+    results = asyncio.run(run())
+
+    assert [str(result) for result in results] == ["connection lost", "connection lost"]
+    assert (write_batcher.metrics.flushes, write_batcher.metrics.failed_flushes) == (1, 1)
+
+
+def test_close_flushes_the_queued_creates() -> None:
+    write_batcher = IncidentWriteBatcher(session_factory, max_batch_size=10, max_delay=60)
+
+    async def run() -> Any:
+        pending = asyncio.create_task(create(write_batcher, "queued"))
+        await asyncio.sleep(0)
+        await write_batcher.close()
+        return await pending
+
+    row = asyncio.run(run())
+
+    assert row.description == "queued"
+    assert FakeRepo.inserts == [[{"description": "queued", "status": IncidentStatus.NEW, "source": IncidentSource.OPERATOR}]]
+
+
+def test_close_without_creates() -> None:
+    asyncio.run(IncidentWriteBatcher(session_factory, max_batch_size=10, max_delay=60).close())
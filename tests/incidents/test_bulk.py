@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+from src.api.v1.incidents.bulk import NDJSON_MEDIA_TYPE, parse_bulk_create
+from src.core.infra.exceptions import BadRequest
+from src.database.models.enums import IncidentSource, IncidentStatus
+
+
+ITEMS = [
+    {"description": "Upstream timed out", "status": "in_progress", "source": "monitoring"},
+    {"description": "Call from a partner", "source": "partner"},
+]
+
+
+def test_json_array() -> None:
+    valid, errors = parse_bulk_create(json.dumps(ITEMS).encode(), "application/json", max_items=10)
+
+    assert errors == []
+    assert [item.model_dump() for item in valid] == [
+        {"description": "Upstream timed out", "status": IncidentStatus.IN_PROGRESS, "source": IncidentSource.MONITORING},
+        {"description": "Call from a partner", "status": IncidentStatus.NEW, "source": IncidentSource.PARTNER},
+    ]
+
+
+def test_ndjson_skips_blank_lines() -> None:
+    body = "\n".join([json.dumps(ITEMS[0]), "", "  ", json.dumps(ITEMS[1]), ""]).encode()
+
+    valid, errors = parse_bulk_create(body, f"{NDJSON_MEDIA_TYPE}; charset=utf-8", max_items=10)
+
+    assert errors == []
+    assert [item.description for item in valid] == ["Upstream timed out", "Call from a partner"]
+
+
+def test_invalid_items_are_reported_by_index() -> None:
+    body = json.dumps([ITEMS[0], {"description": "No source"}, "text", {**ITEMS[1], "status": "open"}]).encode()
+
+    valid, errors = parse_bulk_create(body, "application/json", max_items=10)
+
+    assert [item.description for item in valid] == ["Upstream timed out"]
+    assert [error.index for error in errors] == [1, 2, 3]
+    assert errors[0].message.startswith("source: ")
+    assert errors[1].message.startswith("item: ")
+    assert errors[2].message.startswith("status: ")
+
+
+def test_invalid_ndjson_line_does_not_fail_the_batch() -> None:
+    body = b"\n".join([json.dumps(ITEMS[0]).encode(), b"{not json", json.dumps(ITEMS[1]).encode()])
+
+    valid, errors = parse_bulk_create(body, NDJSON_MEDIA_TYPE, max_items=10)
+
+    assert len(valid) == 2
+    assert [error.index for error in errors] == [1]
+    assert errors[0].message.startswith("Invalid JSON: ")
+
+
+@pytest.mark.parametrize(
+    "body, detail",
+    [
+        (b"{not json", "Request body is not valid JSON"),
+        (json.dumps(ITEMS[0]).encode(), "Request body must be a JSON array"),
+    ],
+)
+def test_malformed_json_body(body: bytes, detail: str) -> None:
+    with pytest.raises(BadRequest) as exc_info:
+        parse_bulk_create(body, "application/json", max_items=10)
+    assert exc_info.value.detail == detail
+
+
+@pytest.mark.parametrize("content_type", ["application/json", NDJSON_MEDIA_TYPE])
+def test_too_many_items(content_type: str) -> None:
+    if content_type == NDJSON_MEDIA_TYPE:
+        body = "\n".join(json.dumps(item) for item in ITEMS).encode()
+    else:
+        body = json.dumps(ITEMS).encode()
+
+    with pytest.raises(BadRequest) as exc_info:
+        parse_bulk_create(body, content_type, max_items=1)
+    assert exc_info.value.detail == "Bulk request is limited to 1 items"
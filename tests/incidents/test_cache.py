@@ -0,0 +1,125 @@
+import asyncio
+from typing import Any, Awaitable, Dict, List, Optional
+
+from src.api.v1.incidents.cache import EncodedEntry, IncidentCache
+from src.cache import MemoryCache, NullCache
+from src.database.models.enums import IncidentStatus
+
+
+def run(awaitable: Awaitable[Any]) -> Any:
+    return asyncio.run(awaitable)
+
+
+def new_cache() -> IncidentCache:
+    return IncidentCache(MemoryCache(max_entries=100), ttl=30)
+
+
+async def list_keys(cache: IncidentCache) -> Dict[Optional[IncidentStatus], str]:
+    return {status: await cache.list_page_key(status, None, 50) for status in [None, *IncidentStatus]}
+
+
+async def item_keys(cache: IncidentCache, incident_ids: List[int]) -> Dict[int, str]:
+    return {incident_id: await cache.item_key(incident_id) for incident_id in incident_ids}
+
+
+def test_entry_round_trip() -> None:
+    cache = new_cache()
+    body = b'{\n  "incident": {"id": 1, "description": "line\\nbreak"}\n}'
+    entry = EncodedEntry(etag=cache.etag(body), body=body)
+
+    async def scenario() -> Optional[EncodedEntry]:
+        await cache.set("key", entry)
+        return await cache.get("key")
+
+    assert run(scenario()) == entry
+
+
+def test_etag_follows_the_body() -> None:
+    assert IncidentCache.etag(b'{"id":1}') == IncidentCache.etag(b'{"id":1}')
+    assert IncidentCache.etag(b'{"id":1}') != IncidentCache.etag(b'{"id":2}')
+    assert IncidentCache.etag(b"").startswith('"')
+
+
+def test_missing_and_malformed_entries_are_misses() -> None:
+    cache = new_cache()
+
+    async def scenario() -> List[Optional[EncodedEntry]]:
+        # An entry stored without its ETag, as older versions did.
+        await cache.backend.set("legacy", b'{"incident":{"id":1}}', 30)
+        return [await cache.get("missing"), await cache.get("legacy")]
+
+    assert run(scenario()) == [None, None]
+
+
+def test_status_change_invalidates_the_affected_list_pages() -> None:
+    cache = new_cache()
+
+    async def scenario() -> List[Dict[Optional[IncidentStatus], str]]:
+        before = await list_keys(cache)
+        await cache.invalidate(statuses=[IncidentStatus.NEW, IncidentStatus.CLOSED])
+        return [before, await list_keys(cache)]
+
+    before, after = run(scenario())
+
+    changed = {status for status in before if before[status] != after[status]}
+    assert changed == {None, IncidentStatus.NEW, IncidentStatus.CLOSED}
+
+
+def test_list_page_key_includes_the_page() -> None:
+    cache = new_cache()
+
+    async def scenario() -> List[str]:
+        return [
+            await cache.list_page_key(None, None, 50),
+            await cache.list_page_key(None, "cursor", 50),
+            await cache.list_page_key(None, None, 10),
+        ]
+
+    assert len(set(run(scenario()))) == 3
+
+
+def test_item_invalidation() -> None:
+    cache = new_cache()
+
+    async def scenario() -> List[Dict[int, str]]:
+        before = await item_keys(cache, [1, 2])
+        await cache.invalidate(incident_ids=[1])
+        return [before, await item_keys(cache, [1, 2])]
+
+    before, after = run(scenario())
+
+    assert before[1] != after[1]
+    assert before[2] == after[2]
+
+
+def test_bulk_item_invalidation_changes_every_item_key() -> None:
+    cache = new_cache()
+    incident_ids = list(range(IncidentCache.BULK_INVALIDATION_THRESHOLD + 1))
+
+    async def scenario() -> List[Dict[int, str]]:
+        before = await item_keys(cache, [0, 10_000])
+        await cache.invalidate(incident_ids=incident_ids)
+        return [before, await item_keys(cache, [0, 10_000])]
+
+    before, after = run(scenario())
+
+    assert all(before[incident_id] != after[incident_id] for incident_id in before)
+
+
+def test_invalidate_all() -> None:
+    cache = new_cache()
+
+    async def scenario() -> List[Any]:
+        before = (await list_keys(cache), await item_keys(cache, [1]))
+        await cache.invalidate_all()
+        return [before, (await list_keys(cache), await item_keys(cache, [1]))]
+
+    (lists_before, items_before), (lists_after, items_after) = run(scenario())
+
+    assert all(lists_before[status] != lists_after[status] for status in lists_before)
+    assert items_before[1] != items_after[1]
+
+
+def test_versioned() -> None:
+    assert new_cache().versioned
+    assert not IncidentCache(NullCache(), ttl=30).versioned
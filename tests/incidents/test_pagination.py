@@ -0,0 +1,57 @@
+import base64
+from datetime import datetime, timezone
+
+import pytest
+
+from src.api.v1.incidents.pagination import (
+    decode_cursor,
+    decode_rank_cursor,
+    encode_cursor,
+    encode_rank_cursor,
+)
+from src.core.infra.exceptions import BadRequest
+
+
+def b64(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def test_cursor_round_trip() -> None:
+    created_at = datetime(2026, 10, 18, 12, 30, 15, 123456, tzinfo=timezone.utc)
+
+    cursor = encode_cursor(created_at, 42)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (created_at, 42)
+
+
+@pytest.mark.parametrize("rank", [0.0, 0.1, 1 / 3, 1e-20])
+def test_rank_cursor_round_trip(rank: float) -> None:
+    assert decode_rank_cursor(encode_rank_cursor(rank, 7)) == (rank, 7)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "!!!",  # not base64
+        "a",  # impossible base64 length
+        b64(b"\xff\xfe|1"),  # not UTF-8
+        b64(b"2026-10-18T12:00:00+00:00"),  # no separator
+        b64(b"yesterday|1"),  # not a datetime
+        b64(b"2026-10-18T12:00:00+00:00|one"),  # not an ID
+    ],
+)
+def test_malformed_cursor(cursor: str) -> None:
+    with pytest.raises(BadRequest, match="Invalid cursor"):
+        decode_cursor(cursor)
+
+
+@pytest.mark.parametrize("cursor", ["!!!", b64(b"0.5"), b64(b"high|1"), b64(b"0.5|")])
+def test_malformed_rank_cursor(cursor: str) -> None:
+    with pytest.raises(BadRequest, match="Invalid cursor"):
+        decode_rank_cursor(cursor)
+
+
+def test_cursor_kinds_are_not_interchangeable() -> None:
+    with pytest.raises(BadRequest):
+        decode_cursor(encode_rank_cursor(0.5, 1))
@@ -0,0 +1,232 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+
+import pytest
+
+from src.database.models.enums import IncidentEventType, IncidentSource, IncidentStatus
+from src.live import stats as stats_module
+from src.live.stats import IncidentStats, Snapshot
+
+
+NOW = datetime(2026, 10, 18, 15, 42, tzinfo=timezone.utc)
+CURRENT_HOUR = datetime(2026, 10, 18, 15, tzinfo=timezone.utc)
+
+
+class FrozenDatetime(datetime):
+    current = NOW
+
+    @classmethod
+    def now(cls, tz: Optional[timezone] = None) -> datetime:
+        return cls.current if tz is None else cls.current.astimezone(tz)
+
+
+@pytest.fixture(autouse=True)
+def frozen_clock(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(stats_module, "datetime", FrozenDatetime)
+    monkeypatch.setattr(FrozenDatetime, "current", NOW)
+
+
+def created(xid: int, status: str = "new", source: str = "operator", created_at: datetime = NOW) -> Dict[str, Any]:
+    return {
+        "xid": str(xid),
+        "event_type": IncidentEventType.CREATED.value,
+        "payload": {"status": status, "source": source, "created_at": created_at.isoformat()},
+    }
+
+
+def status_changed(xid: int, previous: str, status: str, source: str = "operator") -> Dict[str, Any]:
+    return {
+        "xid": str(xid),
+        "event_type": IncidentEventType.STATUS_CHANGED.value,
+        "payload": {"previous_status": previous, "status": status, "source": source, "created_at": NOW.isoformat()},
+    }
+
+
+class FakeSession:
+    def __init__(self, snapshot: str) -> None:
+        self.snapshot = snapshot
+        self.execution_options: Dict[str, Any] = {}
+
+    async def __aenter__(self) -> "FakeSession":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+    async def connection(self, execution_options: Dict[str, Any]) -> None:
+        self.execution_options = execution_options
+
+    async def execute(self, _stmt: Any) -> Any:
+        return SimpleNamespace(scalar_one=lambda: self.snapshot)
+
+
+def install_repo(
+    monkeypatch: pytest.MonkeyPatch,
+    counts: List[Any],
+    hourly: List[Any],
+    during_rebuild: Callable[[], None] = lambda: None,
+) -> None:
+    class FakeRepo:
+        def __init__(self, session: FakeSession) -> None:
+            self.session = session
+
+        async def count_by_status_and_source(self) -> List[Any]:
+            during_rebuild()
+            return counts
+
+        async def count_created_per_hour(self, *, since: datetime) -> List[Any]:
+            return [row for row in hourly if row.hour >= since]
+
+    monkeypatch.setattr(stats_module, "IncidentRepo", FakeRepo)
+
+
+def count_row(status: IncidentStatus, source: IncidentSource, count: int) -> Any:
+    return SimpleNamespace(status=status, source=source, count=count)
+
+
+def hour_row(hour: datetime, source: IncidentSource, count: int) -> Any:
+    return SimpleNamespace(hour=hour, source=source, count=count)
+
+
+# ----- Snapshot -----
+
+def test_snapshot_parse() -> None:
+    assert Snapshot.parse("100:110:102,105") == Snapshot(100, 110, frozenset({102, 105}))
+    assert Snapshot.parse("100:100:") == Snapshot(100, 100, frozenset())
+
+
+@pytest.mark.parametrize(
+    ("xid", "visible"),
+    [
+        (99, True),  # finished before xmin
+        (100, True),  # committed between xmin and xmax
+        (102, False),  # in progress when the snapshot was taken
+        (109, True),
+        (110, False),  # at xmax, not started yet
+        (120, False),
+    ],
+)
+def test_snapshot_sees(xid: int, visible: bool) -> None:
+    assert Snapshot.parse("100:110:102,105").sees(xid) is visible
+
+
+# ----- Notifications -----
+
+def test_apply_created() -> None:
+    stats = IncidentStats(histogram_hours=24)
+
+    stats.apply(created(1, source="partner"))
+    stats.apply(created(2, created_at=NOW - timedelta(hours=30)))
+
+    counts = stats.counts()
+    assert counts["new"] == {"operator": 1, "monitoring": 0, "partner": 1}
+    assert counts["closed"] == {"operator": 0, "monitoring": 0, "partner": 0}
+    # The incident created before the histogram window is only counted per status.
+    assert stats.created_per_hour(1) == [(CURRENT_HOUR, {"operator": 0, "monitoring": 0, "partner": 1})]
+
+
+def test_apply_status_changed() -> None:
+    stats = IncidentStats(histogram_hours=24)
+    stats.apply(created(1))
+
+    stats.apply(status_changed(2, "new", "in_progress"))
+
+    counts = stats.counts()
+    assert counts["new"]["operator"] == 0
+    assert counts["in_progress"]["operator"] == 1
+    assert stats.created_per_hour(1)[0][1]["operator"] == 1
+
+
+# ----- Rebuild -----
+
+def test_rebuild_replaces_counters(monkeypatch: pytest.MonkeyPatch) -> None:
+    stats = IncidentStats(histogram_hours=3)
+    stats.apply(created(1, status="closed", source="monitoring"))
+    install_repo(
+        monkeypatch,
+        counts=[count_row(IncidentStatus.NEW, IncidentSource.OPERATOR, 5)],
+        hourly=[
+            hour_row(CURRENT_HOUR - timedelta(hours=1), IncidentSource.OPERATOR, 2),
+            hour_row(CURRENT_HOUR, IncidentSource.OPERATOR, 3),
+        ],
+    )
+    session = FakeSession("100:100:")
+
+    asyncio.run(stats.rebuild(lambda: session))
+
+    assert session.execution_options == {"isolation_level": "REPEATABLE READ"}
+    assert stats.rebuilt_at == NOW
+    assert stats.counts()["new"]["operator"] == 5
+    assert stats.counts()["closed"]["monitoring"] == 0
+    assert [counts["operator"] for _, counts in stats.created_per_hour(3)] == [0, 2, 3]
+
+
+def test_rebuild_applies_notifications_missing_from_snapshot(monkeypatch: pytest.MonkeyPatch) -> None:
+    stats = IncidentStats(histogram_hours=24)
+
+    def notify() -> None:
+        stats.apply(created(99))  # committed before the snapshot, already counted
+        stats.apply(created(102))  # in progress when the snapshot was taken
+        stats.apply(status_changed(103, "new", "resolved"))  # committed before the snapshot
+        stats.apply(created(112))  # started after the snapshot
+        # Nothing is applied until the rebuild completes.
+        assert stats.counts()["new"]["operator"] == 0
+
+    install_repo(
+        monkeypatch,
+        counts=[
+            count_row(IncidentStatus.NEW, IncidentSource.OPERATOR, 3),
+            count_row(IncidentStatus.RESOLVED, IncidentSource.OPERATOR, 1),
+        ],
+        hourly=[hour_row(CURRENT_HOUR, IncidentSource.OPERATOR, 4)],
+        during_rebuild=notify,
+    )
+
+    asyncio.run(stats.rebuild(lambda: FakeSession("100:110:102")))
+
+    assert stats.counts()["new"]["operator"] == 5
+    assert stats.counts()["resolved"]["operator"] == 1
+    assert stats.created_per_hour(1)[0][1]["operator"] == 6
+
+    # Later notifications are applied right away.
+    stats.apply(created(120))
+    assert stats.counts()["new"]["operator"] == 6
+
+
+def test_failed_rebuild_stops_buffering(monkeypatch: pytest.MonkeyPatch) -> None:
+    stats = IncidentStats(histogram_hours=24)
+
+    def fail() -> None:
+        stats.apply(created(102))
+        raise ConnectionError("connection lost")
+
+    install_repo(monkeypatch, counts=[], hourly=[], during_rebuild=fail)
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(stats.rebuild(lambda: FakeSession("100:110:")))
+
+    assert stats.rebuilt_at is None
+    stats.apply(created(103))
+    assert stats.counts()["new"]["operator"] == 1
+
+
+# ----- Histogram -----
+
+def test_created_per_hour_prunes_hours_past_the_window() -> None:
+    stats = IncidentStats(histogram_hours=3)
+    for hours_ago in range(3):
+        stats.apply(created(hours_ago, created_at=NOW - timedelta(hours=hours_ago)))
+
+    # An hour later, the oldest hour leaves the window.
+    FrozenDatetime.current = NOW + timedelta(hours=1)
+    histogram = stats.created_per_hour(10)
+
+    assert [hour for hour, _ in histogram] == [
+        CURRENT_HOUR - timedelta(hours=1),
+        CURRENT_HOUR,
+        CURRENT_HOUR + timedelta(hours=1),
+    ]
+    assert [counts["operator"] for _, counts in histogram] == [1, 1, 0]
+    assert sorted(hour for hour, _ in stats._hourly) == [CURRENT_HOUR - timedelta(hours=1), CURRENT_HOUR]
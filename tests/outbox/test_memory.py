@@ -0,0 +1,82 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+from src.outbox import MemoryQueueSink, OutboxEvent
+
+
+def events(*ids: int) -> List[OutboxEvent]:
+    created_at = datetime(2026, 10, 18, 12, tzinfo=timezone.utc)
+    return [
+        OutboxEvent(id=event_id, incident_id=event_id, event_type="incident.created", payload={}, created_at=created_at)
+        for event_id in ids
+    ]
+
+
+class Recorder:
+    def __init__(self, fail_first: bool = False) -> None:
+        self.batches: List[List[int]] = []
+        self.fail_first = fail_first
+
+    async def __call__(self, batch: List[Dict[str, Any]]) -> None:
+        if self.fail_first:
+            self.fail_first = False
+            raise RuntimeError("handler failed")
+        self.batches.append([event["id"] for event in batch])
+
+
+async def drain(sink: MemoryQueueSink) -> None:
+    while not sink.queue.empty():
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+
+def test_consumer_receives_batches_in_order() -> None:
+    handler = Recorder()
+
+    async def run() -> None:
+        sink = MemoryQueueSink(handler, max_size=10, max_batch_size=2)
+        await sink.publish(events(1, 2, 3))
+        await drain(sink)
+        await sink.publish(events(4))
+        await drain(sink)
+        await sink.close()
+        assert sink.handled == 4
+
+    asyncio.run(run())
+    assert handler.batches == [[1, 2], [3], [4]]
+
+
+def test_oldest_events_are_dropped_when_the_queue_is_full() -> None:
+    handler = Recorder()
+
+    async def run() -> None:
+        sink = MemoryQueueSink(handler, max_size=2)
+        # The consumer only runs once publish yields, so the queue fills up first.
+        await sink.publish(events(1, 2, 3, 4))
+        assert sink.dropped == 2
+        await drain(sink)
+        await sink.close()
+
+    asyncio.run(run())
+    assert handler.batches == [[3, 4]]
+
+
+def test_failed_batches_are_dropped_and_consumption_goes_on() -> None:
+    handler = Recorder(fail_first=True)
+
+    async def run() -> None:
+        sink = MemoryQueueSink(handler, max_size=10)
+        await sink.publish(events(1, 2))
+        await drain(sink)
+        await sink.publish(events(3))
+        await drain(sink)
+        await sink.close()
+        assert (sink.failed, sink.handled) == (2, 1)
+
+    asyncio.run(run())
+    assert handler.batches == [[3]]
+
+
+def test_close_without_events() -> None:
+    asyncio.run(MemoryQueueSink(Recorder(), max_size=1).close())
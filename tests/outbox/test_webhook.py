@@ -0,0 +1,97 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any, List, Union
+
+import pytest
+
+from src.outbox import OutboxEvent, WebhookDeliveryError, WebhookSink
+from src.outbox import webhook
+
+
+URL = "https://hooks.example.com/incidents"
+
+
+class StubClient:
+    def __init__(self, *outcomes: Union[int, Exception]) -> None:
+        self.outcomes = list(outcomes)
+        self.requests: List[Any] = []
+
+    async def post(self, url: str, *, content: bytes, headers: Any) -> Any:
+        self.requests.append((url, json.loads(content), headers))
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return SimpleNamespace(status_code=outcome, is_success=200 <= outcome < 300)
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> List[float]:
+    delays: List[float] = []
+
+    async def sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(webhook.asyncio, "sleep", sleep)
+    return delays
+
+
+def events(*ids: int) -> List[OutboxEvent]:
+    created_at = datetime(2026, 10, 18, 12, tzinfo=timezone.utc)
+    return [
+        OutboxEvent(id=event_id, incident_id=event_id, event_type="incident.created", payload={"id": event_id}, created_at=created_at)
+        for event_id in ids
+    ]
+
+
+def publish(sink: WebhookSink, batch: List[OutboxEvent]) -> None:
+    asyncio.run(sink.publish(batch))
+
+
+def test_posts_the_batch(sleeps: List[float]) -> None:
+    client = StubClient(204)
+    sink = WebhookSink(client, URL)
+
+    publish(sink, events(1, 2))
+
+    [(url, body, headers)] = client.requests
+    assert url == URL
+    assert headers == {"Content-Type": "application/json"}
+    assert [event["id"] for event in body["events"]] == [1, 2]
+    assert body["events"][0]["created_at"] == "2026-10-18T12:00:00+00:00"
+    assert sink.delivered == 2
+    assert sleeps == []
+
+
+def test_retries_transient_failures_with_backoff(sleeps: List[float]) -> None:
+    client = StubClient(ConnectionError("connection refused"), 503, 200)
+    sink = WebhookSink(client, URL, max_attempts=3, backoff=0.5)
+
+    publish(sink, events(1))
+
+    assert len(client.requests) == 3
+    assert sleeps == [0.5, 1.0]
+    assert sink.retries == 2
+    assert sink.delivered == 1
+
+
+def test_gives_up_after_the_last_attempt(sleeps: List[float]) -> None:
+    sink = WebhookSink(StubClient(500, 502, 429), URL, max_attempts=3, backoff=0.5)
+
+    with pytest.raises(WebhookDeliveryError, match=r"#3..#4 .* HTTP 429"):
+        publish(sink, events(3, 4))
+
+    assert sleeps == [0.5, 1.0]
+    assert sink.delivered == 0
+
+
+def test_client_errors_are_not_retried(sleeps: List[float]) -> None:
+    client = StubClient(400, 200)
+    sink = WebhookSink(client, URL, max_attempts=3)
+
+    with pytest.raises(WebhookDeliveryError, match="HTTP 400"):
+        publish(sink, events(1))
+
+    assert len(client.requests) == 1
+    assert sleeps == []
@@ -0,0 +1,164 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from src.ratelimit import RateLimit, RateLimitResult, SlidingWindowLimiter, TokenBucketLimiter
+from src.ratelimit import memory, redis
+
+
+class Clock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def hits(limiter: Any, key: str, limit: RateLimit, count: int) -> List[RateLimitResult]:
+    async def run() -> List[RateLimitResult]:
+        return [await limiter.hit(key, limit) for _ in range(count)]
+
+    return asyncio.run(run())
+
+
+# ----- Token bucket -----
+
+@pytest.fixture
+def monotonic(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock(1000.0)
+    monkeypatch.setattr(memory.time, "monotonic", clock)
+    return clock
+
+
+def test_token_bucket_allows_a_burst_up_to_the_limit(monotonic: Clock) -> None:
+    limiter = TokenBucketLimiter()
+    limit = RateLimit(requests=2, period=1)
+
+    results = hits(limiter, "partner", limit, 3)
+
+    assert [result.allowed for result in results] == [True, True, False]
+    # Two tokens per second: the next one is in half a second.
+    assert results[2].retry_after == pytest.approx(0.5)
+
+
+def test_token_bucket_retry_after_counts_the_partial_refill(monotonic: Clock) -> None:
+    limiter = TokenBucketLimiter()
+    limit = RateLimit(requests=10, period=60)
+    hits(limiter, "partner", limit, 10)
+
+    monotonic.now += 2
+    [rejected] = hits(limiter, "partner", limit, 1)
+    assert not rejected.allowed
+    # A third of a token came back in two seconds; the rest takes four more.
+    assert rejected.retry_after == pytest.approx(4)
+
+    monotonic.now += 4
+    assert hits(limiter, "partner", limit, 1)[0].allowed
+
+
+def test_token_bucket_keys_are_independent(monotonic: Clock) -> None:
+    limiter = TokenBucketLimiter()
+    limit = RateLimit(requests=1, period=1)
+
+    assert hits(limiter, "partner", limit, 1)[0].allowed
+    assert hits(limiter, "operator", limit, 1)[0].allowed
+    assert not hits(limiter, "partner", limit, 1)[0].allowed
+
+
+def test_token_bucket_without_requests_waits_a_period(monotonic: Clock) -> None:
+    [rejected] = hits(TokenBucketLimiter(), "partner", RateLimit(requests=0, period=30), 1)
+
+    assert rejected == RateLimitResult(allowed=False, retry_after=30)
+
+
+# ----- Sliding window -----
+
+class FakePipeline:
+    def __init__(self, client: "FakeRedis") -> None:
+        self.client = client
+        self.commands: List[Any] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+    def incr(self, key: str) -> None:
+        self.commands.append(lambda: self.client.incr(key))
+
+    def pexpire(self, key: str, milliseconds: int) -> None:
+        self.commands.append(lambda: self.client.pexpire(key, milliseconds))
+
+    def get(self, key: str) -> None:
+        self.commands.append(lambda: self.client.get(key))
+
+    async def execute(self) -> List[Any]:
+        return [command() for command in self.commands]
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.counters: Dict[str, int] = {}
+        self.expires: Dict[str, int] = {}
+
+    def incr(self, key: str) -> int:
+        self.counters[key] = self.counters.get(key, 0) + 1
+        return self.counters[key]
+
+    def pexpire(self, key: str, milliseconds: int) -> bool:
+        self.expires[key] = milliseconds
+        return True
+
+    def get(self, key: str) -> Optional[bytes]:
+        return str(self.counters[key]).encode() if key in self.counters else None
+
+    def pipeline(self, transaction: bool) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def decr(self, key: str) -> int:
+        self.counters[key] -= 1
+        return self.counters[key]
+
+
+@pytest.fixture
+def wall_clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock(0.0)
+    monkeypatch.setattr(redis.time, "time", clock)
+    return clock
+
+
+def test_sliding_window_waits_for_the_next_window_past_the_limit(wall_clock: Clock) -> None:
+    client = FakeRedis()
+    limiter = SlidingWindowLimiter(client)
+    limit = RateLimit(requests=2, period=10)
+    wall_clock.now = 103
+
+    results = hits(limiter, "partner", limit, 3)
+
+    assert [result.allowed for result in results] == [True, True, False]
+    # 30% of the window has elapsed; the current window becomes the previous one in 7 seconds.
+    assert results[2].retry_after == pytest.approx(7)
+    # The rejected request is not counted, and counters outlive the next window.
+    assert client.counters == {"ratelimit:partner:10": 2}
+    assert client.expires == {"ratelimit:partner:10": 20000}
+
+
+def test_sliding_window_waits_for_the_previous_window_to_weigh_less(wall_clock: Clock) -> None:
+    client = FakeRedis()
+    client.counters["ratelimit:partner:9"] = 10
+    limiter = SlidingWindowLimiter(client)
+    limit = RateLimit(requests=10, period=10)
+    wall_clock.now = 105
+
+    # Half of the previous window still overlaps: 5 weighted requests plus 5 new ones.
+    results = hits(limiter, "partner", limit, 6)
+
+    assert [result.allowed for result in results] == [True] * 5 + [False]
+    # One more request fits once the previous window weighs 4, i.e. 60% into the window.
+    assert results[5].retry_after == pytest.approx(1)
+    assert client.counters["ratelimit:partner:10"] == 5
+
+    wall_clock.now = 106.1
+    assert hits(limiter, "partner", limit, 1)[0].allowed
@@ -0,0 +1,91 @@
+import asyncio
+import json
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from src.guards.keys import ApiKeyInfo
+from src.ratelimit import RateLimit, RateLimiter, RateLimitMiddleware, RateLimitResult, RateLimitRule, RateLimitRules
+
+
+class StubLimiter(RateLimiter):
+    def __init__(self, result: Optional[RateLimitResult] = None, error: Optional[Exception] = None) -> None:
+        self.result = result
+        self.error = error
+        self.calls: List[Any] = []
+
+    async def hit(self, key: str, limit: RateLimit) -> RateLimitResult:
+        self.calls.append((key, limit))
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class Downstream:
+    def __init__(self) -> None:
+        self.called = False
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        self.called = True
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"{}"})
+
+
+def request(limiter: RateLimiter, api_key: Optional[str] = "partner", path: str = "/api/incidents/") -> Dict[str, Any]:
+    app = Downstream()
+    middleware = RateLimitMiddleware(app, limiter=limiter, rules=RateLimitRules([RateLimitRule.parse("*:GET /api/*:10/60")]))
+    state = {"api_key": ApiKeyInfo(api_key, "", frozenset({"*"}))} if api_key else {}
+    scope = {"type": "http", "method": "GET", "path": path, "headers": [], "state": state}
+    messages: List[Dict[str, Any]] = []
+
+    async def receive() -> Dict[str, Any]:
+        return {"type": "http.request", "body": b""}
+
+    async def send(message: Dict[str, Any]) -> None:
+        messages.append(message)
+
+    asyncio.run(middleware(scope, receive, send))
+    start, body = messages
+    return {
+        "called": app.called,
+        "status": start["status"],
+        "headers": {name.decode(): value.decode() for name, value in start["headers"]},
+        "body": json.loads(body["body"]),
+    }
+
+
+@pytest.mark.parametrize(("retry_after", "header"), [(0.2, "1"), (1.0, "1"), (2.5, "3"), (0.0, "1")])
+def test_rejected_request_gets_429(retry_after: float, header: str) -> None:
+    limiter = StubLimiter(RateLimitResult(allowed=False, retry_after=retry_after))
+
+    response = request(limiter)
+
+    assert not response["called"]
+    assert response["status"] == 429
+    assert response["headers"]["retry-after"] == header
+    assert response["body"] == {
+        "error": {"code": 429, "message": "Rate limit of 10 requests per 60s exceeded", "status": "RESOURCE_EXHAUSTED"},
+    }
+    assert limiter.calls == [("partner|GET /api/*", RateLimit(10, 60.0))]
+
+
+def test_allowed_request_reaches_the_app() -> None:
+    response = request(StubLimiter(RateLimitResult(allowed=True)))
+
+    assert response["called"]
+    assert response["status"] == 200
+
+
+def test_requests_without_a_key_or_a_rule_are_not_counted() -> None:
+    limiter = StubLimiter(RateLimitResult(allowed=False, retry_after=1))
+
+    assert request(limiter, api_key=None)["status"] == 200
+    assert request(limiter, path="/metrics")["status"] == 200
+    assert limiter.calls == []
+
+
+def test_limiter_failure_lets_the_request_through() -> None:
+    response = request(StubLimiter(error=ConnectionError("redis is down")))
+
+    assert response["called"]
+    assert response["status"] == 200
@@ -0,0 +1,104 @@
+from typing import List, Optional
+
+import pytest
+
+from src.ratelimit import RateLimit, RateLimitRule, RateLimitRules
+
+
+# ----- Parsing -----
+
+def test_parse_route_rule() -> None:
+    rule = RateLimitRule.parse(" partner : post /api/incidents : 10/2 ")
+
+    assert rule == RateLimitRule(key="partner", method="POST", path="/api/incidents", limit=RateLimit(10, 2.0))
+    assert rule.route == "POST /api/incidents"
+
+
+def test_parse_any_route() -> None:
+    rule = RateLimitRule.parse("*:*:600/60")
+
+    assert (rule.key, rule.method, rule.path) == ("*", "*", "*")
+    assert rule.limit == RateLimit(600, 60.0)
+
+
+def test_parse_limit_defaults_to_one_second() -> None:
+    assert RateLimitRule.parse("partner:GET /api/incidents/*:5").limit == RateLimit(5, 1.0)
+
+
+@pytest.mark.parametrize(
+    "entry",
+    [
+        "partner:10/1",  # no route
+        "partner:GET /api/incidents:10/1:extra",
+        "partner:GET /api/incidents:ten/1",
+        "partner:GET /api/incidents:10/0",
+        "partner:GET /api/incidents:-1/1",
+    ],
+)
+def test_parse_rejects_malformed_entries(entry: str) -> None:
+    with pytest.raises(ValueError):
+        RateLimitRule.parse(entry)
+
+
+# ----- Matching -----
+
+def rules(*entries: str) -> RateLimitRules:
+    return RateLimitRules(RateLimitRule.parse(entry) for entry in entries)
+
+
+def matched(rate_limit_rules: RateLimitRules, key: str, method: str, path: str) -> Optional[List[str]]:
+    match = rate_limit_rules.match(key, method, path)
+    if match is None:
+        return None
+    counter_key, rule = match
+    return [counter_key, f"{rule.key}:{rule.route}:{rule.limit.requests}"]
+
+
+def test_route_of_the_key_wins() -> None:
+    configured = rules(
+        "*:GET /api/incidents/:1/1",
+        "partner:*:2/1",
+        "partner:GET /api/incidents/:3/1",
+    )
+
+    assert matched(configured, "partner", "GET", "/api/incidents/") == [
+        "partner|GET /api/incidents/", "partner:GET /api/incidents/:3",
+    ]
+
+
+def test_any_route_of_the_key_beats_rules_for_every_key() -> None:
+    configured = rules("*:GET /api/incidents/:1/1", "partner:*:2/1")
+
+    assert matched(configured, "partner", "GET", "/api/incidents/") == ["partner|* *", "partner:* *:2"]
+    assert matched(configured, "operator", "GET", "/api/incidents/") == [
+        "operator|GET /api/incidents/", "*:GET /api/incidents/:1",
+    ]
+
+
+def test_route_beats_any_route_for_every_key() -> None:
+    configured = rules("*:*:1/1", "*:POST /api/incidents/*:2/1")
+
+    assert matched(configured, "partner", "POST", "/api/incidents/42") == [
+        "partner|POST /api/incidents/*", "*:POST /api/incidents/*:2",
+    ]
+    assert matched(configured, "partner", "GET", "/api/incidents/42") == ["partner|* *", "*:* *:1"]
+
+
+def test_first_configured_rule_wins() -> None:
+    configured = rules("partner:* /api/*:1/1", "partner:GET /api/incidents/:2/1")
+
+    assert matched(configured, "partner", "GET", "/api/incidents/")[1] == "partner:* /api/*:1"
+
+
+def test_counters_are_per_key_for_rules_of_every_key() -> None:
+    configured = rules("*:*:1/1")
+
+    assert matched(configured, "partner", "GET", "/")[0] != matched(configured, "operator", "GET", "/")[0]
+
+
+def test_no_match() -> None:
+    configured = rules("partner:GET /api/incidents/:1/1", "*:POST /api/incidents/:1/1")
+
+    assert matched(configured, "partner", "GET", "/api/incidents/42") is None
+    assert matched(configured, "operator", "GET", "/api/incidents/") is None
+    assert not rules()